@@ -18,7 +18,8 @@ class CoreConfig(AppConfig):
         from .models import Group, Tag
 
         auditlog.register(Tag)
-        auditlog.register(Group)
+        # full_path is derived from name and parent, which are already logged
+        auditlog.register(Group, exclude_fields=["full_path"])
 
         # Validate encryption configuration (skip during migrations/shell)
         if not any(cmd in sys.argv for cmd in ["migrate", "makemigrations", "shell"]):
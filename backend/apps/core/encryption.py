@@ -5,16 +5,24 @@ Uses Fernet symmetric encryption (AES-128-CBC with HMAC) for field-level
 encryption of sensitive personal data at rest.
 """
 
-import json
+import base64
+import pickle
 
 from django.conf import settings  # noqa: F401 - used in validate_encryption_config
+from django.db import models
+
+import orjson
+from cryptography.fernet import Fernet, MultiFernet
 from encrypted_fields.fields import (
     EncryptedCharField,
     EncryptedEmailField,
     EncryptedFieldMixin,
     EncryptedTextField,
 )
-from django.db import models
+
+# Keep what json.dumps(value, default=str) used to store: non-string dict
+# keys are allowed, and datetimes go through str() rather than isoformat()
+_JSON_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
 
 
 class EncryptedJSONField(EncryptedFieldMixin, models.TextField):
@@ -36,15 +44,16 @@ class EncryptedJSONField(EncryptedFieldMixin, models.TextField):
             return None
         # Parse JSON
         try:
-            return json.loads(decrypted)
-        except (json.JSONDecodeError, TypeError):
+            return orjson.loads(decrypted)
+        except (orjson.JSONDecodeError, TypeError):
             return None
 
     def get_prep_value(self, value):
         if value is None:
             return None
-        # Convert to JSON string - encryption is handled by get_db_prep_save
-        return json.dumps(value, default=str)
+        # Convert to JSON string - encryption is handled by get_db_prep_save,
+        # which expects str rather than the bytes orjson produces
+        return orjson.dumps(value, default=str, option=_JSON_DUMPS_OPTIONS).decode()
 
     def to_python(self, value):
         """Handle form data and other Python-side conversions."""
@@ -55,8 +64,8 @@ class EncryptedJSONField(EncryptedFieldMixin, models.TextField):
         if isinstance(value, str):
             # Parse JSON string (from form input, fixtures, or after decryption)
             try:
-                return json.loads(value)
-            except (json.JSONDecodeError, TypeError):
+                return orjson.loads(value)
+            except (orjson.JSONDecodeError, TypeError):
                 return None
         return None
 
@@ -89,3 +98,39 @@ def validate_encryption_config():
             return False, f"Invalid hex key: {e}"
 
     return True, "Encryption configured correctly"
+
+
+def _value_fernet():
+    """Return a MultiFernet over FIELD_ENCRYPTION_KEYS, or None when none are set."""
+    keys = getattr(settings, "FIELD_ENCRYPTION_KEYS", None)
+    if not keys:
+        return None
+    return MultiFernet(
+        [Fernet(base64.urlsafe_b64encode(bytes.fromhex(key))) for key in keys]
+    )
+
+
+def encrypt_value(value):
+    """
+    Encrypt an arbitrary Python value with the field encryption keys.
+
+    Used to keep payloads built from decrypted fields encrypted while they sit
+    in the cache. Returns None when no keys are configured.
+    """
+    fernet = _value_fernet()
+    if fernet is None:
+        return None
+    return fernet.encrypt(pickle.dumps(value))
+
+
+def decrypt_value(token):
+    """
+    Reverse encrypt_value().
+
+    Raises cryptography.fernet.InvalidToken when the token was not produced
+    with one of the configured keys.
+    """
+    fernet = _value_fernet()
+    if fernet is None:
+        return None
+    return pickle.loads(fernet.decrypt(token))
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def populate_full_path(apps, schema_editor):
+    """Fill in full_path for existing groups, top-level groups first."""
+    Group = apps.get_model("core", "Group")
+
+    parent_paths = {}
+    groups = list(Group.objects.filter(parent__isnull=True))
+    while groups:
+        for group in groups:
+            parent_path = parent_paths.get(group.parent_id)
+            group.full_path = f"{parent_path} > {group.name}" if parent_path else group.name
+        Group.objects.bulk_update(groups, ["full_path"])
+        parent_paths = {group.pk: group.full_path for group in groups}
+        groups = list(Group.objects.filter(parent_id__in=parent_paths))
+
+
+class Migration(migrations.Migration):
+    """
+    Store each group's hierarchical path instead of rebuilding it on read.
+    """
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='group',
+            name='full_path',
+            field=models.TextField(default='', editable=False),
+        ),
+        migrations.RunPython(populate_full_path, migrations.RunPython.noop),
+    ]
@@ -4,7 +4,7 @@ Core models - base classes and shared models.
 
 import uuid
 
-from django.db import models
+from django.db import models, transaction
 
 
 class BaseModel(models.Model):
@@ -45,6 +45,10 @@ class Group(BaseModel):
         related_name="children",
     )
     color = models.CharField(max_length=7, default="#8b5cf6")  # Hex color
+    # Denormalized "Grandparent > Parent > Name", maintained by save() so
+    # reading it never walks the parent chain. Unbounded, since the hierarchy
+    # has no depth limit.
+    full_path = models.TextField(editable=False, default="")
 
     class Meta:
         ordering = ["name"]
@@ -60,9 +64,42 @@ class Group(BaseModel):
             return f"{self.parent} > {self.name}"
         return self.name
 
-    @property
-    def full_path(self) -> str:
-        """Return the full hierarchical path."""
+    def save(self, *args, **kwargs):
+        full_path = self.build_full_path()
+        # A new group has no children yet, so only renames and moves cascade
+        path_changed = not self._state.adding and full_path != self.full_path
+        self.full_path = full_path
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "full_path"}
+
+        # The cascade raises on a cycle, which must also undo this save
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if path_changed:
+                self._update_descendant_paths()
+
+    def build_full_path(self) -> str:
+        """Return the full hierarchical path from the parent's stored path."""
         if self.parent:
             return f"{self.parent.full_path} > {self.name}"
         return self.name
+
+    def _update_descendant_paths(self):
+        """Rewrite the stored path of every descendant, one level at a time."""
+        parent_paths = {self.pk: self.full_path}
+        visited = {self.pk}
+        while parent_paths:
+            children = list(
+                Group.objects.filter(parent_id__in=parent_paths).only("id", "name", "parent_id")
+            )
+            # A group reached twice means the tree has a cycle, which would
+            # otherwise keep this loop growing paths forever
+            if any(child.pk in visited for child in children):
+                raise ValueError(f"Group {self.pk} is nested under one of its descendants.")
+            visited.update(child.pk for child in children)
+            for child in children:
+                child.full_path = f"{parent_paths[child.parent_id]} > {child.name}"
+            Group.objects.bulk_update(children, ["full_path"])
+            parent_paths = {child.pk: child.full_path for child in children}
@@ -0,0 +1,20 @@
+"""
+Pagination classes for LifeGraph API list endpoints.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor-based pagination for large, stably ordered lists.
+
+    Unlike page-number pagination it issues no COUNT(*) and never skips rows
+    with OFFSET, so every page costs the same regardless of its depth. The
+    ordering is taken from the view (its `ordering` attribute or the
+    `?ordering=` parameter), but only its first field positions the cursor:
+    that field must be non-nullable, since rows with NULL in it are skipped,
+    and should be close to unique, since ties are stepped over with an offset.
+    """
+
+    ordering = ("-created_at", "id")
@@ -18,8 +18,9 @@ def get_client_ip(request):
     """
     x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
     if x_forwarded_for:
-        # Take the first IP in the chain (original client)
-        ip = x_forwarded_for.split(",")[0].strip()
+        # Take the first IP in the chain (original client) without
+        # splitting the rest of the header
+        ip = x_forwarded_for.partition(",")[0].strip()
     else:
         ip = request.META.get("REMOTE_ADDR")
     return ip
@@ -0,0 +1,34 @@
+"""
+JSON renderer for LifeGraph API responses.
+
+Uses orjson, which encodes dicts, lists, strings and UUIDs in C and is
+considerably faster than the stdlib encoder behind DRF's JSONRenderer on
+large payloads such as the relationship graph and audit history.
+"""
+
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+import orjson
+
+# Types orjson does not know natively (lazy translation strings, Decimal,
+# querysets, ...) are converted the same way DRF's encoder would
+_fallback_encoder = JSONEncoder()
+
+# Datetimes are passed through to DRF's encoder too, which truncates them to
+# milliseconds and writes UTC as "Z"; non-string dict keys are accepted like
+# the stdlib encoder does
+_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Drop-in replacement for rest_framework.renderers.JSONRenderer."""
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=_fallback_encoder.default, option=_OPTIONS)
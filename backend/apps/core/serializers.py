@@ -37,5 +37,18 @@ class GroupSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "full_path", "children_count", "created_at", "updated_at"]
 
+    def validate_parent(self, value):
+        """Reject a parent that would make the group its own ancestor."""
+        if value is None or self.instance is None:
+            return value
+        ancestor = value
+        while ancestor is not None:
+            if ancestor.pk == self.instance.pk:
+                raise serializers.ValidationError(
+                    "A group cannot be its own parent or be nested under its descendants."
+                )
+            ancestor = ancestor.parent
+        return value
+
     def get_children_count(self, obj) -> int:
         return obj.children.count()
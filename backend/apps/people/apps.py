@@ -25,10 +25,13 @@ class PeopleConfig(AppConfig):
         )
 
         # Register models with auditlog, excluding encrypted fields that
-        # cause serialization issues with the diff mechanism
+        # cause serialization issues with the diff mechanism, and the
+        # trigger-maintained search vectors
         auditlog.register(
             Person,
-            exclude_fields=["met_context", "emails", "phones", "addresses", "notes"],
+            exclude_fields=[
+                "met_context", "emails", "phones", "addresses", "notes", "search_vector",
+            ],
         )
         auditlog.register(
             Relationship,
@@ -37,12 +40,12 @@ class PeopleConfig(AppConfig):
         auditlog.register(RelationshipType)
         auditlog.register(
             Anecdote,
-            exclude_fields=["content"],
+            exclude_fields=["content", "search_vector"],
         )
         auditlog.register(Photo)
         auditlog.register(
             Employment,
-            exclude_fields=["description"],
+            exclude_fields=["description", "search_vector"],
         )
         auditlog.register(CustomFieldDefinition)
         auditlog.register(
@@ -0,0 +1,199 @@
+"""
+Cache keys and invalidation helpers for the People app.
+
+Read-heavy payloads are cached in the default cache backend with a short TTL
+and explicitly invalidated from model signals (see signals.py) when the
+underlying data changes.
+"""
+
+import hashlib
+import json
+import uuid
+
+from django.core.cache import cache
+
+from cryptography.fernet import InvalidToken
+
+from apps.core.encryption import decrypt_value, encrypt_value
+
+# Filter values (tags, groups, relationship types, companies) sent to the LLM
+# by the smart search endpoint
+SEARCH_OPTIONS_CACHE_KEY = "ai:search_opts"
+SEARCH_OPTIONS_CACHE_TIMEOUT = 60  # seconds
+
+# LLM answers for chat and smart search, keyed by a hash of the prompt inputs.
+# Answers quote contact details, so they are stored encrypted.
+AI_ANSWER_CACHE_PREFIX = "ai:answer"
+AI_ANSWER_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+
+# Ids of the AI jobs queued through the API, so the job status endpoint only
+# reports on those. Kept for as long as Celery keeps results (CELERY_RESULT_EXPIRES).
+AI_JOB_CACHE_PREFIX = "ai:job"
+AI_JOB_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+# Rendered contacts summary sent to the LLM by the chat endpoint, stored
+# encrypted since it holds decrypted notes and anecdotes. The version stamp is
+# replaced whenever a contact changes, which orphans old entries.
+CONTACTS_CONTEXT_VERSION_KEY = "ai:ctx_ver"
+CONTACTS_CONTEXT_CACHE_TIMEOUT = 5 * 60  # 5 minutes
+
+
+# The CRM owner, cached as a slim instance (id and name only) so no decrypted
+# personal data is written to the cache
+OWNER_CACHE_KEY = "crm:owner"
+OWNER_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+# Dashboard payload, keyed per owner and day and stored encrypted since it
+# quotes anecdotes. Like the contacts context, a version stamp is swapped out
+# by signals whenever the underlying data changes.
+DASHBOARD_VERSION_KEY = "dashboard:ver"
+DASHBOARD_CACHE_TIMEOUT = 5 * 60  # 5 minutes
+
+# Names of all tags, offered to the LLM when suggesting tags for a person
+TAG_NAMES_CACHE_KEY = "tags:names"
+TAG_NAMES_CACHE_TIMEOUT = 60  # seconds
+
+# Relationship type legend of the graph view; only changes with the types
+GRAPH_LEGEND_CACHE_KEY = "graph:legend"
+GRAPH_LEGEND_CACHE_TIMEOUT = 60 * 60  # 1 hour
+
+
+def get_encrypted(key):
+    """Return the value cached under `key` by set_encrypted(), or None on a miss."""
+    token = cache.get(key)
+    if token is None:
+        return None
+    try:
+        return decrypt_value(token)
+    except InvalidToken:
+        # Written with a key that has since been rotated out
+        return None
+
+
+def set_encrypted(key, value, timeout):
+    """
+    Cache `value` encrypted with the field encryption keys.
+
+    For payloads built from encrypted fields, so the cache never holds their
+    plaintext. Nothing is cached when no encryption keys are configured.
+    """
+    token = encrypt_value(value)
+    if token is not None:
+        cache.set(key, token, timeout=timeout)
+
+
+def get_or_set_encrypted(key, default, timeout):
+    """Like cache.get_or_set(), but the value is encrypted while in the cache."""
+    value = get_encrypted(key)
+    if value is None:
+        value = default()
+        set_encrypted(key, value, timeout)
+    return value
+
+
+def remember_ai_job(job_id):
+    """Record that an AI job was queued through the API."""
+    cache.set(f"{AI_JOB_CACHE_PREFIX}:{job_id}", True, timeout=AI_JOB_CACHE_TIMEOUT)
+
+
+def is_ai_job(job_id) -> bool:
+    """Return True when `job_id` was queued through the API and has not expired."""
+    return cache.get(f"{AI_JOB_CACHE_PREFIX}:{job_id}") is not None
+
+
+def invalidate_search_options():
+    """Drop the cached smart search filter options."""
+    cache.delete(SEARCH_OPTIONS_CACHE_KEY)
+
+
+def contacts_context_cache_key(owner_id) -> str:
+    """Return the cache key for the owner's rendered contacts context."""
+    version = cache.get_or_set(
+        CONTACTS_CONTEXT_VERSION_KEY, lambda: uuid.uuid4().hex, timeout=None
+    )
+    return f"ai:ctx:{owner_id}:{version}"
+
+
+def invalidate_contacts_context():
+    """Retire every cached contacts context by dropping the version stamp."""
+    cache.delete(CONTACTS_CONTEXT_VERSION_KEY)
+
+
+def dashboard_cache_key(owner_id, day) -> str:
+    """Return the cache key for the dashboard payload of an owner on a given day."""
+    version = cache.get_or_set(
+        DASHBOARD_VERSION_KEY, lambda: uuid.uuid4().hex, timeout=None
+    )
+    return f"dashboard:v1:{owner_id}:{day.isoformat()}:{version}"
+
+
+def invalidate_dashboard():
+    """Retire every cached dashboard payload by dropping the version stamp."""
+    cache.delete(DASHBOARD_VERSION_KEY)
+
+
+def get_owner():
+    """
+    Return the CRM owner (is_owner=True), or None when it is not set up yet.
+
+    Only the id and name columns are loaded; any other field is fetched from
+    the database on first access. The cache entry is dropped by signals
+    whenever a Person is saved or deleted.
+    """
+    from .models import Person
+
+    owner = cache.get(OWNER_CACHE_KEY)
+    if owner is None:
+        # Cache a missing owner as False so it is not looked up on every call
+        owner = (
+            Person.objects.filter(is_owner=True)
+            .only("id", "first_name", "last_name", "nickname", "is_owner")
+            .first()
+        ) or False
+        cache.set(OWNER_CACHE_KEY, owner, timeout=OWNER_CACHE_TIMEOUT)
+    return owner or None
+
+
+def invalidate_owner():
+    """Drop the cached owner."""
+    cache.delete(OWNER_CACHE_KEY)
+
+
+def get_tag_names() -> list[str]:
+    """Return the names of all tags, served from the cache when possible."""
+    from apps.core.models import Tag
+
+    return cache.get_or_set(
+        TAG_NAMES_CACHE_KEY,
+        lambda: list(Tag.objects.values_list("name", flat=True)),
+        timeout=TAG_NAMES_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_tag_names():
+    """Drop the cached tag names."""
+    cache.delete(TAG_NAMES_CACHE_KEY)
+
+
+def normalize_query(text: str) -> str:
+    """Fold case and whitespace so trivially different queries share a cache entry."""
+    return " ".join(text.lower().split())
+
+
+def ai_answer_cache_key(kind: str, *parts) -> str:
+    """
+    Build the cache key for an AI answer.
+
+    Every input that reaches the prompt (question, context, history, ...) must
+    be passed in ``parts`` so a change to any of them produces a new key and a
+    stale answer is never served.
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode()).hexdigest()
+    return f"{AI_ANSWER_CACHE_PREFIX}:{kind}:{digest}"
+
+
+def invalidate_graph_legend():
+    """Drop the cached relationship type legend of the graph view."""
+    cache.delete(GRAPH_LEGEND_CACHE_KEY)
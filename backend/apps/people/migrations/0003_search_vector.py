@@ -0,0 +1,99 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Weighted tsvector per table. Encrypted columns (notes, met_context, content,
+# description) are stored as Fernet ciphertext and are deliberately left out:
+# indexing them would either be useless or leak plaintext lexemes.
+SEARCH_DOCUMENTS = {
+    "people_person": (
+        "setweight(to_tsvector(coalesce(NEW.first_name, '')), 'A') || "
+        "setweight(to_tsvector(coalesce(NEW.last_name, '')), 'A') || "
+        "setweight(to_tsvector(coalesce(NEW.nickname, '')), 'A')"
+    ),
+    "people_anecdote": (
+        "setweight(to_tsvector(coalesce(NEW.title, '')), 'A') || "
+        "setweight(to_tsvector(coalesce(NEW.location, '')), 'C')"
+    ),
+    "people_employment": (
+        "setweight(to_tsvector(coalesce(NEW.company, '')), 'A') || "
+        "setweight(to_tsvector(coalesce(NEW.title, '')), 'A') || "
+        "setweight(to_tsvector(coalesce(NEW.department, '')), 'B')"
+    ),
+}
+
+
+def trigger_sql(table, document):
+    return f"""
+        CREATE FUNCTION {table}_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := {document};
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql;
+
+        CREATE TRIGGER {table}_search_vector_trigger
+        BEFORE INSERT OR UPDATE ON {table}
+        FOR EACH ROW EXECUTE FUNCTION {table}_search_vector_update();
+
+        UPDATE {table} SET search_vector = NULL;
+    """
+
+
+def reverse_trigger_sql(table):
+    return f"""
+        DROP TRIGGER IF EXISTS {table}_search_vector_trigger ON {table};
+        DROP FUNCTION IF EXISTS {table}_search_vector_update();
+    """
+
+
+class Migration(migrations.Migration):
+    """
+    Store a full-text search vector on Person, Anecdote and Employment.
+
+    The vector is kept in sync by a BEFORE INSERT/UPDATE trigger, so global
+    search can use a GIN index instead of building tsvectors per request.
+    Existing rows are backfilled by touching them once.
+    """
+
+    dependencies = [
+        ('people', '0002_fix_encrypted_field_types'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='person',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='anecdote',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='employment',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='person',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='person_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='anecdote',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='anecdote_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='employment',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='employment_search_vector_gin'),
+        ),
+        *[
+            migrations.RunSQL(
+                sql=trigger_sql(table, document),
+                reverse_sql=reverse_trigger_sql(table),
+            )
+            for table, document in SEARCH_DOCUMENTS.items()
+        ],
+    ]
@@ -0,0 +1,19 @@
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Index birthdays by (month, day) for the upcoming birthdays window.
+    """
+
+    dependencies = [
+        ('people', '0004_person_name_trigram'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(django.db.models.functions.datetime.ExtractMonth('birthday'), django.db.models.functions.datetime.ExtractDay('birthday'), name='person_birthday_month_day_idx'),
+        ),
+    ]
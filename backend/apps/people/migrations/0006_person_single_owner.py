@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Allow at most one owner person, enforced by a unique partial index.
+    """
+
+    dependencies = [
+        ('people', '0005_person_birthday_month_day_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='person',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_owner', True)), fields=('is_owner',), name='person_single_owner'),
+        ),
+    ]
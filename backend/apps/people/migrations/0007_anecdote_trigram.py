@@ -0,0 +1,24 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Add trigram indexes on anecdote title and location for substring search.
+    """
+
+    dependencies = [
+        ('people', '0006_person_single_owner'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='anecdote',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'), name='anecdote_title_trgm'),
+        ),
+        migrations.AddIndex(
+            model_name='anecdote',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('location'), name='gin_trgm_ops'), name='anecdote_location_trgm'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Index the reverse direction of relationships and per-object audit history.
+
+    auditlog's LogEntry is a third-party model, so its composite index is
+    created with raw SQL. It lets the person history endpoint read the latest
+    50 entries of one object straight from the index, without sorting.
+    """
+
+    dependencies = [
+        ('people', '0007_anecdote_trigram'),
+        ('auditlog', '__first__'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='relationship',
+            index=models.Index(fields=['person_b', 'person_a'], name='relationship_b_a_idx'),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS auditlog_logentry_object_history_idx "
+                "ON auditlog_logentry (content_type_id, object_pk, timestamp DESC);"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS auditlog_logentry_object_history_idx;",
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Index persons in list order for keyset pagination.
+    """
+
+    dependencies = [
+        ('people', '0008_history_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='person',
+            index=models.Index(fields=['last_name', 'first_name', 'id'], name='person_name_order_idx'),
+        ),
+    ]
@@ -4,7 +4,10 @@ People app models - Person, Relationship, RelationshipType, Anecdote.
 Sensitive personal data is encrypted at rest using Fernet (AES-128-CBC).
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import ExtractDay, ExtractMonth, Upper
 
 from apps.core.encryption import EncryptedJSONField, EncryptedTextField
 from apps.core.models import BaseModel, Group, Tag
@@ -78,9 +81,47 @@ class Person(BaseModel):
     groups = models.ManyToManyField(Group, related_name="persons", blank=True)
     tags = models.ManyToManyField(Tag, related_name="persons", blank=True)
 
+    # Full-text search, maintained by a database trigger (see migration 0003)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["last_name", "first_name"]
         verbose_name_plural = "People"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="person_search_vector_gin"),
+            # Trigram indexes on UPPER(name) so icontains lookups, which
+            # Django compiles to UPPER(col) LIKE UPPER(...), use the index
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"),
+                name="person_first_name_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("last_name"), name="gin_trgm_ops"),
+                name="person_last_name_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("nickname"), name="gin_trgm_ops"),
+                name="person_nickname_trgm",
+            ),
+            # Serves the month/day window filter of upcoming birthdays
+            models.Index(
+                ExtractMonth("birthday"),
+                ExtractDay("birthday"),
+                name="person_birthday_month_day_idx",
+            ),
+            # Matches the default list ordering used for keyset pagination
+            models.Index(
+                fields=["last_name", "first_name", "id"],
+                name="person_name_order_idx",
+            ),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["is_owner"],
+                condition=models.Q(is_owner=True),
+                name="person_single_owner",
+            ),
+        ]
 
     def __str__(self):
         full_name = self.full_name
@@ -197,6 +238,11 @@ class Relationship(BaseModel):
 
     class Meta:
         ordering = ["-created_at"]
+        # (person_a, person_b) lookups are served by the unique constraint;
+        # this covers the reverse direction, e.g. "relationships to the owner"
+        indexes = [
+            models.Index(fields=["person_b", "person_a"], name="relationship_b_a_idx"),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["person_a", "person_b", "relationship_type"],
@@ -239,8 +285,23 @@ class Anecdote(BaseModel):
     )
     tags = models.ManyToManyField(Tag, related_name="anecdotes", blank=True)
 
+    # Full-text search, maintained by a database trigger (see migration 0003)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["-date", "-created_at"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="anecdote_search_vector_gin"),
+            # Trigram indexes for the icontains filters of smart search
+            GinIndex(
+                OpClass(Upper("title"), name="gin_trgm_ops"),
+                name="anecdote_title_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("location"), name="gin_trgm_ops"),
+                name="anecdote_location_trgm",
+            ),
+        ]
 
     def __str__(self):
         if self.title:
@@ -387,9 +448,15 @@ class Employment(BaseModel):
     linkedin_synced = models.BooleanField(default=False)
     linkedin_last_sync = models.DateTimeField(null=True, blank=True)
 
+    # Full-text search, maintained by a database trigger (see migration 0003)
+    search_vector = SearchVectorField(null=True, editable=False)
+
     class Meta:
         ordering = ["-is_current", "-start_date"]
         verbose_name_plural = "Employment history"
+        indexes = [
+            GinIndex(fields=["search_vector"], name="employment_search_vector_gin"),
+        ]
 
     def __str__(self):
         current = " (current)" if self.is_current else ""
@@ -7,6 +7,7 @@ from rest_framework import serializers
 from apps.core.serializers import GroupSerializer, TagSerializer
 from apps.core.validators import validate_avatar, validate_photo
 
+from .cache import get_owner
 from .models import (
     Anecdote,
     CustomFieldDefinition,
@@ -63,13 +64,12 @@ class PersonListSerializer(serializers.ModelSerializer):
         # Try to get owner from context cache first
         owner = self.context.get("owner")
         if owner is None:
-            try:
-                owner = Person.objects.get(is_owner=True)
-                # Cache it in context for subsequent calls
-                if hasattr(self, "_context"):
-                    self._context["owner"] = owner
-            except Person.DoesNotExist:
+            owner = get_owner()
+            if owner is None:
                 return None
+            # Cache it in context for subsequent calls
+            if hasattr(self, "_context"):
+                self._context["owner"] = owner
 
         # Find relationship between this person and the owner
         # Check both directions
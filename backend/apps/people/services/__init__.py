@@ -3,15 +3,18 @@ People app services.
 """
 
 from .ai_parser import (
+    build_contacts_context,
     chat_with_context,
     generate_person_summary,
     generate_photo_description,
     parse_contacts_text,
     parse_updates_text,
     smart_search,
+    stream_chat_with_context,
     suggest_relationships,
     suggest_tags_for_person,
 )
+from .birthdays import filter_upcoming_birthdays
 from .export import (
     export_all_json,
     export_anecdotes,
@@ -26,6 +29,7 @@ from .export import (
     export_relationships,
     export_relationships_csv,
     export_tags,
+    stream_entity_csv,
 )
 from .linkedin import (
     extract_username_from_url,
@@ -35,14 +39,18 @@ from .linkedin import (
 
 __all__ = [
     # AI Services
+    "build_contacts_context",
     "chat_with_context",
     "generate_person_summary",
     "generate_photo_description",
     "parse_contacts_text",
     "parse_updates_text",
     "smart_search",
+    "stream_chat_with_context",
     "suggest_relationships",
     "suggest_tags_for_person",
+    # Birthday Services
+    "filter_upcoming_birthdays",
     # Export Services
     "export_all_json",
     "export_anecdotes",
@@ -57,6 +65,7 @@ __all__ = [
     "export_relationships",
     "export_relationships_csv",
     "export_tags",
+    "stream_entity_csv",
     # LinkedIn Services
     "extract_username_from_url",
     "fetch_linkedin_profile",
@@ -4,6 +4,8 @@ AI-powered contact parsing service using OpenAI.
 
 import json
 import logging
+from collections import defaultdict
+from collections.abc import Iterator
 from typing import Any
 
 from django.conf import settings
@@ -815,26 +817,96 @@ Guidelines:
 The user's contacts database is provided below."""
 
 
-def chat_with_context(
-    question: str,
-    contacts_context: str,
-    today_date: str,
-    conversation_history: list[dict] | None = None
-) -> str:
+def build_contacts_context(owner) -> str:
     """
-    Answer questions about contacts using AI with database context.
+    Build the plain-text contacts summary sent to the AI.
 
-    Args:
-        question: User's question
-        contacts_context: Formatted string with relevant contact information
-        today_date: Today's date in YYYY-MM-DD format
-        conversation_history: Optional list of previous messages
-
-    Returns:
-        AI response to the question
+    Only the columns rendered into the context are fetched, using one
+    query each for persons, owner relationships, current jobs and anecdotes.
     """
-    client = get_openai_client()
+    from ..models import Anecdote, Employment, Person, Relationship
+
+    context_parts = []
+
+    # Add owner info
+    if owner:
+        context_parts.append(f"Owner (You): {owner.full_name}")
+
+    persons = list(
+        Person.objects.filter(is_active=True, is_owner=False).values(
+            "id", "first_name", "last_name", "nickname", "birthday", "notes"
+        )[:100]
+    )
+    person_ids = [p["id"] for p in persons]
+
+    # Relationship to owner (what each person is to me)
+    relationship_names = {}
+    if owner:
+        for rel in Relationship.objects.filter(
+            person_a_id__in=person_ids, person_b=owner
+        ).values("person_a_id", "relationship_type__name"):
+            relationship_names.setdefault(rel["person_a_id"], rel["relationship_type__name"])
+
+    # Current employment
+    current_jobs = {}
+    for emp in Employment.objects.filter(
+        person_id__in=person_ids, is_current=True
+    ).values("person_id", "title", "company"):
+        current_jobs.setdefault(emp["person_id"], emp)
+
+    # Recent anecdotes (limit to 3 per person)
+    anecdotes_by_person = defaultdict(list)
+    for anecdote in Anecdote.objects.filter(persons__id__in=person_ids).values(
+        "persons__id", "anecdote_type", "title", "content"
+    ):
+        person_anecdotes = anecdotes_by_person[anecdote["persons__id"]]
+        if len(person_anecdotes) < 3:
+            person_anecdotes.append(anecdote)
+
+    # Add all contacts with their relationships and key info
+    for person in persons:
+        full_name = (
+            f"{person['first_name']} {person['last_name']}"
+            if person["last_name"]
+            else person["first_name"]
+        )
+        person_info = [f"\n### {full_name}"]
+
+        if person["id"] in relationship_names:
+            person_info.append(f"Relationship: {relationship_names[person['id']]}")
 
+        if person["birthday"]:
+            person_info.append(f"Birthday: {person['birthday'].isoformat()}")
+
+        if person["nickname"]:
+            person_info.append(f"Nickname: {person['nickname']}")
+
+        if person["notes"]:
+            person_info.append(f"Notes: {person['notes'][:200]}")
+
+        current_job = current_jobs.get(person["id"])
+        if current_job:
+            person_info.append(f"Current job: {current_job['title']} at {current_job['company']}")
+
+        anecdotes = anecdotes_by_person.get(person["id"])
+        if anecdotes:
+            anecdote_texts = []
+            for a in anecdotes:
+                anecdote_texts.append(f"- [{a['anecdote_type']}] {a['title'] or ''}: {a['content'][:100]}")
+            person_info.append("Anecdotes:\n" + "\n".join(anecdote_texts))
+
+        context_parts.append("\n".join(person_info))
+
+    return "\n".join(context_parts)
+
+
+def _build_chat_messages(
+    question: str,
+    contacts_context: str,
+    today_date: str,
+    conversation_history: list[dict] | None = None
+) -> list[dict]:
+    """Build the OpenAI message list for a contacts chat question."""
     system_message = f"""{CHAT_SYSTEM_PROMPT}
 
 Today's date: {today_date}
@@ -853,6 +925,29 @@ Today's date: {today_date}
             })
 
     messages.append({"role": "user", "content": question})
+    return messages
+
+
+def chat_with_context(
+    question: str,
+    contacts_context: str,
+    today_date: str,
+    conversation_history: list[dict] | None = None
+) -> str:
+    """
+    Answer questions about contacts using AI with database context.
+
+    Args:
+        question: User's question
+        contacts_context: Formatted string with relevant contact information
+        today_date: Today's date in YYYY-MM-DD format
+        conversation_history: Optional list of previous messages
+
+    Returns:
+        AI response to the question
+    """
+    client = get_openai_client()
+    messages = _build_chat_messages(question, contacts_context, today_date, conversation_history)
 
     try:
         response = client.chat.completions.create(
@@ -869,6 +964,51 @@ Today's date: {today_date}
         raise
 
 
+def stream_chat_with_context(
+    question: str,
+    contacts_context: str,
+    today_date: str,
+    conversation_history: list[dict] | None = None
+) -> Iterator[str]:
+    """
+    Stream an answer about contacts token by token.
+
+    Same prompt as chat_with_context, but yields text deltas as the model
+    produces them instead of waiting for the full completion.
+
+    Args:
+        question: User's question
+        contacts_context: Formatted string with relevant contact information
+        today_date: Today's date in YYYY-MM-DD format
+        conversation_history: Optional list of previous messages
+
+    Yields:
+        Chunks of the AI response
+    """
+    client = get_openai_client()
+    messages = _build_chat_messages(question, contacts_context, today_date, conversation_history)
+
+    try:
+        stream = client.chat.completions.create(
+            model="gpt-4o",
+            messages=messages,
+            temperature=0.7,
+            max_tokens=1000,
+            stream=True,
+        )
+
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    except Exception as e:
+        logger.error(f"OpenAI API error in streaming chat: {e}")
+        raise
+
+
 SMART_SEARCH_SYSTEM_PROMPT = """You are an assistant that converts natural language search queries into structured search parameters for a personal CRM.
 
 The CRM contains:
@@ -0,0 +1,66 @@
+"""
+Birthday helpers shared by the dashboard, search and periodic tasks.
+
+Birthdays are matched on (month, day) in SQL so callers never have to pull
+every person with a birthday into Python just to compute the next occurrence.
+"""
+
+from datetime import date, timedelta
+
+from django.db.models import Q, QuerySet
+from django.db.models.functions import ExtractDay, ExtractMonth
+
+
+def filter_upcoming_birthdays(
+    queryset: QuerySet,
+    days_ahead: int = 30,
+    today: date | None = None,
+) -> QuerySet:
+    """
+    Restrict a Person queryset to birthdays falling within the next N days.
+
+    Args:
+        queryset: Person queryset to filter
+        days_ahead: Size of the look-ahead window in days (inclusive)
+        today: Start of the window, defaults to date.today()
+
+    Returns:
+        Queryset annotated with birthday_month/birthday_day and filtered to
+        persons whose next birthday is between today and today + days_ahead.
+    """
+    today = today or date.today()
+    target = today + timedelta(days=days_ahead)
+    queryset = queryset.filter(birthday__isnull=False)
+
+    if days_ahead >= 365:
+        # Every birthday falls inside a window of a year or more
+        return queryset
+
+    start_q = Q(birthday_month=today.month, birthday_day__gte=today.day)
+    end_q = Q(birthday_month=target.month, birthday_day__lte=target.day)
+
+    if target.year > today.year:
+        # Window wraps around the new year (e.g. Dec 20 -> Jan 19)
+        window_q = (
+            start_q
+            | end_q
+            | Q(birthday_month__gt=today.month)
+            | Q(birthday_month__lt=target.month)
+        )
+    elif today.month == target.month:
+        window_q = Q(
+            birthday_month=today.month,
+            birthday_day__gte=today.day,
+            birthday_day__lte=target.day,
+        )
+    else:
+        window_q = (
+            start_q
+            | end_q
+            | Q(birthday_month__gt=today.month, birthday_month__lt=target.month)
+        )
+
+    return queryset.annotate(
+        birthday_month=ExtractMonth("birthday"),
+        birthday_day=ExtractDay("birthday"),
+    ).filter(window_q)
@@ -7,6 +7,7 @@ Supports JSON and CSV export formats for all data or specific entities.
 import csv
 import io
 import json
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime
 from typing import Any
 from uuid import UUID
@@ -283,18 +284,27 @@ def export_entity_json(entity_type: str) -> str:
     return json.dumps(data, cls=JSONEncoder, indent=2, ensure_ascii=False)
 
 
-def export_persons_csv() -> str:
-    """
-    Export persons as CSV format.
+# Rows fetched per database round-trip when walking tables for CSV export
+CSV_CHUNK_SIZE = 2000
 
-    Returns:
-        CSV string with person data.
-    """
+
+class _Echo:
+    """Pseudo-buffer whose write() returns the value, so csv.writer yields lines."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _rows_to_csv(rows: Iterable[list]) -> str:
+    """Render CSV rows into a single string."""
     output = io.StringIO()
-    writer = csv.writer(output)
+    csv.writer(output).writerows(rows)
+    return output.getvalue()
+
 
-    # Header row
-    headers = [
+def _person_csv_rows() -> Iterator[list]:
+    """Yield the CSV header row, then one row per person."""
+    yield [
         "id",
         "first_name",
         "last_name",
@@ -316,18 +326,19 @@ def export_persons_csv() -> str:
         "created_at",
         "updated_at",
     ]
-    writer.writerow(headers)
 
     persons = Person.objects.prefetch_related(
         "tags", "groups", "employments"
-    ).all()
+    ).iterator(chunk_size=CSV_CHUNK_SIZE)
 
     for person in persons:
-        current_emp = person.employments.filter(is_current=True).first()
+        # Employments are ordered current-first, so this matches
+        # employments.filter(is_current=True).first() without a query
+        current_emp = next((e for e in person.employments.all() if e.is_current), None)
         emails = person.emails or []
         phones = person.phones or []
 
-        row = [
+        yield [
             str(person.id),
             person.first_name,
             person.last_name,
@@ -349,17 +360,11 @@ def export_persons_csv() -> str:
             person.created_at.isoformat(),
             person.updated_at.isoformat(),
         ]
-        writer.writerow(row)
-
-    return output.getvalue()
-
 
-def export_relationships_csv() -> str:
-    """Export relationships as CSV format."""
-    output = io.StringIO()
-    writer = csv.writer(output)
 
-    headers = [
+def _relationship_csv_rows() -> Iterator[list]:
+    """Yield the CSV header row, then one row per relationship."""
+    yield [
         "id",
         "person_a",
         "person_a_id",
@@ -373,14 +378,13 @@ def export_relationships_csv() -> str:
         "auto_created",
         "created_at",
     ]
-    writer.writerow(headers)
 
     relationships = Relationship.objects.select_related(
         "person_a", "person_b", "relationship_type"
-    ).all()
+    ).iterator(chunk_size=CSV_CHUNK_SIZE)
 
     for rel in relationships:
-        row = [
+        yield [
             str(rel.id),
             rel.person_a.full_name,
             str(rel.person_a.id),
@@ -394,17 +398,11 @@ def export_relationships_csv() -> str:
             str(rel.auto_created),
             rel.created_at.isoformat(),
         ]
-        writer.writerow(row)
 
-    return output.getvalue()
-
-
-def export_anecdotes_csv() -> str:
-    """Export anecdotes as CSV format."""
-    output = io.StringIO()
-    writer = csv.writer(output)
 
-    headers = [
+def _anecdote_csv_rows() -> Iterator[list]:
+    """Yield the CSV header row, then one row per anecdote."""
+    yield [
         "id",
         "title",
         "content",
@@ -416,12 +414,13 @@ def export_anecdotes_csv() -> str:
         "created_at",
         "updated_at",
     ]
-    writer.writerow(headers)
 
-    anecdotes = Anecdote.objects.prefetch_related("persons", "tags").all()
+    anecdotes = Anecdote.objects.prefetch_related(
+        "persons", "tags"
+    ).iterator(chunk_size=CSV_CHUNK_SIZE)
 
     for anecdote in anecdotes:
-        row = [
+        yield [
             str(anecdote.id),
             anecdote.title,
             anecdote.content,
@@ -433,9 +432,43 @@ def export_anecdotes_csv() -> str:
             anecdote.created_at.isoformat(),
             anecdote.updated_at.isoformat(),
         ]
-        writer.writerow(row)
 
-    return output.getvalue()
+
+CSV_ROW_GENERATORS = {
+    "persons": _person_csv_rows,
+    "relationships": _relationship_csv_rows,
+    "anecdotes": _anecdote_csv_rows,
+}
+
+
+def _csv_rows(entity_type: str) -> Iterator[list]:
+    """Return the row generator for an entity type, or raise ValueError."""
+    if entity_type not in CSV_ROW_GENERATORS:
+        raise ValueError(
+            f"CSV export not supported for entity type: {entity_type}. "
+            f"Supported types: {', '.join(CSV_ROW_GENERATORS.keys())}"
+        )
+    return CSV_ROW_GENERATORS[entity_type]()
+
+
+def export_persons_csv() -> str:
+    """
+    Export persons as CSV format.
+
+    Returns:
+        CSV string with person data.
+    """
+    return _rows_to_csv(_person_csv_rows())
+
+
+def export_relationships_csv() -> str:
+    """Export relationships as CSV format."""
+    return _rows_to_csv(_relationship_csv_rows())
+
+
+def export_anecdotes_csv() -> str:
+    """Export anecdotes as CSV format."""
+    return _rows_to_csv(_anecdote_csv_rows())
 
 
 def export_entity_csv(entity_type: str) -> str:
@@ -448,16 +481,23 @@ def export_entity_csv(entity_type: str) -> str:
     Returns:
         CSV string with the entity data.
     """
-    csv_exporters = {
-        "persons": export_persons_csv,
-        "relationships": export_relationships_csv,
-        "anecdotes": export_anecdotes_csv,
-    }
+    return _rows_to_csv(_csv_rows(entity_type))
 
-    if entity_type not in csv_exporters:
-        raise ValueError(
-            f"CSV export not supported for entity type: {entity_type}. "
-            f"Supported types: {', '.join(csv_exporters.keys())}"
-        )
 
-    return csv_exporters[entity_type]()
+def stream_entity_csv(entity_type: str) -> Iterator[str]:
+    """
+    Export a specific entity type as CSV, one line at a time.
+
+    Rows are read from the database in chunks and encoded lazily, so memory
+    stays flat however large the export is. The entity type is validated
+    eagerly: a ValueError is raised before any line is produced.
+
+    Args:
+        entity_type: One of 'persons', 'relationships', 'anecdotes'
+
+    Returns:
+        Iterator of CSV-encoded lines.
+    """
+    rows = _csv_rows(entity_type)
+    writer = csv.writer(_Echo())
+    return (writer.writerow(row) for row in rows)
@@ -1,13 +1,23 @@
 """
-Signals for auto-creating inverse relationships.
+Signals for auto-creating inverse relationships and cache invalidation.
 """
 
 import threading
 
-from django.db.models.signals import post_save, pre_delete
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
-from .models import Relationship, RelationshipType
+from apps.core.models import Group, Tag
+
+from .cache import (
+    invalidate_contacts_context,
+    invalidate_dashboard,
+    invalidate_graph_legend,
+    invalidate_owner,
+    invalidate_search_options,
+    invalidate_tag_names,
+)
+from .models import Anecdote, Employment, Person, Photo, Relationship, RelationshipType
 
 # Thread-local storage to prevent recursion in delete signals
 _delete_in_progress = threading.local()
@@ -87,3 +97,82 @@ def delete_inverse_relationship(sender, instance, **kwargs):
         ).delete()
     finally:
         _delete_in_progress.active = False
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+@receiver(post_save, sender=RelationshipType)
+@receiver(post_delete, sender=RelationshipType)
+@receiver(post_save, sender=Employment)
+@receiver(post_delete, sender=Employment)
+def invalidate_search_options_cache(sender, **kwargs):
+    """
+    Drop cached smart search options when tags, groups, types or companies change.
+    """
+    invalidate_search_options()
+
+
+@receiver(post_save, sender=Person)
+@receiver(post_delete, sender=Person)
+@receiver(post_save, sender=Relationship)
+@receiver(post_delete, sender=Relationship)
+@receiver(post_save, sender=RelationshipType)
+@receiver(post_delete, sender=RelationshipType)
+@receiver(post_save, sender=Employment)
+@receiver(post_delete, sender=Employment)
+@receiver(post_save, sender=Anecdote)
+@receiver(post_delete, sender=Anecdote)
+@receiver(m2m_changed, sender=Anecdote.persons.through)
+def invalidate_contacts_context_cache(sender, **kwargs):
+    """
+    Drop the cached AI chat contacts context when any data it renders changes.
+    """
+    invalidate_contacts_context()
+
+
+@receiver(post_save, sender=Person)
+@receiver(post_delete, sender=Person)
+@receiver(post_save, sender=Relationship)
+@receiver(post_delete, sender=Relationship)
+@receiver(post_save, sender=RelationshipType)
+@receiver(post_delete, sender=RelationshipType)
+@receiver(post_save, sender=Anecdote)
+@receiver(post_delete, sender=Anecdote)
+@receiver(m2m_changed, sender=Anecdote.persons.through)
+@receiver(post_save, sender=Photo)
+@receiver(post_delete, sender=Photo)
+def invalidate_dashboard_cache(sender, **kwargs):
+    """
+    Drop the cached dashboard payload when anything it summarizes changes.
+    """
+    invalidate_dashboard()
+
+
+@receiver(post_save, sender=Person)
+@receiver(post_delete, sender=Person)
+def invalidate_owner_cache(sender, **kwargs):
+    """
+    Drop the cached owner whenever a person changes, so renames and moves of
+    the is_owner flag are picked up.
+    """
+    invalidate_owner()
+
+
+@receiver(post_save, sender=RelationshipType)
+@receiver(post_delete, sender=RelationshipType)
+def invalidate_graph_legend_cache(sender, **kwargs):
+    """
+    Drop the cached graph legend when relationship types change.
+    """
+    invalidate_graph_legend()
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_names_cache(sender, **kwargs):
+    """
+    Drop the cached tag names when a tag is created, renamed or deleted.
+    """
+    invalidate_tag_names()
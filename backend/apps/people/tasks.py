@@ -5,9 +5,11 @@ Celery tasks for the People app.
 import logging
 from datetime import date, timedelta
 
-from celery import shared_task
+from django.core.exceptions import ImproperlyConfigured
 from django.db import transaction
 
+from celery import shared_task
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +24,7 @@ def regenerate_person_summary(self, person_id: str) -> dict:
     Returns:
         Dict with status and summary preview
     """
+    from .cache import get_owner
     from .models import Person, Relationship
     from .services import generate_person_summary
 
@@ -32,7 +35,7 @@ def regenerate_person_summary(self, person_id: str) -> dict:
         return {"status": "error", "message": "Person not found"}
 
     # Get owner for relationship context
-    owner = Person.objects.filter(is_owner=True).first()
+    owner = get_owner()
 
     # Build person data for summary generation
     profile_data = {
@@ -324,7 +327,7 @@ def suggest_tags_for_person_task(self, person_id: str) -> dict:
     Returns:
         Dict with suggested tags
     """
-    from apps.core.models import Tag
+    from .cache import get_owner, get_tag_names
     from .models import Person, Relationship
     from .services import suggest_tags_for_person
 
@@ -335,7 +338,7 @@ def suggest_tags_for_person_task(self, person_id: str) -> dict:
         return {"status": "error", "message": "Person not found"}
 
     # Get owner for relationship context
-    owner = Person.objects.filter(is_owner=True).first()
+    owner = get_owner()
 
     # Build person data
     profile_data = {
@@ -391,7 +394,7 @@ def suggest_tags_for_person_task(self, person_id: str) -> dict:
     }
 
     # Get existing tags
-    existing_tags = list(Tag.objects.values_list("name", flat=True))
+    existing_tags = get_tag_names()
 
     try:
         suggested_tags = suggest_tags_for_person(person_data, existing_tags)
@@ -463,3 +466,116 @@ def batch_suggest_tags(apply_high_confidence: bool = False, confidence_threshold
         "queued_count": count,
         "auto_applied_count": auto_applied if apply_high_confidence else 0,
     }
+
+
+# =============================================================================
+# Background AI jobs
+#
+# These wrap the synchronous AI services so views can hand the LLM round-trip
+# to a worker and return a job id (see AIJobStatusView) instead of holding a
+# request worker for the whole completion.
+# =============================================================================
+
+
+def _seal_result(payload: dict) -> str:
+    """
+    Encrypt an AI job's payload with the field encryption keys.
+
+    Payloads quote contact data and sit in the result backend until they
+    expire, so only the token is returned; AIJobStatusView decrypts it.
+    """
+    from apps.core.encryption import encrypt_value
+
+    token = encrypt_value(payload)
+    if token is None:
+        raise ImproperlyConfigured("FIELD_ENCRYPTION_KEYS must be set to run AI jobs.")
+    return token.decode()
+
+
+@shared_task
+def ai_parse_contacts_task(text: str) -> dict:
+    """
+    Parse natural language text into structured contact data.
+
+    Args:
+        text: Free text describing contacts
+
+    Returns:
+        Encrypted dict with status and the parsed result
+    """
+    from .services import parse_contacts_text
+
+    try:
+        return _seal_result({"status": "success", "result": parse_contacts_text(text)})
+    except ValueError as e:
+        logger.warning(f"AI contact parsing rejected: {e}")
+        return _seal_result({"status": "error", "message": str(e)})
+
+
+@shared_task
+def ai_parse_updates_task(text: str, existing_contacts: list[dict]) -> dict:
+    """
+    Parse natural language text into updates for existing contacts.
+
+    Args:
+        text: Free text describing updates or memories
+        existing_contacts: Contacts the AI may match against
+
+    Returns:
+        Encrypted dict with status and the parsed result
+    """
+    from .services import parse_updates_text
+
+    try:
+        return _seal_result(
+            {"status": "success", "result": parse_updates_text(text, existing_contacts)}
+        )
+    except ValueError as e:
+        logger.warning(f"AI update parsing rejected: {e}")
+        return _seal_result({"status": "error", "message": str(e)})
+
+
+@shared_task
+def ai_chat_task(
+    question: str,
+    today_date: str,
+    conversation_history: list[dict] | None = None,
+) -> dict:
+    """
+    Answer a question about the user's contacts.
+
+    The contacts context is built here rather than passed in, and the answer
+    is returned encrypted, so no decrypted contact data travels through the
+    broker or sits in the result backend.
+
+    Args:
+        question: The user's question
+        today_date: Today's date in ISO format
+        conversation_history: Previous messages in the conversation
+
+    Returns:
+        Encrypted dict with status and the answer
+    """
+    from .cache import (
+        CONTACTS_CONTEXT_CACHE_TIMEOUT,
+        contacts_context_cache_key,
+        get_or_set_encrypted,
+        get_owner,
+    )
+    from .services import build_contacts_context, chat_with_context
+
+    owner = get_owner()
+    contacts_context = get_or_set_encrypted(
+        contacts_context_cache_key(owner.id if owner else None),
+        lambda: build_contacts_context(owner),
+        timeout=CONTACTS_CONTEXT_CACHE_TIMEOUT,
+    )
+    answer = chat_with_context(
+        question=question,
+        contacts_context=contacts_context,
+        today_date=today_date,
+        conversation_history=conversation_history,
+    )
+    return _seal_result(
+        {"status": "success", "result": {"answer": answer, "question": question}}
+    )
@@ -31,6 +31,7 @@ urlpatterns = [
     path("ai/parse-updates/", views.AIParseUpdatesView.as_view(), name="ai-parse-updates"),
     path("ai/apply-updates/", views.AIApplyUpdatesView.as_view(), name="ai-apply-updates"),
     path("ai/chat/", views.AIChatView.as_view(), name="ai-chat"),
+    path("ai/jobs/<str:job_id>/", views.AIJobStatusView.as_view(), name="ai-job-status"),
     path("ai/suggest-relationships/", views.AISuggestRelationshipsView.as_view(), name="ai-suggest-relationships"),
     path("ai/apply-relationship-suggestion/", views.AIApplyRelationshipSuggestionView.as_view(), name="ai-apply-relationship-suggestion"),
     path("ai/smart-search/", views.AISmartSearchView.as_view(), name="ai-smart-search"),
@@ -31,6 +31,7 @@ from .ai import (
     AIApplyUpdatesView,
     AIBulkImportView,
     AIChatView,
+    AIJobStatusView,
     AIParseContactsView,
     AIParseUpdatesView,
     AISmartSearchView,
@@ -70,6 +71,7 @@ __all__ = [
     "AIParseUpdatesView",
     "AIApplyUpdatesView",
     "AIChatView",
+    "AIJobStatusView",
     "AISuggestRelationshipsView",
     "AIApplyRelationshipSuggestionView",
     "AISmartSearchView",
@@ -2,39 +2,84 @@
 AI-powered views for contact parsing, suggestions, and smart search.
 """
 
+import json
 import logging
 from collections import defaultdict
 from datetime import date
+from itertools import groupby
+from operator import itemgetter
 
-from django.db.models import Q
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch, Q
+from django.http import StreamingHttpResponse
 from django.utils.decorators import method_decorator
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from celery.result import AsyncResult
+from cryptography.fernet import InvalidToken
+
+from apps.core.encryption import decrypt_value
 from apps.core.models import Group, Tag
 from apps.core.ratelimit import ai_ratelimit
 
+from ..cache import (
+    AI_ANSWER_CACHE_TIMEOUT,
+    CONTACTS_CONTEXT_CACHE_TIMEOUT,
+    SEARCH_OPTIONS_CACHE_KEY,
+    SEARCH_OPTIONS_CACHE_TIMEOUT,
+    ai_answer_cache_key,
+    contacts_context_cache_key,
+    get_encrypted,
+    get_or_set_encrypted,
+    get_owner,
+    invalidate_contacts_context,
+    invalidate_dashboard,
+    is_ai_job,
+    normalize_query,
+    remember_ai_job,
+    set_encrypted,
+)
 from ..exceptions import AIServiceError, OwnerNotFoundError
 from ..models import Anecdote, Employment, Person, Photo, Relationship, RelationshipType
 from ..serializers import PersonListSerializer, RelationshipSerializer
 from ..services import (
+    build_contacts_context,
     chat_with_context,
+    filter_upcoming_birthdays,
     parse_contacts_text,
     parse_updates_text,
     smart_search,
+    stream_chat_with_context,
     suggest_relationships,
 )
-
+from ..tasks import ai_chat_task, ai_parse_contacts_task, ai_parse_updates_task
 
 logger = logging.getLogger(__name__)
 
 
+def _request_flag(request, name):
+    """Return True when a boolean option (e.g. "async", "stream") is set in the request body."""
+    return str(request.data.get(name, "")).lower() in ("1", "true", "yes")
+
+
+def _job_accepted(job):
+    """Record a queued AI job and build the 202 response returned for it."""
+    remember_ai_job(job.id)
+    return Response(
+        {"job_id": job.id, "state": job.state},
+        status=status.HTTP_202_ACCEPTED,
+    )
+
+
 class AIParseContactsView(APIView):
     """
     Parse natural language text into structured contact data using AI.
 
     POST: Accepts text describing contacts and returns parsed structured data.
+    Pass "async": true to queue the call and get a job id back instead.
     Rate limited to prevent abuse of expensive AI operations.
     """
 
@@ -53,6 +98,9 @@ class AIParseContactsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        if _request_flag(request, "async"):
+            return _job_accepted(ai_parse_contacts_task.delay(text))
+
         try:
             result = parse_contacts_text(text)
             return Response(result)
@@ -84,13 +132,25 @@ class AIBulkImportView(APIView):
             )
 
         # Get the owner for creating relationships
-        try:
-            owner = Person.objects.get(is_owner=True)
-        except Person.DoesNotExist:
+        owner = get_owner()
+        if owner is None:
             raise OwnerNotFoundError(
                 detail="Owner profile not set up. Please create your profile first."
             )
 
+        # Preload relationship types once, mapping each lowercased name to
+        # (person_is_a, type). If the person is "mother" to the owner, the
+        # "mother" type matches by name and the person is person_a; if it only
+        # matches a type's inverse name, the owner is person_a instead.
+        # Direct name matches take precedence over inverse matches.
+        relationship_types = list(RelationshipType.objects.all())
+        rel_lookup = {}
+        for rt in relationship_types:
+            rel_lookup.setdefault(rt.name.lower(), (True, rt))
+        for rt in relationship_types:
+            if rt.inverse_name:
+                rel_lookup.setdefault(rt.inverse_name.lower(), (False, rt))
+
         created_persons = []
         created_relationships = []
         errors = []
@@ -105,47 +165,33 @@ class AIBulkImportView(APIView):
                     birthday=person_data.get("birthday"),
                     notes=person_data.get("notes", ""),
                 )
-                created_persons.append(PersonListSerializer(person).data)
+                created_persons.append(person)
 
                 # Create relationship if specified
                 relationship_name = person_data.get("relationship_to_owner", "").strip().lower()
                 if relationship_name:
-                    # Find matching relationship type
-                    relationship_type = RelationshipType.objects.filter(
-                        Q(name__iexact=relationship_name) | Q(inverse_name__iexact=relationship_name)
-                    ).first()
-
-                    if relationship_type:
-                        # Determine the correct direction:
-                        # If the person is "mother" to owner, then:
-                        # - person_a = person (the mother)
-                        # - person_b = owner (me)
-                        # - relationship_type should have name="mother"
-                        if relationship_type.name.lower() == relationship_name:
-                            # Direct match: person is [name] to owner
-                            rel = Relationship.objects.create(
-                                person_a=person,
-                                person_b=owner,
-                                relationship_type=relationship_type,
-                            )
-                        else:
-                            # Inverse match: owner is [name] to person
-                            # So we flip: person_a = owner, person_b = person
-                            rel = Relationship.objects.create(
-                                person_a=owner,
-                                person_b=person,
-                                relationship_type=relationship_type,
-                            )
-                        created_relationships.append(RelationshipSerializer(rel).data)
+                    entry = rel_lookup.get(relationship_name)
+                    if entry:
+                        person_is_a, relationship_type = entry
+                        person_a, person_b = (person, owner) if person_is_a else (owner, person)
+                        rel = Relationship.objects.create(
+                            person_a=person_a,
+                            person_b=person_b,
+                            relationship_type=relationship_type,
+                        )
+                        created_relationships.append(rel)
                     else:
                         errors.append(f"Person {idx + 1}: Relationship type '{relationship_name}' not found")
 
             except Exception as e:
                 errors.append(f"Person {idx + 1}: {str(e)}")
 
+        # Serialize once after the loop instead of per created object
         return Response({
-            "created_persons": created_persons,
-            "created_relationships": created_relationships,
+            "created_persons": PersonListSerializer(
+                created_persons, many=True, context={"owner": owner}
+            ).data,
+            "created_relationships": RelationshipSerializer(created_relationships, many=True).data,
             "errors": errors,
             "summary": {
                 "persons_created": len(created_persons),
@@ -160,6 +206,7 @@ class AIParseUpdatesView(APIView):
     Parse natural language text into updates for existing contacts using AI.
 
     POST: Accepts text describing updates/memories and returns parsed structured data.
+    Pass "async": true to queue the call and get a job id back instead.
     Rate limited to prevent abuse of expensive AI operations.
     """
 
@@ -179,10 +226,7 @@ class AIParseUpdatesView(APIView):
             )
 
         # Get existing contacts with their relationships to owner
-        try:
-            owner = Person.objects.get(is_owner=True)
-        except Person.DoesNotExist:
-            owner = None
+        owner = get_owner()
 
         # Build list of existing contacts with relationship info
         existing_contacts = []
@@ -210,6 +254,9 @@ class AIParseUpdatesView(APIView):
 
             existing_contacts.append(contact_info)
 
+        if _request_flag(request, "async"):
+            return _job_accepted(ai_parse_updates_task.delay(text, existing_contacts))
+
         try:
             result = parse_updates_text(text, existing_contacts)
             return Response(result)
@@ -242,67 +289,94 @@ class AIApplyUpdatesView(APIView):
 
         updated_persons = []
         created_anecdotes = []
+        anecdote_links = []
         errors = []
 
-        for idx, update in enumerate(updates_data):
-            person_id = update.get("matched_person_id")
-            if not person_id:
-                errors.append(f"Update {idx + 1}: No matched person ID")
-                continue
-
-            try:
-                person = Person.objects.get(id=person_id, is_active=True)
-            except Person.DoesNotExist:
-                errors.append(f"Update {idx + 1}: Person not found")
-                continue
-
-            try:
-                # Apply field updates
-                field_updates = update.get("field_updates", {})
-                fields_changed = []
-
-                if field_updates.get("birthday"):
-                    person.birthday = field_updates["birthday"]
-                    fields_changed.append("birthday")
-
-                if field_updates.get("nickname"):
-                    person.nickname = field_updates["nickname"]
-                    fields_changed.append("nickname")
-
-                if field_updates.get("notes_to_append"):
-                    if person.notes:
-                        person.notes = f"{person.notes}\n\n{field_updates['notes_to_append']}"
-                    else:
-                        person.notes = field_updates["notes_to_append"]
-                    fields_changed.append("notes")
-
-                if fields_changed:
-                    person.save()
-                    updated_persons.append({
-                        "id": str(person.id),
-                        "full_name": person.full_name,
-                        "fields_updated": fields_changed,
-                    })
-
-                # Create anecdotes
-                for anecdote_data in update.get("anecdotes", []):
-                    anecdote = Anecdote.objects.create(
-                        title=anecdote_data.get("title", ""),
-                        content=anecdote_data["content"],
-                        anecdote_type=anecdote_data.get("anecdote_type", "note"),
-                        date=anecdote_data.get("date"),
-                        location=anecdote_data.get("location", ""),
-                    )
-                    anecdote.persons.add(person)
-                    created_anecdotes.append({
-                        "id": str(anecdote.id),
-                        "title": anecdote.title,
-                        "content": anecdote.content[:100] + "..." if len(anecdote.content) > 100 else anecdote.content,
-                        "person_name": person.full_name,
-                    })
-
-            except Exception as e:
-                errors.append(f"Update {idx + 1}: {str(e)}")
+        # Apply everything in one transaction; each update gets its own savepoint
+        # so a failing one is reported without undoing the others
+        with transaction.atomic():
+            for idx, update in enumerate(updates_data):
+                person_id = update.get("matched_person_id")
+                if not person_id:
+                    errors.append(f"Update {idx + 1}: No matched person ID")
+                    continue
+
+                try:
+                    person = Person.objects.get(id=person_id, is_active=True)
+                except Person.DoesNotExist:
+                    errors.append(f"Update {idx + 1}: Person not found")
+                    continue
+
+                # Results are only recorded once the update's savepoint commits
+                person_result = None
+                links = []
+                anecdotes = []
+                try:
+                    with transaction.atomic():
+                        # Apply field updates
+                        field_updates = update.get("field_updates", {})
+                        fields_changed = []
+
+                        if field_updates.get("birthday"):
+                            person.birthday = field_updates["birthday"]
+                            fields_changed.append("birthday")
+
+                        if field_updates.get("nickname"):
+                            person.nickname = field_updates["nickname"]
+                            fields_changed.append("nickname")
+
+                        if field_updates.get("notes_to_append"):
+                            if person.notes:
+                                person.notes = f"{person.notes}\n\n{field_updates['notes_to_append']}"
+                            else:
+                                person.notes = field_updates["notes_to_append"]
+                            fields_changed.append("notes")
+
+                        if fields_changed:
+                            person.save(update_fields=[*fields_changed, "updated_at"])
+                            person_result = {
+                                "id": str(person.id),
+                                "full_name": person.full_name,
+                                "fields_updated": fields_changed,
+                            }
+
+                        # Create anecdotes
+                        for anecdote_data in update.get("anecdotes", []):
+                            anecdote = Anecdote.objects.create(
+                                title=anecdote_data.get("title", ""),
+                                content=anecdote_data["content"],
+                                anecdote_type=anecdote_data.get("anecdote_type", "note"),
+                                date=anecdote_data.get("date"),
+                                location=anecdote_data.get("location", ""),
+                            )
+                            links.append(
+                                Anecdote.persons.through(anecdote_id=anecdote.id, person_id=person.id)
+                            )
+                            anecdotes.append({
+                                "id": str(anecdote.id),
+                                "title": anecdote.title,
+                                "content": anecdote.content[:100] + "..." if len(anecdote.content) > 100 else anecdote.content,
+                                "person_name": person.full_name,
+                            })
+                except Exception as e:
+                    errors.append(f"Update {idx + 1}: {str(e)}")
+                    continue
+
+                if person_result:
+                    updated_persons.append(person_result)
+                anecdote_links.extend(links)
+                created_anecdotes.extend(anecdotes)
+
+            # Link every new anecdote to its person in a single INSERT; if it
+            # fails, the anecdotes created above are rolled back with it
+            if anecdote_links:
+                Anecdote.persons.through.objects.bulk_create(anecdote_links)
+
+        # bulk_create bypasses m2m_changed, so the dependent caches are
+        # dropped by hand
+        if anecdote_links:
+            invalidate_contacts_context()
+            invalidate_dashboard()
 
         return Response({
             "updated_persons": updated_persons,
@@ -321,6 +395,8 @@ class AIChatView(APIView):
     AI-powered chat about contacts.
 
     POST: Answer questions about the user's contacts using AI.
+    Pass "async": true to queue the call and get a job id back instead, or
+    "stream": true to receive the answer as server-sent events.
     Rate limited to prevent abuse of expensive AI operations.
     """
 
@@ -342,68 +418,126 @@ class AIChatView(APIView):
         # Get conversation history if provided
         conversation_history = request.data.get("history", [])
 
+        today_date = date.today().isoformat()
+
+        if _request_flag(request, "async"):
+            # The worker rebuilds the contacts context itself, so no decrypted
+            # contact data passes through the broker
+            return _job_accepted(
+                ai_chat_task.delay(question, today_date, conversation_history)
+            )
+
         # Build contacts context
-        owner = Person.objects.filter(is_owner=True).first()
-        context_parts = []
+        owner = get_owner()
+        contacts_context = get_or_set_encrypted(
+            contacts_context_cache_key(owner.id if owner else None),
+            lambda: build_contacts_context(owner),
+            timeout=CONTACTS_CONTEXT_CACHE_TIMEOUT,
+        )
 
-        # Add owner info
-        if owner:
-            context_parts.append(f"Owner (You): {owner.full_name}")
+        if _request_flag(request, "stream"):
+            response = StreamingHttpResponse(
+                self._stream_answer(question, contacts_context, today_date, conversation_history),
+                content_type="text/event-stream",
+            )
+            response["Cache-Control"] = "no-cache"
+            response["X-Accel-Buffering"] = "no"  # Don't let nginx buffer the stream
+            return response
+
+        # Identical questions against an unchanged context reuse the last answer
+        cache_key = ai_answer_cache_key(
+            "chat",
+            normalize_query(question),
+            contacts_context,
+            conversation_history,
+            today_date,
+        )
+        answer = get_encrypted(cache_key)
+        if answer is not None:
+            return Response({
+                "answer": answer,
+                "question": question,
+            })
 
-        # Add all contacts with their relationships and key info
-        for person in Person.objects.filter(is_active=True, is_owner=False).prefetch_related("anecdotes", "employments")[:100]:
-            person_info = [f"\n### {person.full_name}"]
+        try:
+            response = chat_with_context(
+                question=question,
+                contacts_context=contacts_context,
+                today_date=today_date,
+                conversation_history=conversation_history,
+            )
+        except Exception as e:
+            logger.error(f"Chat failed: {e}")
+            raise AIServiceError(detail=f"Chat failed: {str(e)}")
 
-            # Get relationship to owner
-            if owner:
-                rel = Relationship.objects.filter(
-                    person_a=person, person_b=owner
-                ).select_related("relationship_type").first()
-                if rel:
-                    person_info.append(f"Relationship: {rel.relationship_type.name}")
+        set_encrypted(cache_key, response, timeout=AI_ANSWER_CACHE_TIMEOUT)
+        return Response({
+            "answer": response,
+            "question": question,
+        })
 
-            if person.birthday:
-                person_info.append(f"Birthday: {person.birthday.isoformat()}")
+    def _stream_answer(self, question, contacts_context, today_date, conversation_history):
+        """Yield the AI answer as server-sent events, ending with a done or error event."""
+        try:
+            for chunk in stream_chat_with_context(
+                question=question,
+                contacts_context=contacts_context,
+                today_date=today_date,
+                conversation_history=conversation_history,
+            ):
+                yield f"data: {json.dumps({'delta': chunk})}\n\n"
+        except Exception as e:
+            logger.error(f"Streaming chat failed: {e}")
+            yield f"event: error\ndata: {json.dumps({'detail': f'Chat failed: {e}'})}\n\n"
+            return
+        yield "event: done\ndata: {}\n\n"
 
-            if person.nickname:
-                person_info.append(f"Nickname: {person.nickname}")
 
-            if person.notes:
-                person_info.append(f"Notes: {person.notes[:200]}")
+class AIJobStatusView(APIView):
+    """
+    Poll the state of a queued AI job.
 
-            # Current employment
-            current_job = person.employments.filter(is_current=True).first()
-            if current_job:
-                person_info.append(f"Current job: {current_job.title} at {current_job.company}")
+    GET: Returns 202 while the job is pending or running, the job result once
+    it has finished, and an error when the job failed. Only jobs queued by the
+    AI endpoints are reported; any other id is a 404.
+    """
+
+    def get(self, request, job_id):
+        if not is_ai_job(job_id):
+            return Response(
+                {"detail": "Job not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
 
-            # Recent anecdotes (limit to 3)
-            anecdotes = person.anecdotes.all()[:3]
-            if anecdotes:
-                anecdote_texts = []
-                for a in anecdotes:
-                    anecdote_texts.append(f"- [{a.anecdote_type}] {a.title or ''}: {a.content[:100]}")
-                person_info.append(f"Anecdotes:\n" + "\n".join(anecdote_texts))
+        job = AsyncResult(job_id)
 
-            context_parts.append("\n".join(person_info))
+        if not job.ready():
+            return Response(
+                {"job_id": job_id, "state": job.state},
+                status=status.HTTP_202_ACCEPTED,
+            )
 
-        contacts_context = "\n".join(context_parts)
-        today_date = date.today().isoformat()
+        if job.failed():
+            logger.error(f"AI job {job_id} failed: {job.result}")
+            raise AIServiceError(detail=f"AI job failed: {job.result}")
 
+        # The tasks return their payload encrypted (see tasks._seal_result)
         try:
-            response = chat_with_context(
-                question=question,
-                contacts_context=contacts_context,
-                today_date=today_date,
-                conversation_history=conversation_history,
+            payload = (decrypt_value(job.result.encode()) if job.result else None) or {}
+        except InvalidToken:
+            logger.error(f"AI job {job_id} result could not be decrypted")
+            raise AIServiceError(detail="AI job result could not be read.") from None
+        if payload.get("status") == "error":
+            return Response(
+                {"job_id": job_id, "state": job.state, "detail": payload.get("message")},
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
-            return Response({
-                "answer": response,
-                "question": question,
-            })
-        except Exception as e:
-            logger.error(f"Chat failed: {e}")
-            raise AIServiceError(detail=f"Chat failed: {str(e)}")
+        return Response({
+            "job_id": job_id,
+            "state": job.state,
+            "result": payload.get("result"),
+        })
 
 
 class AISuggestRelationshipsView(APIView):
@@ -417,7 +551,7 @@ class AISuggestRelationshipsView(APIView):
     @method_decorator(ai_ratelimit())
     def get(self, request):
         # Get all active persons (excluding owner)
-        owner = Person.objects.filter(is_owner=True).first()
+        owner = get_owner()
         persons = Person.objects.filter(is_active=True, is_owner=False).prefetch_related(
             "tags", "groups", "employments"
         )
@@ -466,41 +600,27 @@ class AISuggestRelationshipsView(APIView):
             "anecdote_comentions": [],
         }
 
+        persons_by_id = {p["id"]: p for p in persons_data}
+
         # Find photo co-appearances
-        photo_people = defaultdict(set)
-        for photo in Photo.objects.prefetch_related("persons"):
-            person_ids = [(str(p.id), p.full_name) for p in photo.persons.filter(is_owner=False)]
-            if len(person_ids) > 1:
-                for i, (p1_id, p1_name) in enumerate(person_ids):
-                    for p2_id, p2_name in person_ids[i+1:]:
-                        key = tuple(sorted([p1_id, p2_id]))
-                        photo_people[key].add(photo.id)
-
-        for (p1_id, p2_id), photos in photo_people.items():
+        photo_people = self._count_co_appearances(Photo.persons.through, "photo_id")
+        for (p1_id, p2_id), count in photo_people.items():
             # Get names
-            p1 = next((p for p in persons_data if p["id"] == p1_id), None)
-            p2 = next((p for p in persons_data if p["id"] == p2_id), None)
+            p1 = persons_by_id.get(p1_id)
+            p2 = persons_by_id.get(p2_id)
             if p1 and p2:
                 shared_contexts["photo_coappearances"].append(
-                    (p1_id, p1["full_name"], p2_id, p2["full_name"], len(photos))
+                    (p1_id, p1["full_name"], p2_id, p2["full_name"], count)
                 )
 
         # Find anecdote co-mentions
-        anecdote_people = defaultdict(set)
-        for anecdote in Anecdote.objects.prefetch_related("persons"):
-            person_ids = [(str(p.id), p.full_name) for p in anecdote.persons.filter(is_owner=False)]
-            if len(person_ids) > 1:
-                for i, (p1_id, p1_name) in enumerate(person_ids):
-                    for p2_id, p2_name in person_ids[i+1:]:
-                        key = tuple(sorted([p1_id, p2_id]))
-                        anecdote_people[key].add(anecdote.id)
-
-        for (p1_id, p2_id), anecdotes in anecdote_people.items():
-            p1 = next((p for p in persons_data if p["id"] == p1_id), None)
-            p2 = next((p for p in persons_data if p["id"] == p2_id), None)
+        anecdote_people = self._count_co_appearances(Anecdote.persons.through, "anecdote_id")
+        for (p1_id, p2_id), count in anecdote_people.items():
+            p1 = persons_by_id.get(p1_id)
+            p2 = persons_by_id.get(p2_id)
             if p1 and p2:
                 shared_contexts["anecdote_comentions"].append(
-                    (p1_id, p1["full_name"], p2_id, p2["full_name"], len(anecdotes))
+                    (p1_id, p1["full_name"], p2_id, p2["full_name"], count)
                 )
 
         try:
@@ -519,6 +639,30 @@ class AISuggestRelationshipsView(APIView):
             logger.error(f"Failed to generate suggestions: {e}")
             raise AIServiceError(detail=f"Failed to generate suggestions: {str(e)}")
 
+    @staticmethod
+    def _count_co_appearances(through_model, item_field):
+        """
+        Count how many items (photos, anecdotes) each pair of contacts shares.
+
+        Streams (item, person) rows from the M2M table ordered by item, so only
+        one item's people are held in memory at a time. Returns a dict mapping
+        an ordered (person_id, person_id) pair of strings to a count.
+        """
+        rows = (
+            through_model.objects.filter(person__is_owner=False)
+            .order_by(item_field)
+            .values_list(item_field, "person_id")
+            .iterator(chunk_size=2000)
+        )
+        counts = defaultdict(int)
+        for _, item_rows in groupby(rows, key=itemgetter(0)):
+            person_ids = [str(person_id) for _, person_id in item_rows]
+            for i, p1_id in enumerate(person_ids):
+                for p2_id in person_ids[i+1:]:
+                    key = (p1_id, p2_id) if p1_id < p2_id else (p2_id, p1_id)
+                    counts[key] += 1
+        return counts
+
 
 class AIApplyRelationshipSuggestionView(APIView):
     """
@@ -557,24 +701,32 @@ class AIApplyRelationshipSuggestionView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Check if relationship already exists
-        existing = Relationship.objects.filter(
+        # Check if relationship already exists (either direction, any type)
+        already_related = Relationship.objects.filter(
             Q(person_a=person1, person_b=person2) |
             Q(person_a=person2, person_b=person1)
-        ).first()
+        ).exists()
 
-        if existing:
+        if already_related:
             return Response(
                 {"detail": "Relationship already exists between these persons."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Create the relationship
-        relationship = Relationship.objects.create(
-            person_a=person1,
-            person_b=person2,
-            relationship_type=rel_type,
-        )
+        # Create the relationship. The unique_relationship constraint guards
+        # against a concurrent request creating the same row in between.
+        try:
+            with transaction.atomic():
+                relationship = Relationship.objects.create(
+                    person_a=person1,
+                    person_b=person2,
+                    relationship_type=rel_type,
+                )
+        except IntegrityError:
+            return Response(
+                {"detail": "Relationship already exists between these persons."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         return Response({
             "id": str(relationship.id),
@@ -603,29 +755,41 @@ class AISmartSearchView(APIView):
             )
 
         # Gather available options for the AI to reference
-        available_tags = list(Tag.objects.values_list("name", flat=True))
-        available_groups = list(Group.objects.values_list("name", flat=True))
-        available_relationship_types = list(
-            RelationshipType.objects.values_list("name", flat=True)
-        )
-        available_companies = list(
-            Employment.objects.filter(company__isnull=False)
-            .values_list("company", flat=True)
-            .distinct()[:50]
+        (
+            available_tags,
+            available_groups,
+            available_relationship_types,
+            available_companies,
+        ) = cache.get_or_set(
+            SEARCH_OPTIONS_CACHE_KEY,
+            self._compute_search_options,
+            timeout=SEARCH_OPTIONS_CACHE_TIMEOUT,
         )
 
-        # Get AI interpretation of the query
-        try:
-            search_params = smart_search(
-                query=query,
-                available_tags=available_tags,
-                available_groups=available_groups,
-                available_relationship_types=available_relationship_types,
-                available_companies=available_companies,
-            )
-        except Exception as e:
-            logger.error(f"AI search failed: {e}")
-            raise AIServiceError(detail=f"AI search failed: {str(e)}")
+        # Get AI interpretation of the query, reusing a cached one when the
+        # same query was interpreted against the same filter options
+        cache_key = ai_answer_cache_key(
+            "search",
+            normalize_query(query),
+            available_tags,
+            available_groups,
+            available_relationship_types,
+            available_companies,
+        )
+        search_params = get_encrypted(cache_key)
+        if search_params is None:
+            try:
+                search_params = smart_search(
+                    query=query,
+                    available_tags=available_tags,
+                    available_groups=available_groups,
+                    available_relationship_types=available_relationship_types,
+                    available_companies=available_companies,
+                )
+            except Exception as e:
+                logger.error(f"AI search failed: {e}")
+                raise AIServiceError(detail=f"AI search failed: {str(e)}")
+            set_encrypted(cache_key, search_params, timeout=AI_ANSWER_CACHE_TIMEOUT)
 
         # Execute the search based on parsed parameters
         results = {
@@ -670,6 +834,20 @@ class AISmartSearchView(APIView):
 
         return Response(results)
 
+    @staticmethod
+    def _compute_search_options():
+        """Collect the filter values the AI may reference in its interpretation."""
+        return (
+            list(Tag.objects.values_list("name", flat=True)),
+            list(Group.objects.values_list("name", flat=True)),
+            list(RelationshipType.objects.values_list("name", flat=True)),
+            list(
+                Employment.objects.filter(company__isnull=False)
+                .values_list("company", flat=True)
+                .distinct()[:50]
+            ),
+        )
+
     def _search_persons(self, person_filters, keywords, limit):
         """Search persons based on filters and keywords."""
         person_qs = Person.objects.filter(is_active=True, is_owner=False)
@@ -721,18 +899,7 @@ class AISmartSearchView(APIView):
             )
 
         if person_filters.get("has_birthday_soon"):
-            today = date.today()
-            person_qs = person_qs.filter(birthday__isnull=False)
-            persons_with_birthday = []
-            for person in person_qs.distinct()[:100]:
-                if person.birthday:
-                    this_year_bday = person.birthday.replace(year=today.year)
-                    if this_year_bday < today:
-                        this_year_bday = this_year_bday.replace(year=today.year + 1)
-                    days_until = (this_year_bday - today).days
-                    if 0 <= days_until <= 30:
-                        persons_with_birthday.append(person.id)
-            person_qs = Person.objects.filter(id__in=persons_with_birthday)
+            person_qs = filter_upcoming_birthdays(person_qs, days_ahead=30)
 
         # If no specific filters matched, do keyword search
         if not any(person_filters.values()) and keywords:
@@ -748,34 +915,53 @@ class AISmartSearchView(APIView):
             person_qs = person_qs.filter(keyword_q)
 
         # Get owner for relationship lookup
-        owner = Person.objects.filter(is_owner=True).first()
+        owner = get_owner()
+
+        persons = list(
+            person_qs.distinct().only(
+                "id", "first_name", "last_name", "avatar"
+            ).prefetch_related(
+                Prefetch("tags", queryset=Tag.objects.only("id", "name")),
+                Prefetch(
+                    "employments",
+                    queryset=Employment.objects.filter(is_current=True).only(
+                        "id", "person_id", "title", "company"
+                    ),
+                    to_attr="current_emps",
+                ),
+            )[:limit]
+        )
+
+        # Resolve relationships to owner in one query instead of two per person.
+        # Owner -> person relationships take precedence over person -> owner ones.
+        rel_map = {}
+        if owner and persons:
+            person_ids = [p.id for p in persons]
+            owner_rels = Relationship.objects.filter(
+                Q(person_a=owner, person_b_id__in=person_ids)
+                | Q(person_a_id__in=person_ids, person_b=owner)
+            ).select_related("relationship_type")
+            inverse_names = {}
+            for rel in owner_rels:
+                rel_type = rel.relationship_type
+                if rel.person_a_id == owner.id:
+                    rel_map.setdefault(rel.person_b_id, rel_type.name)
+                else:
+                    inverse_names.setdefault(rel.person_a_id, rel_type.inverse_name or rel_type.name)
+            for person_id, name in inverse_names.items():
+                rel_map.setdefault(person_id, name)
 
         # Serialize results
         results = []
-        for person in person_qs.distinct()[:limit]:
-            current_emp = person.employments.filter(is_current=True).first()
-
-            # Get relationship to owner
-            relationship_to_me = None
-            if owner:
-                rel = Relationship.objects.filter(
-                    person_a=owner, person_b=person
-                ).select_related("relationship_type").first()
-                if rel:
-                    relationship_to_me = rel.relationship_type.name
-                else:
-                    rel = Relationship.objects.filter(
-                        person_a=person, person_b=owner
-                    ).select_related("relationship_type").first()
-                    if rel:
-                        relationship_to_me = rel.relationship_type.inverse_name or rel.relationship_type.name
+        for person in persons:
+            current_emp = person.current_emps[0] if person.current_emps else None
 
             results.append({
                 "id": str(person.id),
                 "full_name": person.full_name,
-                "relationship_to_me": relationship_to_me,
+                "relationship_to_me": rel_map.get(person.id),
                 "current_job": f"{current_emp.title} at {current_emp.company}" if current_emp else None,
-                "tags": [t.name for t in person.tags.all()[:5]],
+                "tags": [t.name for t in list(person.tags.all())[:5]],
                 "avatar_url": person.avatar.url if person.avatar else None,
             })
 
@@ -785,10 +971,12 @@ class AISmartSearchView(APIView):
         """Search anecdotes based on filters and keywords."""
         anecdote_qs = Anecdote.objects.all()
 
+        # content is stored as Fernet ciphertext, so substring lookups on it
+        # can never match; they only forced a sequential scan that kept the
+        # trigram indexes on title and location from being used.
         if anecdote_filters.get("content_contains"):
-            text = anecdote_filters["content_contains"]
             anecdote_qs = anecdote_qs.filter(
-                Q(title__icontains=text) | Q(content__icontains=text)
+                title__icontains=anecdote_filters["content_contains"]
             )
 
         if anecdote_filters.get("anecdote_type"):
@@ -811,15 +999,21 @@ class AISmartSearchView(APIView):
         if not any(anecdote_filters.values()) and keywords:
             keyword_q = Q()
             for kw in keywords[:5]:
-                keyword_q |= (
-                    Q(title__icontains=kw) |
-                    Q(content__icontains=kw) |
-                    Q(location__icontains=kw)
-                )
+                keyword_q |= Q(title__icontains=kw) | Q(location__icontains=kw)
             anecdote_qs = anecdote_qs.filter(keyword_q)
 
+        # Every filter is on the anecdote row itself, so no DISTINCT is needed
         results = []
-        for anecdote in anecdote_qs.distinct()[:limit]:
+        anecdote_qs = anecdote_qs.only(
+            "id", "title", "content", "anecdote_type", "date", "location", "created_at"
+        ).prefetch_related(
+            # Sliced prefetch: at most three persons per anecdote are fetched
+            Prefetch(
+                "persons",
+                queryset=Person.objects.only("id", "first_name", "last_name")[:3],
+            )
+        )
+        for anecdote in anecdote_qs[:limit]:
             results.append({
                 "id": str(anecdote.id),
                 "title": anecdote.title,
@@ -827,14 +1021,14 @@ class AISmartSearchView(APIView):
                 "anecdote_type": anecdote.anecdote_type,
                 "date": anecdote.date.isoformat() if anecdote.date else None,
                 "location": anecdote.location,
-                "persons": [p.full_name for p in anecdote.persons.all()[:3]],
+                "persons": [p.full_name for p in anecdote.persons.all()],
             })
 
         return results
 
     def _search_employments(self, employment_filters, limit):
         """Search employments based on filters."""
-        emp_qs = Employment.objects.select_related("person")
+        emp_qs = Employment.objects.all()
 
         if employment_filters.get("company_contains"):
             emp_qs = emp_qs.filter(
@@ -849,15 +1043,23 @@ class AISmartSearchView(APIView):
         if employment_filters.get("is_current") is not None:
             emp_qs = emp_qs.filter(is_current=employment_filters["is_current"])
 
+        # Every filter is on the employment row itself, so no DISTINCT is needed
         results = []
-        for emp in emp_qs.distinct()[:limit]:
+        for emp in emp_qs.values(
+            "id", "person_id", "person__first_name", "person__last_name",
+            "company", "title", "is_current",
+        )[:limit]:
             results.append({
-                "id": str(emp.id),
-                "person_id": str(emp.person.id),
-                "person_name": emp.person.full_name,
-                "company": emp.company,
-                "title": emp.title,
-                "is_current": emp.is_current,
+                "id": str(emp["id"]),
+                "person_id": str(emp["person_id"]),
+                "person_name": (
+                    f"{emp['person__first_name']} {emp['person__last_name']}"
+                    if emp["person__last_name"]
+                    else emp["person__first_name"]
+                ),
+                "company": emp["company"],
+                "title": emp["title"],
+                "is_current": emp["is_current"],
             })
 
         return results
@@ -2,16 +2,25 @@
 Dashboard and search views.
 """
 
+import re
 from datetime import date
 
-from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
-from django.db.models import Count, Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Count, F, Q, Window
+from django.db.models.functions import RowNumber
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from ..cache import (
+    DASHBOARD_CACHE_TIMEOUT,
+    dashboard_cache_key,
+    get_or_set_encrypted,
+    get_owner,
+)
 from ..exceptions import OwnerNotFoundError
-from ..models import Anecdote, Employment, Person, Photo, Relationship
+from ..models import Anecdote, Employment, Person, Photo, Relationship, RelationshipType
 from ..serializers import (
     AnecdoteSerializer,
     EmploymentSerializer,
@@ -19,6 +28,14 @@ from ..serializers import (
     PersonDetailSerializer,
     PersonListSerializer,
 )
+from ..services import filter_upcoming_birthdays
+
+
+def _full_name(first_name, last_name):
+    """Format a name the same way as Person.full_name, from raw column values."""
+    if last_name:
+        return f"{first_name} {last_name}"
+    return first_name
 
 
 class MeView(APIView):
@@ -42,16 +59,18 @@ class MeView(APIView):
             )
 
     def post(self, request):
-        # Check if owner already exists
-        if Person.objects.filter(is_owner=True).exists():
-            return Response(
-                {"detail": "Owner profile already exists. Use PUT to update."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
         serializer = PersonCreateUpdateSerializer(data=request.data)
         if serializer.is_valid():
-            person = serializer.save(is_owner=True)
+            # The person_single_owner constraint rejects a second owner, so
+            # no existence check is needed before the insert
+            try:
+                with transaction.atomic():
+                    person = serializer.save(is_owner=True)
+            except IntegrityError:
+                return Response(
+                    {"detail": "Owner profile already exists. Use PUT to update."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
             return Response(
                 PersonDetailSerializer(person).data,
                 status=status.HTTP_201_CREATED,
@@ -94,20 +113,31 @@ class DashboardView(APIView):
 
     def get(self, request):
         today = date.today()
+        owner = get_owner()
+
+        # The payload only changes when contacts change (signals drop the
+        # cache version) or when the day rolls over (part of the key). It
+        # includes anecdote content, so it is cached encrypted.
+        payload = get_or_set_encrypted(
+            dashboard_cache_key(owner.id if owner else None, today),
+            lambda: self._build_dashboard(today, owner),
+            timeout=DASHBOARD_CACHE_TIMEOUT,
+        )
+        return Response(payload)
 
+    def _build_dashboard(self, today, owner):
+        """Compute the dashboard payload for the given day and owner."""
         # Get counts (exclude owner from person count)
-        total_persons = Person.objects.filter(is_active=True, is_owner=False).count()
-        total_relationships = Relationship.objects.count()
-        total_anecdotes = Anecdote.objects.count()
-        total_photos = Photo.objects.count()
+        total_persons, total_relationships, total_anecdotes, total_photos = self._get_counts()
 
-        # Upcoming birthdays (next 30 days)
+        # Upcoming birthdays (next 30 days). The window is filtered in SQL so
+        # only matching persons are loaded; exact dates are computed below.
         upcoming_birthdays = []
-        persons_with_birthday = Person.objects.filter(
-            is_active=True,
-            is_owner=False,
-            birthday__isnull=False
-        )
+        persons_with_birthday = filter_upcoming_birthdays(
+            Person.objects.filter(is_active=True, is_owner=False),
+            days_ahead=30,
+            today=today,
+        ).only("id", "first_name", "last_name", "birthday")
 
         for person in persons_with_birthday:
             # Calculate this year's birthday
@@ -140,50 +170,93 @@ class DashboardView(APIView):
         # Sort by days until
         upcoming_birthdays.sort(key=lambda x: x["days_until"])
 
-        # Recent anecdotes (last 10)
-        recent_anecdotes = []
-        for anecdote in Anecdote.objects.prefetch_related("persons")[:10]:
-            person_names = [p.full_name for p in anecdote.persons.all()[:3]]
-            recent_anecdotes.append({
-                "id": str(anecdote.id),
-                "title": anecdote.title,
-                "content": anecdote.content[:150] + "..." if len(anecdote.content) > 150 else anecdote.content,
-                "anecdote_type": anecdote.anecdote_type,
-                "date": anecdote.date.isoformat() if anecdote.date else None,
-                "persons": person_names,
-                "created_at": anecdote.created_at.isoformat(),
-            })
+        # Recent anecdotes (last 10). Plain dicts from .values() skip model
+        # instantiation; linked names come from the through table in one query.
+        anecdotes = list(
+            Anecdote.objects.values(
+                "id", "title", "content", "anecdote_type", "date", "created_at"
+            )[:10]
+        )
+        # Only the first three names per anecdote are shown, so the window
+        # function keeps the rest of each anecdote's links out of the result.
+        anecdote_persons = {}
+        for link in (
+            Anecdote.persons.through.objects.filter(
+                anecdote_id__in=[a["id"] for a in anecdotes]
+            )
+            .annotate(
+                position=Window(
+                    RowNumber(),
+                    partition_by=[F("anecdote_id")],
+                    order_by=[F("person__last_name").asc(), F("person__first_name").asc()],
+                )
+            )
+            .filter(position__lte=3)
+            .order_by("position")
+            .values("anecdote_id", "person__first_name", "person__last_name")
+        ):
+            anecdote_persons.setdefault(link["anecdote_id"], []).append(
+                _full_name(link["person__first_name"], link["person__last_name"])
+            )
+
+        recent_anecdotes = [
+            {
+                "id": str(anecdote["id"]),
+                "title": anecdote["title"],
+                "content": (
+                    anecdote["content"][:150] + "..."
+                    if len(anecdote["content"]) > 150
+                    else anecdote["content"]
+                ),
+                "anecdote_type": anecdote["anecdote_type"],
+                "date": anecdote["date"].isoformat() if anecdote["date"] else None,
+                "persons": anecdote_persons.get(anecdote["id"], []),
+                "created_at": anecdote["created_at"].isoformat(),
+            }
+            for anecdote in anecdotes
+        ]
 
         # Recently added people (last 10)
-        recent_persons = []
-        owner = Person.objects.filter(is_owner=True).first()
-        for person in Person.objects.filter(is_active=True, is_owner=False).order_by("-created_at")[:10]:
-            # Get relationship to owner (what this person IS to me)
-            relationship_to_me = None
-            if owner:
-                # Look for relationship where this person is related TO the owner
-                rel = Relationship.objects.filter(
-                    person_a=person,
-                    person_b=owner
-                ).select_related("relationship_type").first()
-                if rel:
-                    relationship_to_me = rel.relationship_type.name
-
-            recent_persons.append({
-                "id": str(person.id),
-                "full_name": person.full_name,
-                "relationship_to_me": relationship_to_me,
-                "created_at": person.created_at.isoformat(),
-            })
+        recent_list = list(
+            Person.objects.filter(is_active=True, is_owner=False)
+            .values("id", "first_name", "last_name", "created_at")
+            .order_by("-created_at")[:10]
+        )
 
-        # Relationship type distribution
+        # Relationship to owner (what each person IS to me), fetched in one query
+        relationships_to_me = {}
+        if owner:
+            for rel in Relationship.objects.filter(
+                person_a_id__in=[p["id"] for p in recent_list],
+                person_b=owner,
+            ).values("person_a_id", "relationship_type__name"):
+                relationships_to_me.setdefault(rel["person_a_id"], rel["relationship_type__name"])
+
+        recent_persons = [
+            {
+                "id": str(person["id"]),
+                "full_name": _full_name(person["first_name"], person["last_name"]),
+                "relationship_to_me": relationships_to_me.get(person["id"]),
+                "created_at": person["created_at"].isoformat(),
+            }
+            for person in recent_list
+        ]
+
+        # Relationship type distribution. Grouping on the foreign key alone
+        # lets Postgres aggregate from its index without joining the types;
+        # the five names are looked up afterwards.
         relationship_stats = list(
-            Relationship.objects.values("relationship_type__name")
-            .annotate(count=Count("id"))
+            Relationship.objects.values("relationship_type_id")
+            .annotate(count=Count("*"))
             .order_by("-count")[:5]
         )
+        type_names = dict(
+            RelationshipType.objects.filter(
+                id__in=[r["relationship_type_id"] for r in relationship_stats]
+            ).values_list("id", "name")
+        )
 
-        return Response({
+        return {
             "stats": {
                 "total_persons": total_persons,
                 "total_relationships": total_relationships,
@@ -194,10 +267,26 @@ class DashboardView(APIView):
             "recent_anecdotes": recent_anecdotes,
             "recent_persons": recent_persons,
             "relationship_distribution": [
-                {"name": r["relationship_type__name"], "count": r["count"]}
+                {"name": type_names[r["relationship_type_id"]], "count": r["count"]}
                 for r in relationship_stats
             ],
-        })
+        }
+
+    @staticmethod
+    def _get_counts():
+        """Return the person, relationship, anecdote and photo totals in one query."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT
+                    (SELECT COUNT(*) FROM {Person._meta.db_table}
+                     WHERE is_active AND NOT is_owner),
+                    (SELECT COUNT(*) FROM {Relationship._meta.db_table}),
+                    (SELECT COUNT(*) FROM {Anecdote._meta.db_table}),
+                    (SELECT COUNT(*) FROM {Photo._meta.db_table})
+                """
+            )
+            return cursor.fetchone()
 
 
 class GlobalSearchView(APIView):
@@ -217,78 +306,50 @@ class GlobalSearchView(APIView):
                 "employments": [],
             })
 
-        # Use PostgreSQL full-text search
-        search_query = SearchQuery(query, search_type="websearch")
-
-        # Search persons
-        person_vector = SearchVector(
-            "first_name", weight="A"
-        ) + SearchVector(
-            "last_name", weight="A"
-        ) + SearchVector(
-            "nickname", weight="A"
-        ) + SearchVector(
-            "notes", weight="B"
-        ) + SearchVector(
-            "met_context", weight="C"
-        )
+        # Use PostgreSQL full-text search against the stored search_vector
+        # columns, so the GIN indexes serve the lookup
+        search_query = self._prefix_search_query(query)
+        if search_query is None:
+            return Response({
+                "persons": [],
+                "anecdotes": [],
+                "employments": [],
+                "query": query,
+            })
 
-        persons = (
-            Person.objects.annotate(
-                search=person_vector,
-                rank=SearchRank(person_vector, search_query),
-            )
-            .filter(
-                Q(search=search_query) | Q(first_name__icontains=query) | Q(last_name__icontains=query) | Q(nickname__icontains=query),
-                is_active=True,
+        # Search persons. A single word also matches inside names ("mit" finds
+        # "Smith"); the trigram indexes on the name columns serve icontains.
+        # Multi-word queries stay on the full-text index alone.
+        person_filter = Q(search_vector=search_query)
+        if len(query.split()) < 2:
+            person_filter |= (
+                Q(first_name__icontains=query)
+                | Q(last_name__icontains=query)
+                | Q(nickname__icontains=query)
             )
+        persons = (
+            Person.objects.filter(person_filter, is_active=True)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .prefetch_related("tags")
             .order_by("-rank")[:20]
         )
 
         person_results = PersonListSerializer(persons, many=True).data
 
         # Search anecdotes
-        anecdote_vector = SearchVector(
-            "title", weight="A"
-        ) + SearchVector(
-            "content", weight="B"
-        ) + SearchVector(
-            "location", weight="C"
-        )
-
         anecdotes = (
-            Anecdote.objects.annotate(
-                search=anecdote_vector,
-                rank=SearchRank(anecdote_vector, search_query),
-            )
-            .filter(
-                Q(search=search_query) | Q(title__icontains=query) | Q(content__icontains=query)
-            )
-            .prefetch_related("persons", "tags")
+            Anecdote.objects.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
+            .prefetch_related("persons__tags", "tags")
             .order_by("-rank")[:20]
         )
 
         anecdote_results = AnecdoteSerializer(anecdotes, many=True).data
 
         # Search employments
-        employment_vector = SearchVector(
-            "company", weight="A"
-        ) + SearchVector(
-            "title", weight="A"
-        ) + SearchVector(
-            "department", weight="B"
-        ) + SearchVector(
-            "description", weight="C"
-        )
-
         employments = (
-            Employment.objects.annotate(
-                search=employment_vector,
-                rank=SearchRank(employment_vector, search_query),
-            )
-            .filter(
-                Q(search=search_query) | Q(company__icontains=query) | Q(title__icontains=query)
-            )
+            Employment.objects.filter(search_vector=search_query)
+            .annotate(rank=SearchRank(F("search_vector"), search_query))
             .select_related("person")
             .order_by("-rank")[:20]
         )
@@ -301,3 +362,17 @@ class GlobalSearchView(APIView):
             "employments": employment_results,
             "query": query,
         })
+
+    @staticmethod
+    def _prefix_search_query(query):
+        """
+        Build a tsquery matching every word of the query as a prefix.
+
+        Prefix matching keeps search-as-you-type working ("Smi" finds "Smith")
+        without falling back to icontains, which cannot use the GIN index.
+        Returns None when the query contains no searchable words.
+        """
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return None
+        return SearchQuery(" & ".join(f"{term}:*" for term in terms), search_type="raw")
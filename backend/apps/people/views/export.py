@@ -4,7 +4,8 @@ Data export views.
 
 from datetime import date
 
-from django.http import HttpResponse
+from django.db import connection
+from django.http import HttpResponse, StreamingHttpResponse
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -12,7 +13,18 @@ from rest_framework.views import APIView
 from apps.core.models import Group, Tag
 
 from ..models import Anecdote, Employment, Person, Photo, Relationship, RelationshipType
-from ..services import export_all_json, export_entity_csv, export_entity_json
+from ..services import export_all_json, export_entity_json, stream_entity_csv
+
+# Exportable entity types and their models, in display order
+EXPORT_MODELS = {
+    "persons": Person,
+    "relationships": Relationship,
+    "relationship_types": RelationshipType,
+    "anecdotes": Anecdote,
+    "photos": Photo,
+    "tags": Tag,
+    "groups": Group,
+}
 
 
 class ExportDataView(APIView):
@@ -66,10 +78,11 @@ class ExportDataView(APIView):
                 return response
 
             else:  # CSV
-                content = export_entity_csv(entity_type)
+                # Streamed so large exports never sit in memory as one string
+                content = stream_entity_csv(entity_type)
                 filename = f"lifegraph_{entity_type}_{date.today().isoformat()}.csv"
 
-                response = HttpResponse(content, content_type="text/csv")
+                response = StreamingHttpResponse(content, content_type="text/csv")
                 response["Content-Disposition"] = f'attachment; filename="{filename}"'
                 return response
 
@@ -101,18 +114,9 @@ class ExportPreviewView(APIView):
         """
         entity_type = request.query_params.get("entity", None)
 
-        counts = {
-            "persons": Person.objects.count(),
-            "relationships": Relationship.objects.count(),
-            "relationship_types": RelationshipType.objects.count(),
-            "anecdotes": Anecdote.objects.count(),
-            "photos": Photo.objects.count(),
-            "tags": Tag.objects.count(),
-            "groups": Group.objects.count(),
-        }
-
         if entity_type:
-            if entity_type not in counts:
+            model = EXPORT_MODELS.get(entity_type)
+            if model is None:
                 return Response(
                     {"detail": f"Unknown entity type: {entity_type}"},
                     status=status.HTTP_400_BAD_REQUEST,
@@ -120,10 +124,12 @@ class ExportPreviewView(APIView):
 
             return Response({
                 "entity_type": entity_type,
-                "count": counts[entity_type],
+                "count": model.objects.count(),
                 "available_formats": ["json", "csv"] if entity_type in ["persons", "relationships", "anecdotes"] else ["json"],
             })
 
+        counts = self._get_counts()
+
         return Response({
             "export_type": "full",
             "counts": counts,
@@ -139,3 +145,15 @@ class ExportPreviewView(APIView):
                 },
             },
         })
+
+    @staticmethod
+    def _get_counts():
+        """Count every exportable entity type in a single query."""
+        subqueries = ", ".join(
+            f"(SELECT COUNT(*) FROM {model._meta.db_table})"
+            for model in EXPORT_MODELS.values()
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT {subqueries}")
+            row = cursor.fetchone()
+        return dict(zip(EXPORT_MODELS, row, strict=True))
@@ -6,7 +6,8 @@ import logging
 
 from auditlog.models import LogEntry
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.db.models import Case, CharField, F, Func, Q, Value, When
+from django.db.models.functions import Lower
 from django.utils.decorators import method_decorator
 from django_filters import rest_framework as filters
 from rest_framework import status, viewsets
@@ -14,8 +15,10 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from apps.core.models import Tag
+from apps.core.pagination import KeysetPagination
 from apps.core.ratelimit import ai_ratelimit
 
+from ..cache import get_owner, get_tag_names
 from ..exceptions import AIServiceError, LinkedInServiceError
 from ..models import Person, Relationship
 from ..serializers import (
@@ -36,6 +39,9 @@ from ..services import (
 
 logger = logging.getLogger(__name__)
 
+# Display labels of audit log actions, as returned by get_action_display()
+LOG_ACTION_LABELS = dict(LogEntry.Action.choices)
+
 
 class PersonFilter(filters.FilterSet):
     """Filter for Person queryset."""
@@ -57,7 +63,11 @@ class PersonFilter(filters.FilterSet):
         fields = ["first_name", "last_name", "name", "tag", "group", "has_birthday", "is_active"]
 
     def filter_by_name(self, queryset, name, value):
-        """Filter by first_name OR last_name containing the value."""
+        """Filter by first_name OR last_name containing the value.
+
+        Both predicates are served by the trigram indexes on UPPER(first_name)
+        and UPPER(last_name), which Postgres combines with a bitmap OR.
+        """
         return queryset.filter(
             Q(first_name__icontains=value) | Q(last_name__icontains=value)
         )
@@ -68,16 +78,32 @@ class PersonViewSet(viewsets.ModelViewSet):
 
     queryset = Person.objects.prefetch_related("tags", "groups").filter(is_active=True, is_owner=False)
     filterset_class = PersonFilter
+    pagination_class = KeysetPagination
     search_fields = ["first_name", "last_name", "nickname", "notes", "met_context"]
-    ordering_fields = ["first_name", "last_name", "birthday", "last_contact", "created_at"]
-    ordering = ["last_name", "first_name"]
+    # The cursor is positioned on the first ordering field alone, and rows
+    # whose value is NULL would drop out of it, so nullable columns such as
+    # birthday and last_contact are not offered here
+    ordering_fields = ["first_name", "last_name", "created_at"]
+    ordering = ["last_name", "first_name", "id"]
+    action_serializer_classes = {
+        "list": PersonListSerializer,
+        "create": PersonCreateUpdateSerializer,
+        "update": PersonCreateUpdateSerializer,
+        "partial_update": PersonCreateUpdateSerializer,
+    }
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "list":
+            # The list serializer renders none of these (mostly encrypted)
+            # columns, so skip transferring and decrypting them
+            queryset = queryset.defer(
+                "notes", "met_context", "addresses", "ai_summary", "search_vector"
+            )
+        return queryset
 
     def get_serializer_class(self):
-        if self.action == "list":
-            return PersonListSerializer
-        if self.action in ["create", "update", "partial_update"]:
-            return PersonCreateUpdateSerializer
-        return PersonDetailSerializer
+        return self.action_serializer_classes.get(self.action, PersonDetailSerializer)
 
     def perform_destroy(self, instance):
         """Soft delete instead of hard delete."""
@@ -93,9 +119,28 @@ class PersonViewSet(viewsets.ModelViewSet):
         as each relationship pair has a canonical direction.
         """
         person = self.get_object()
+        # Both persons are joined in for their names only; loading their
+        # other (mostly encrypted) columns would mean decrypting them per row
         relationships = Relationship.objects.filter(
             person_a=person
-        ).select_related("person_b", "relationship_type")
+        ).select_related("person_a", "person_b", "relationship_type").only(
+            "id",
+            "person_a",
+            "person_b",
+            "relationship_type",
+            "started_date",
+            "notes",
+            "strength",
+            "auto_created",
+            "created_at",
+            "updated_at",
+            "person_a__first_name",
+            "person_a__last_name",
+            "person_b__first_name",
+            "person_b__last_name",
+            "relationship_type__name",
+            "relationship_type__inverse_name",
+        )
 
         serializer = RelationshipSerializer(relationships, many=True)
         return Response(serializer.data)
@@ -104,7 +149,7 @@ class PersonViewSet(viewsets.ModelViewSet):
     def anecdotes(self, request, pk=None):
         """Get all anecdotes for a person."""
         person = self.get_object()
-        anecdotes = person.anecdotes.prefetch_related("tags", "persons").all()
+        anecdotes = person.anecdotes.prefetch_related("tags", "persons__tags").all()
         serializer = AnecdoteSerializer(anecdotes, many=True)
         return Response(serializer.data)
 
@@ -116,7 +161,7 @@ class PersonViewSet(viewsets.ModelViewSet):
         logger.info(f"Generating AI summary for person: {person.full_name}")
 
         # Get owner for relationship context
-        owner = Person.objects.filter(is_owner=True).first()
+        owner = get_owner()
 
         # Build person data for summary generation
         person_data = self._build_person_data(person, owner)
@@ -142,7 +187,8 @@ class PersonViewSet(viewsets.ModelViewSet):
     def photos(self, request, pk=None):
         """Get all photos for a person."""
         person = self.get_object()
-        photos = person.photos.prefetch_related("persons").select_related("anecdote").all()
+        # The anecdote is rendered as its id only, so it is not joined in
+        photos = person.photos.prefetch_related("persons__tags").all()
         serializer = PhotoSerializer(photos, many=True)
         return Response(serializer.data)
 
@@ -162,17 +208,20 @@ class PersonViewSet(viewsets.ModelViewSet):
         entries = LogEntry.objects.filter(
             content_type=content_type,
             object_pk=str(person.pk),
-        ).order_by("-timestamp")[:50]
-
-        history = []
-        for entry in entries:
-            history.append({
-                "id": entry.pk,
-                "action": entry.get_action_display(),
-                "timestamp": entry.timestamp.isoformat(),
-                "actor": entry.actor.username if entry.actor else None,
-                "changes": entry.changes_dict,
-            })
+        ).order_by("-timestamp").values(
+            "id", "action", "timestamp", "actor__username", "changes"
+        )[:50]
+
+        history = [
+            {
+                "id": entry["id"],
+                "action": LOG_ACTION_LABELS.get(entry["action"]),
+                "timestamp": entry["timestamp"].isoformat(),
+                "actor": entry["actor__username"],
+                "changes": entry["changes"] or {},
+            }
+            for entry in entries
+        ]
 
         return Response(history)
 
@@ -184,13 +233,13 @@ class PersonViewSet(viewsets.ModelViewSet):
         logger.info(f"Suggesting tags for person: {person.full_name}")
 
         # Get owner for relationship context
-        owner = Person.objects.filter(is_owner=True).first()
+        owner = get_owner()
 
         # Build person data for tag suggestion
         person_data = self._build_person_data(person, owner)
 
         # Get existing tags
-        existing_tags = list(Tag.objects.values_list("name", flat=True))
+        existing_tags = get_tag_names()
 
         try:
             suggested_tags = suggest_tags_for_person(person_data, existing_tags)
@@ -230,21 +279,35 @@ class PersonViewSet(viewsets.ModelViewSet):
         created_tags = []
         skipped_tags = []
 
-        for tag_name in tag_names:
-            tag_name = tag_name.lower().strip().replace(" ", "-")
-            tag = Tag.objects.filter(name__iexact=tag_name).first()
+        normalized = list(dict.fromkeys(
+            tag_name.lower().strip().replace(" ", "-") for tag_name in tag_names
+        ))
+        # One case-insensitive lookup for every requested name
+        existing = {
+            tag.name_lower: tag
+            for tag in Tag.objects.annotate(name_lower=Lower("name")).filter(
+                name_lower__in=normalized
+            )
+        }
+
+        tags_to_add = []
+        for tag_name in normalized:
+            tag = existing.get(tag_name)
 
             if tag:
-                person.tags.add(tag)
+                tags_to_add.append(tag)
                 applied_tags.append(tag_name)
             elif create_missing:
-                tag = Tag.objects.create(name=tag_name)
-                person.tags.add(tag)
+                # Created one by one so auditlog and the cache signals see them
+                tags_to_add.append(Tag.objects.create(name=tag_name))
                 created_tags.append(tag_name)
                 applied_tags.append(tag_name)
             else:
                 skipped_tags.append(tag_name)
 
+        if tags_to_add:
+            person.tags.add(*tags_to_add)
+
         return Response({
             "applied_tags": applied_tags,
             "created_tags": created_tags,
@@ -307,41 +370,55 @@ class PersonViewSet(viewsets.ModelViewSet):
             "met_context": person.met_context,
         }
 
-        # Get relationship to owner
+        # Relationships with other people, and the one to the owner, in a
+        # single query; the owner row (if any) is sorted first
+        rels = Relationship.objects.filter(person_a=person).values(
+            "person_b_id",
+            "person_b__first_name",
+            "person_b__last_name",
+            "relationship_type__name",
+        )
         if owner:
-            rel = Relationship.objects.filter(
-                person_a=person, person_b=owner
-            ).select_related("relationship_type").first()
-            if rel:
-                profile_data["relationship_to_owner"] = rel.relationship_type.name
-
-        # Get relationships with other people
-        relationships_data = []
-        for rel in Relationship.objects.filter(person_a=person).select_related("person_b", "relationship_type")[:10]:
-            if rel.person_b != owner:
-                relationships_data.append({
-                    "type": rel.relationship_type.name,
-                    "person_name": rel.person_b.full_name,
-                })
-
-        # Get anecdotes
-        anecdotes_data = []
-        for anecdote in person.anecdotes.all()[:10]:
-            anecdotes_data.append({
-                "type": anecdote.anecdote_type,
-                "title": anecdote.title,
-                "content": anecdote.content,
-                "date": anecdote.date.isoformat() if anecdote.date else None,
-            })
+            rels = rels.order_by(
+                Case(When(person_b=owner, then=0), default=1), "-created_at"
+            )
+        rels = list(rels[:11])
+
+        if owner and rels and rels[0]["person_b_id"] == owner.id:
+            profile_data["relationship_to_owner"] = rels.pop(0)["relationship_type__name"]
+
+        relationships_data = [
+            {
+                "type": rel["relationship_type__name"],
+                "person_name": (
+                    f"{rel['person_b__first_name']} {rel['person_b__last_name']}"
+                    if rel["person_b__last_name"]
+                    else rel["person_b__first_name"]
+                ),
+            }
+            for rel in rels[:10]
+        ]
+
+        # Get anecdotes, with dates formatted as ISO strings by Postgres
+        anecdotes_data = [
+            {
+                "type": anecdote["anecdote_type"],
+                "title": anecdote["title"],
+                "content": anecdote["content"],
+                "date": anecdote["date_iso"],
+            }
+            for anecdote in person.anecdotes.annotate(
+                date_iso=Func(
+                    F("date"), Value("YYYY-MM-DD"),
+                    function="to_char", output_field=CharField(),
+                ),
+            ).values("anecdote_type", "title", "content", "date_iso")[:10]
+        ]
 
         # Get employment history
-        employments_data = []
-        for emp in person.employments.all()[:5]:
-            employments_data.append({
-                "company": emp.company,
-                "title": emp.title,
-                "is_current": emp.is_current,
-            })
+        employments_data = list(
+            person.employments.values("company", "title", "is_current")[:5]
+        )
 
         return {
             "profile": profile_data,
@@ -2,14 +2,24 @@
 Relationship-related views.
 """
 
-from django.db.models import Q
+from itertools import chain
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.functions import Greatest, Least
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets
-from rest_framework.response import Response
 from rest_framework.views import APIView
 
+import orjson
+
+from ..cache import GRAPH_LEGEND_CACHE_KEY, GRAPH_LEGEND_CACHE_TIMEOUT
 from ..models import Person, Relationship, RelationshipType
 from ..serializers import RelationshipSerializer, RelationshipTypeSerializer
 
+# Rows fetched per database round-trip when streaming the graph
+GRAPH_CHUNK_SIZE = 1000
+
 
 class RelationshipTypeViewSet(viewsets.ModelViewSet):
     """ViewSet for RelationshipType CRUD operations."""
@@ -56,9 +66,7 @@ class RelationshipGraphView(APIView):
         persons_qs = Person.objects.filter(is_active=True)
 
         # Get all relationships with optional category filter
-        relationships_qs = Relationship.objects.select_related(
-            "person_a", "person_b", "relationship_type"
-        ).filter(
+        relationships_qs = Relationship.objects.filter(
             person_a__is_active=True,
             person_b__is_active=True,
         )
@@ -71,25 +79,7 @@ class RelationshipGraphView(APIView):
         # If centering on a person, limit graph scope
         if center_id:
             # Get persons within N degrees of separation
-            connected_ids = set([center_id])
-            current_layer = set([center_id])
-
-            for _ in range(depth):
-                next_layer = set()
-                layer_rels = Relationship.objects.filter(
-                    Q(person_a_id__in=current_layer) | Q(person_b_id__in=current_layer)
-                ).values_list("person_a_id", "person_b_id")
-
-                for a_id, b_id in layer_rels:
-                    next_layer.add(str(a_id))
-                    next_layer.add(str(b_id))
-
-                next_layer -= connected_ids
-                connected_ids |= next_layer
-                current_layer = next_layer
-
-                if not current_layer:
-                    break
+            connected_ids = self._connected_ids(center_id, depth)
 
             # Filter to only connected persons
             persons_qs = persons_qs.filter(id__in=connected_ids)
@@ -98,46 +88,100 @@ class RelationshipGraphView(APIView):
                 person_b_id__in=connected_ids,
             )
 
-        # Build nodes
-        nodes = []
-        for person in persons_qs:
-            nodes.append({
-                "id": str(person.id),
-                "label": person.full_name,
-                "first_name": person.first_name,
-                "last_name": person.last_name,
-                "avatar": person.avatar if person.avatar else None,
-                "is_owner": person.is_owner,
-            })
-
-        # Build edges (only include one direction for symmetric relationships)
-        edges = []
-        seen_pairs = set()
-
-        for rel in relationships_qs:
-            pair_key = tuple(sorted([str(rel.person_a_id), str(rel.person_b_id)]))
-            rel_type = rel.relationship_type
-
-            # For symmetric relationships, only include once
-            if rel_type.is_symmetric:
-                if pair_key in seen_pairs:
-                    continue
-                seen_pairs.add(pair_key)
-
-            edges.append({
-                "id": str(rel.id),
-                "source": str(rel.person_a_id),
-                "target": str(rel.person_b_id),
-                "type": rel_type.name,
-                "type_name": rel_type.name,
-                "inverse_name": rel_type.inverse_name,
-                "category": rel_type.category,
-                "strength": rel.strength or 3,
-                "is_symmetric": rel_type.is_symmetric,
-            })
-
-        # Get relationship types for legend
-        rel_types = RelationshipType.objects.all()
+        # Build nodes from plain rows; no model instances are needed
+        avatar_storage = Person._meta.get_field("avatar").storage
+        nodes = (
+            {
+                "id": str(person["id"]),
+                "label": (
+                    f"{person['first_name']} {person['last_name']}"
+                    if person["last_name"]
+                    else person["first_name"]
+                ),
+                "first_name": person["first_name"],
+                "last_name": person["last_name"],
+                "avatar": avatar_storage.url(person["avatar"]) if person["avatar"] else None,
+                "is_owner": person["is_owner"],
+            }
+            for person in persons_qs.values(
+                "id", "first_name", "last_name", "avatar", "is_owner"
+            ).iterator(chunk_size=GRAPH_CHUNK_SIZE)
+        )
+
+        # Build edges. A symmetric relationship exists in both directions, so
+        # Postgres keeps only the newest row per unordered pair of persons.
+        edge_fields = (
+            "id",
+            "person_a_id",
+            "person_b_id",
+            "strength",
+            "relationship_type__name",
+            "relationship_type__inverse_name",
+            "relationship_type__category",
+            "relationship_type__is_symmetric",
+        )
+        symmetric_rels = (
+            relationships_qs.filter(relationship_type__is_symmetric=True)
+            .annotate(
+                low_id=Least("person_a_id", "person_b_id"),
+                high_id=Greatest("person_a_id", "person_b_id"),
+            )
+            .order_by("low_id", "high_id", "-created_at")
+            .distinct("low_id", "high_id")
+            # DISTINCT ON needs the pair annotations to stay selected
+            .values(*edge_fields, "low_id", "high_id")
+        )
+        asymmetric_rels = relationships_qs.filter(
+            relationship_type__is_symmetric=False
+        ).values(*edge_fields)
+
+        edges = (
+            {
+                "id": str(rel["id"]),
+                "source": str(rel["person_a_id"]),
+                "target": str(rel["person_b_id"]),
+                "type": rel["relationship_type__name"],
+                "type_name": rel["relationship_type__name"],
+                "inverse_name": rel["relationship_type__inverse_name"],
+                "category": rel["relationship_type__category"],
+                "strength": rel["strength"] or 3,
+                "is_symmetric": rel["relationship_type__is_symmetric"],
+            }
+            for rel in chain(
+                symmetric_rels.iterator(chunk_size=GRAPH_CHUNK_SIZE),
+                asymmetric_rels.iterator(chunk_size=GRAPH_CHUNK_SIZE),
+            )
+        )
+
+        # Relationship types for the legend rarely change, so they are cached
+        relationship_types = cache.get_or_set(
+            GRAPH_LEGEND_CACHE_KEY,
+            self._build_relationship_types,
+            timeout=GRAPH_LEGEND_CACHE_TIMEOUT,
+        )
+
+        # Nodes and edges are encoded while rows are read from the database,
+        # so large graphs are never held in memory as a whole
+        return StreamingHttpResponse(
+            self._stream_graph(nodes, edges, relationship_types, center_id),
+            content_type="application/json",
+        )
+
+    @staticmethod
+    def _stream_graph(nodes, edges, relationship_types, center_id):
+        """Yield the graph payload as JSON, one node or edge at a time."""
+        yield b'{"nodes":['
+        for index, node in enumerate(nodes):
+            yield (b"," if index else b"") + orjson.dumps(node)
+        yield b'],"edges":['
+        for index, edge in enumerate(edges):
+            yield (b"," if index else b"") + orjson.dumps(edge)
+        yield b'],"relationship_types":' + orjson.dumps(relationship_types)
+        yield b',"center_person_id":' + orjson.dumps(center_id) + b"}"
+
+    @staticmethod
+    def _build_relationship_types():
+        """Return the legend entries for every relationship type."""
         type_colors = {
             "family": "#ef4444",      # red
             "professional": "#3b82f6", # blue
@@ -145,18 +189,41 @@ class RelationshipGraphView(APIView):
             "custom": "#a855f7",       # purple
         }
 
-        relationship_types = []
-        for rt in rel_types:
-            relationship_types.append({
-                "name": rt.name,
-                "category": rt.category,
-                "color": type_colors.get(rt.category, "#6b7280"),
-                "is_symmetric": rt.is_symmetric,
-            })
-
-        return Response({
-            "nodes": nodes,
-            "edges": edges,
-            "relationship_types": relationship_types,
-            "center_person_id": center_id,
-        })
+        return [
+            {
+                "name": rt["name"],
+                "category": rt["category"],
+                "color": type_colors.get(rt["category"], "#6b7280"),
+                "is_symmetric": rt["is_symmetric"],
+            }
+            for rt in RelationshipType.objects.values("name", "category", "is_symmetric")
+        ]
+
+    @staticmethod
+    def _connected_ids(center_id, depth):
+        """
+        Return the ids of persons within `depth` hops of the center person.
+
+        The neighborhood is expanded breadth-first in a single query, following
+        relationships in either direction. Each level only keeps persons not
+        reached by an earlier one, so every person is expanded once, at its
+        shortest distance, however many paths lead to it.
+        """
+        table = Relationship._meta.db_table
+        neighbor = "CASE WHEN r.person_a_id = f.id THEN r.person_b_id ELSE r.person_a_id END"
+        levels = ["level0 AS (SELECT %s::uuid AS id)"]
+        for n in range(1, depth + 1):
+            seen = " UNION ALL ".join(f"SELECT id FROM level{i}" for i in range(n))
+            levels.append(
+                f"""level{n} AS (
+                    SELECT DISTINCT {neighbor} AS id
+                    FROM {table} r
+                    JOIN level{n - 1} f ON f.id IN (r.person_a_id, r.person_b_id)
+                    WHERE {neighbor} NOT IN ({seen})
+                )"""
+            )
+        reached = " UNION ALL ".join(f"SELECT id FROM level{i}" for i in range(depth + 1))
+
+        with connection.cursor() as cursor:
+            cursor.execute(f"WITH {', '.join(levels)} {reached}", [center_id])
+            return {row[0] for row in cursor.fetchall()}
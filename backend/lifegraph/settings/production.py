@@ -13,6 +13,12 @@ DATABASES = {
     "default": env.db("DATABASE_URL")  # noqa: F405
 }
 
+# Keep connections open across requests instead of reconnecting every time.
+# Each gunicorn thread and Celery worker holds at most one connection; stale
+# ones are detected by the health check before reuse.
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=60)  # noqa: F405
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+
 # Add CSP middleware for production
 MIDDLEWARE.insert(  # noqa: F405
     MIDDLEWARE.index("django.middleware.security.SecurityMiddleware") + 1,  # noqa: F405
@@ -5,29 +5,55 @@ URL configuration for LifeGraph project.
 from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+
+
+def lazy_view(dotted_path, **initkwargs):
+    """
+    Return a view that imports and builds a class-based view on first use.
+
+    Keeps heavy, rarely requested views (the API docs) from being imported
+    whenever the URLconf is loaded, e.g. by system checks in manage.py.
+    """
+    view = None
+
+    @csrf_exempt
+    def dispatch(request, *args, **kwargs):
+        nonlocal view
+        if view is None:
+            view = import_string(dotted_path).as_view(**initkwargs)
+        return view(request, *args, **kwargs)
+
+    return dispatch
+
 
 urlpatterns = [
     path("admin/", admin.site.urls),
-    # API v1
-    path("api/v1/", include("apps.core.urls")),
-    path("api/v1/", include("apps.people.urls")),
+    # API v1: one prefix match, then the app URLconfs in order
+    path(
+        "api/v1/",
+        include([
+            path("", include("apps.core.urls")),
+            path("", include("apps.people.urls")),
+        ]),
+    ),
     # Authentication
     path("accounts/", include("allauth.urls")),
     # API Documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path(
+        "api/schema/",
+        lazy_view("drf_spectacular.views.SpectacularAPIView"),
+        name="schema",
+    ),
     path(
         "api/docs/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
+        lazy_view("drf_spectacular.views.SpectacularSwaggerView", url_name="schema"),
         name="swagger-ui",
     ),
     path(
         "api/redoc/",
-        SpectacularRedocView.as_view(url_name="schema"),
+        lazy_view("drf_spectacular.views.SpectacularRedocView", url_name="schema"),
         name="redoc",
     ),
 ]
@@ -36,9 +62,7 @@ urlpatterns = [
 if settings.DEBUG:
     import debug_toolbar
 
-    urlpatterns = [
-        path("__debug__/", include(debug_toolbar.urls)),
-    ] + urlpatterns
+    urlpatterns.insert(0, path("__debug__/", include(debug_toolbar.urls)))
 
 # Admin site customization
 admin.site.site_header = "LifeGraph Administration"
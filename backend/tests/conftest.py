@@ -3,13 +3,30 @@ Pytest configuration and shared fixtures for LifeGraph tests.
 """
 
 import os
+import shutil
+from io import BytesIO
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import override_settings
+from PIL import Image
 from rest_framework.test import APIClient
 
+from tests.factories import (
+    AnecdoteFactory,
+    CustomFieldDefinitionFactory,
+    EmploymentFactory,
+    GroupFactory,
+    PersonFactory,
+    PhotoFactory,
+    RelationshipFactory,
+    RelationshipTypeFactory,
+    TagFactory,
+)
+
 # Set up Django settings before any imports
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "lifegraph.settings.development")
 
@@ -23,6 +40,25 @@ def django_db_setup():
     pass
 
 
+@pytest.fixture(scope="session", autouse=True)
+def cleanup_media_root():
+    """Remove the temporary media directory once the test session ends."""
+    from django.conf import settings
+
+    yield
+    shutil.rmtree(settings.MEDIA_ROOT, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear the cache between tests so cached payloads never leak across them."""
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     """Return an unauthenticated API client."""
@@ -73,42 +109,36 @@ def admin_client(api_client, admin_user):
 @pytest.fixture
 def tag(db):
     """Create a test tag."""
-    from tests.factories import TagFactory
     return TagFactory()
 
 
 @pytest.fixture
 def group(db):
     """Create a test group."""
-    from tests.factories import GroupFactory
     return GroupFactory()
 
 
 @pytest.fixture
 def person(db):
     """Create a test person."""
-    from tests.factories import PersonFactory
     return PersonFactory()
 
 
 @pytest.fixture
 def owner_person(db):
     """Create the owner person (is_owner=True)."""
-    from tests.factories import PersonFactory
     return PersonFactory(is_owner=True, first_name="Owner", last_name="User")
 
 
 @pytest.fixture
 def relationship_type(db):
     """Create a test relationship type."""
-    from tests.factories import RelationshipTypeFactory
     return RelationshipTypeFactory()
 
 
 @pytest.fixture
 def symmetric_relationship_type(db):
     """Create a symmetric relationship type."""
-    from tests.factories import RelationshipTypeFactory
     return RelationshipTypeFactory(
         name="friend",
         inverse_name="friend",
@@ -119,7 +149,6 @@ def symmetric_relationship_type(db):
 @pytest.fixture
 def relationship(db, person, relationship_type):
     """Create a test relationship."""
-    from tests.factories import PersonFactory, RelationshipFactory
     other_person = PersonFactory()
     return RelationshipFactory(
         person_a=person,
@@ -131,7 +160,6 @@ def relationship(db, person, relationship_type):
 @pytest.fixture
 def anecdote(db, person):
     """Create a test anecdote."""
-    from tests.factories import AnecdoteFactory
     anecdote = AnecdoteFactory()
     anecdote.persons.add(person)
     return anecdote
@@ -140,21 +168,18 @@ def anecdote(db, person):
 @pytest.fixture
 def photo(db):
     """Create a test photo."""
-    from tests.factories import PhotoFactory
     return PhotoFactory()
 
 
 @pytest.fixture
 def employment(db, person):
     """Create a test employment record."""
-    from tests.factories import EmploymentFactory
     return EmploymentFactory(person=person)
 
 
 @pytest.fixture
 def custom_field_definition(db):
     """Create a custom field definition."""
-    from tests.factories import CustomFieldDefinitionFactory
     return CustomFieldDefinitionFactory()
 
 
@@ -163,61 +188,60 @@ def custom_field_definition(db):
 # =============================================================================
 
 
+def _fake_openai_client(content):
+    """
+    Build a stand-in OpenAI client whose completions return `content`.
+
+    Only `chat.completions.create` is a mock, so tests can still set its
+    `side_effect` or inspect calls; the rest is plain namespaces.
+    """
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))]
+    )
+    return SimpleNamespace(
+        chat=SimpleNamespace(
+            completions=SimpleNamespace(create=MagicMock(return_value=response))
+        )
+    )
+
+
 @pytest.fixture
 def mock_openai():
     """Mock OpenAI client for AI service tests."""
-    with patch("apps.people.services.ai_parser.get_openai_client") as mock:
-        client = MagicMock()
-        mock.return_value = client
-
-        # Default mock response
-        response = MagicMock()
-        response.choices = [MagicMock()]
-        response.choices[0].message.content = '{"result": "mocked"}'
-        client.chat.completions.create.return_value = response
-
+    client = _fake_openai_client('{"result": "mocked"}')
+    with patch("apps.people.services.ai_parser.get_openai_client", return_value=client):
         yield client
 
 
 @pytest.fixture
 def mock_linkedin():
     """Mock LinkedIn client for LinkedIn service tests."""
-    with patch("apps.people.services.linkedin.get_linkedin_client") as mock:
-        client = MagicMock()
-        mock.return_value = client
-
-        # Default mock profile response
-        client.get_profile.return_value = {
-            "firstName": "John",
-            "lastName": "Doe",
-            "headline": "Software Engineer at TechCorp",
-            "summary": "Experienced developer",
-            "experience": [
-                {
-                    "companyName": "TechCorp",
-                    "title": "Software Engineer",
-                    "timePeriod": {
-                        "startDate": {"year": 2020, "month": 1},
-                    },
-                }
-            ],
-        }
-
+    # Default mock profile response
+    profile = {
+        "firstName": "John",
+        "lastName": "Doe",
+        "headline": "Software Engineer at TechCorp",
+        "summary": "Experienced developer",
+        "experience": [
+            {
+                "companyName": "TechCorp",
+                "title": "Software Engineer",
+                "timePeriod": {
+                    "startDate": {"year": 2020, "month": 1},
+                },
+            }
+        ],
+    }
+    client = SimpleNamespace(get_profile=MagicMock(return_value=profile))
+    with patch("apps.people.services.linkedin.get_linkedin_client", return_value=client):
         yield client
 
 
 @pytest.fixture
 def mock_openai_vision():
     """Mock OpenAI Vision API for photo description tests."""
-    with patch("apps.people.services.ai_parser.get_openai_client") as mock:
-        client = MagicMock()
-        mock.return_value = client
-
-        response = MagicMock()
-        response.choices = [MagicMock()]
-        response.choices[0].message.content = "A scenic photo of a group of friends."
-        client.chat.completions.create.return_value = response
-
+    client = _fake_openai_client("A scenic photo of a group of friends.")
+    with patch("apps.people.services.ai_parser.get_openai_client", return_value=client):
         yield client
 
 
@@ -228,11 +252,9 @@ def mock_openai_vision():
 
 @pytest.fixture
 def with_encryption(settings):
-    """Enable encryption for tests."""
-    from cryptography.fernet import Fernet
-    key = Fernet.generate_key().decode()
-    settings.FERNET_KEYS = [key]
-    return key
+    """Enable encryption for tests, reusing the module-level test key."""
+    settings.FERNET_KEYS = [TEST_FERNET_KEY]
+    return TEST_FERNET_KEY
 
 
 @pytest.fixture
@@ -249,7 +271,6 @@ def without_rate_limit(settings):
 @pytest.fixture
 def sample_persons(db):
     """Create multiple test persons for list/search tests."""
-    from tests.factories import PersonFactory
     return [
         PersonFactory(first_name="Alice", last_name="Smith"),
         PersonFactory(first_name="Bob", last_name="Johnson"),
@@ -262,8 +283,6 @@ def sample_persons(db):
 @pytest.fixture
 def person_with_relationships(db, person, symmetric_relationship_type):
     """Create a person with multiple relationships."""
-    from tests.factories import PersonFactory, RelationshipFactory
-
     friends = [PersonFactory() for _ in range(3)]
     for friend in friends:
         RelationshipFactory(
@@ -278,8 +297,6 @@ def person_with_relationships(db, person, symmetric_relationship_type):
 @pytest.fixture
 def person_with_anecdotes(db, person):
     """Create a person with multiple anecdotes."""
-    from tests.factories import AnecdoteFactory
-
     anecdotes = [AnecdoteFactory() for _ in range(5)]
     for anecdote in anecdotes:
         anecdote.persons.add(person)
@@ -292,22 +309,21 @@ def person_with_anecdotes(db, person):
 # =============================================================================
 
 
-@pytest.fixture
-def sample_image():
-    """Create a sample image file for upload tests."""
-    from io import BytesIO
-    from PIL import Image
-    from django.core.files.uploadedfile import SimpleUploadedFile
-
-    # Create a simple test image
+@pytest.fixture(scope="session")
+def sample_image_bytes():
+    """Encode a simple test JPEG once per test session."""
     image = Image.new("RGB", (100, 100), color="red")
     buffer = BytesIO()
     image.save(buffer, format="JPEG")
-    buffer.seek(0)
+    return buffer.getvalue()
 
+
+@pytest.fixture
+def sample_image(sample_image_bytes):
+    """Create a sample image file for upload tests."""
     return SimpleUploadedFile(
         name="test_image.jpg",
-        content=buffer.read(),
+        content=sample_image_bytes,
         content_type="image/jpeg",
     )
 
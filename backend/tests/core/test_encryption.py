@@ -3,7 +3,6 @@ Tests for encryption utilities and encrypted fields.
 """
 
 import pytest
-from cryptography.fernet import Fernet
 
 from apps.core.encryption import (
     EncryptedEmailField,
@@ -22,14 +21,13 @@ from apps.core.encryption import (
 class TestGetEncryptionKey:
     """Tests for get_encryption_key function."""
 
-    def test_returns_key_when_configured(self, settings):
+    def test_returns_key_when_configured(self, settings, with_encryption):
         """Test that get_encryption_key returns the configured key."""
-        test_key = Fernet.generate_key().decode()
-        settings.SALT_KEY = test_key
+        settings.SALT_KEY = with_encryption
 
         result = get_encryption_key()
 
-        assert result == test_key
+        assert result == with_encryption
 
     def test_raises_when_not_configured(self, settings):
         """Test that missing SALT_KEY raises ValueError."""
@@ -49,10 +47,9 @@ class TestGetEncryptionKey:
 class TestValidateEncryptionConfig:
     """Tests for validate_encryption_config function."""
 
-    def test_valid_config_returns_true(self, settings):
+    def test_valid_config_returns_true(self, settings, with_encryption):
         """Test that valid configuration returns (True, message)."""
-        test_key = Fernet.generate_key().decode()
-        settings.SALT_KEY = test_key
+        settings.SALT_KEY = with_encryption
 
         is_valid, message = validate_encryption_config()
 
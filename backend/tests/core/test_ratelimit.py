@@ -2,12 +2,12 @@
 Tests for rate limiting utilities.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from django.contrib.auth.models import AnonymousUser
 from django.http import JsonResponse
-from django.test import RequestFactory, override_settings
+from django.test import override_settings
 from rest_framework import status, viewsets
 from rest_framework.response import Response
 from rest_framework.test import APIRequestFactory
@@ -23,6 +23,14 @@ from apps.core.ratelimit import (
 )
 
 
+@pytest.fixture
+def mock_ratelimit(monkeypatch):
+    """Replace django-ratelimit's decorator with a recording no-op."""
+    mock = MagicMock(return_value=lambda f: f)
+    monkeypatch.setattr("apps.core.ratelimit.ratelimit", mock)
+    return mock
+
+
 # =============================================================================
 # get_client_ip Tests
 # =============================================================================
@@ -31,18 +39,18 @@ from apps.core.ratelimit import (
 class TestGetClientIP:
     """Tests for get_client_ip function."""
 
-    def test_returns_remote_addr_when_no_forwarded_header(self):
+    def test_returns_remote_addr_when_no_forwarded_header(self, rf):
         """Test that REMOTE_ADDR is used when X-Forwarded-For is not present."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.META["REMOTE_ADDR"] = "192.168.1.100"
 
         result = get_client_ip(request)
 
         assert result == "192.168.1.100"
 
-    def test_returns_first_ip_from_forwarded_header(self):
+    def test_returns_first_ip_from_forwarded_header(self, rf):
         """Test that first IP from X-Forwarded-For is used."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.META["HTTP_X_FORWARDED_FOR"] = "10.0.0.1, 10.0.0.2, 10.0.0.3"
         request.META["REMOTE_ADDR"] = "192.168.1.100"
 
@@ -50,36 +58,36 @@ class TestGetClientIP:
 
         assert result == "10.0.0.1"
 
-    def test_strips_whitespace_from_forwarded_ip(self):
+    def test_strips_whitespace_from_forwarded_ip(self, rf):
         """Test that whitespace is stripped from forwarded IP."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.META["HTTP_X_FORWARDED_FOR"] = "  10.0.0.1  , 10.0.0.2"
 
         result = get_client_ip(request)
 
         assert result == "10.0.0.1"
 
-    def test_handles_single_ip_in_forwarded_header(self):
+    def test_handles_single_ip_in_forwarded_header(self, rf):
         """Test handling of single IP in X-Forwarded-For."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.META["HTTP_X_FORWARDED_FOR"] = "10.0.0.1"
 
         result = get_client_ip(request)
 
         assert result == "10.0.0.1"
 
-    def test_handles_ipv6_address(self):
+    def test_handles_ipv6_address(self, rf):
         """Test handling of IPv6 addresses."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.META["REMOTE_ADDR"] = "::1"
 
         result = get_client_ip(request)
 
         assert result == "::1"
 
-    def test_returns_none_when_no_ip_available(self):
+    def test_returns_none_when_no_ip_available(self, rf):
         """Test behavior when no IP is available."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.META.pop("REMOTE_ADDR", None)
 
         result = get_client_ip(request)
@@ -95,9 +103,9 @@ class TestGetClientIP:
 class TestRatelimitKey:
     """Tests for ratelimit_key function."""
 
-    def test_returns_user_key_for_authenticated_user(self, user):
+    def test_returns_user_key_for_authenticated_user(self, rf, user):
         """Test that authenticated users get user-based key."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.user = user
         request.META["REMOTE_ADDR"] = "192.168.1.100"
 
@@ -105,9 +113,9 @@ class TestRatelimitKey:
 
         assert result == f"user:{user.id}"
 
-    def test_returns_ip_key_for_anonymous_user(self):
+    def test_returns_ip_key_for_anonymous_user(self, rf):
         """Test that anonymous users get IP-based key."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.user = AnonymousUser()
         request.META["REMOTE_ADDR"] = "192.168.1.100"
 
@@ -115,9 +123,9 @@ class TestRatelimitKey:
 
         assert result == "ip:192.168.1.100"
 
-    def test_uses_forwarded_ip_for_anonymous(self):
+    def test_uses_forwarded_ip_for_anonymous(self, rf):
         """Test that X-Forwarded-For is used for anonymous users."""
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         request.user = AnonymousUser()
         request.META["HTTP_X_FORWARDED_FOR"] = "10.0.0.1, 10.0.0.2"
         request.META["REMOTE_ADDR"] = "192.168.1.100"
@@ -136,14 +144,14 @@ class TestApiRatelimit:
     """Tests for api_ratelimit decorator."""
 
     @override_settings(RATELIMIT_ENABLE=False)
-    def test_passthrough_when_disabled(self):
+    def test_passthrough_when_disabled(self, rf):
         """Test that decorator is a passthrough when rate limiting is disabled."""
 
         @api_ratelimit()
         def test_view(request):
             return "success"
 
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         result = test_view(request)
 
         assert result == "success"
@@ -161,44 +169,35 @@ class TestApiRatelimit:
         assert decorated is original_view
 
     @override_settings(RATELIMIT_ENABLE=True, RATELIMIT_API_DEFAULT="100/m")
-    def test_uses_default_rate_from_settings(self):
+    def test_uses_default_rate_from_settings(self, mock_ratelimit):
         """Test that default rate is taken from settings."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @api_ratelimit()
-            def test_view(request):
-                return "success"
+        @api_ratelimit()
+        def test_view(request):
+            return "success"
 
-            mock_ratelimit.assert_called_once()
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["rate"] == "100/m"
+        mock_ratelimit.assert_called_once()
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["rate"] == "100/m"
 
     @override_settings(RATELIMIT_ENABLE=True)
-    def test_custom_rate_overrides_default(self):
+    def test_custom_rate_overrides_default(self, mock_ratelimit):
         """Test that custom rate overrides the default."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @api_ratelimit(rate="50/m")
-            def test_view(request):
-                return "success"
+        @api_ratelimit(rate="50/m")
+        def test_view(request):
+            return "success"
 
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["rate"] == "50/m"
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["rate"] == "50/m"
 
     @override_settings(RATELIMIT_ENABLE=True)
-    def test_block_parameter_passed_through(self):
+    def test_block_parameter_passed_through(self, mock_ratelimit):
         """Test that block parameter is passed to underlying decorator."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @api_ratelimit(block=False)
-            def test_view(request):
-                return "success"
+        @api_ratelimit(block=False)
+        def test_view(request):
+            return "success"
 
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["block"] is False
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["block"] is False
 
 
 # =============================================================================
@@ -210,43 +209,37 @@ class TestAiRatelimit:
     """Tests for ai_ratelimit decorator."""
 
     @override_settings(RATELIMIT_ENABLE=False)
-    def test_passthrough_when_disabled(self):
+    def test_passthrough_when_disabled(self, rf):
         """Test that decorator is a passthrough when rate limiting is disabled."""
 
         @ai_ratelimit()
         def test_view(request):
             return "success"
 
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         result = test_view(request)
 
         assert result == "success"
 
     @override_settings(RATELIMIT_ENABLE=True, RATELIMIT_API_AI="10/m")
-    def test_uses_ai_rate_from_settings(self):
+    def test_uses_ai_rate_from_settings(self, mock_ratelimit):
         """Test that AI rate is taken from settings."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @ai_ratelimit()
-            def test_view(request):
-                return "success"
+        @ai_ratelimit()
+        def test_view(request):
+            return "success"
 
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["rate"] == "10/m"
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["rate"] == "10/m"
 
     @override_settings(RATELIMIT_ENABLE=True)
-    def test_custom_rate_overrides_default(self):
+    def test_custom_rate_overrides_default(self, mock_ratelimit):
         """Test that custom rate overrides the default."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @ai_ratelimit(rate="5/m")
-            def test_view(request):
-                return "success"
+        @ai_ratelimit(rate="5/m")
+        def test_view(request):
+            return "success"
 
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["rate"] == "5/m"
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["rate"] == "5/m"
 
 
 # =============================================================================
@@ -258,43 +251,37 @@ class TestUploadRatelimit:
     """Tests for upload_ratelimit decorator."""
 
     @override_settings(RATELIMIT_ENABLE=False)
-    def test_passthrough_when_disabled(self):
+    def test_passthrough_when_disabled(self, rf):
         """Test that decorator is a passthrough when rate limiting is disabled."""
 
         @upload_ratelimit()
         def test_view(request):
             return "success"
 
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         result = test_view(request)
 
         assert result == "success"
 
     @override_settings(RATELIMIT_ENABLE=True, RATELIMIT_API_UPLOAD="20/m")
-    def test_uses_upload_rate_from_settings(self):
+    def test_uses_upload_rate_from_settings(self, mock_ratelimit):
         """Test that upload rate is taken from settings."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @upload_ratelimit()
-            def test_view(request):
-                return "success"
+        @upload_ratelimit()
+        def test_view(request):
+            return "success"
 
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["rate"] == "20/m"
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["rate"] == "20/m"
 
     @override_settings(RATELIMIT_ENABLE=True)
-    def test_custom_rate_overrides_default(self):
+    def test_custom_rate_overrides_default(self, mock_ratelimit):
         """Test that custom rate overrides the default."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @upload_ratelimit(rate="10/m")
-            def test_view(request):
-                return "success"
+        @upload_ratelimit(rate="10/m")
+        def test_view(request):
+            return "success"
 
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["rate"] == "10/m"
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["rate"] == "10/m"
 
 
 # =============================================================================
@@ -306,66 +293,57 @@ class TestLoginRatelimit:
     """Tests for login_ratelimit decorator."""
 
     @override_settings(RATELIMIT_ENABLE=False)
-    def test_passthrough_when_disabled(self):
+    def test_passthrough_when_disabled(self, rf):
         """Test that decorator is a passthrough when rate limiting is disabled."""
 
         @login_ratelimit()
         def test_view(request):
             return "success"
 
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         result = test_view(request)
 
         assert result == "success"
 
     @override_settings(RATELIMIT_ENABLE=True, RATELIMIT_LOGIN="5/m")
-    def test_uses_login_rate_from_settings(self):
+    def test_uses_login_rate_from_settings(self, mock_ratelimit):
         """Test that login rate is taken from settings."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @login_ratelimit()
-            def test_view(request):
-                return "success"
+        @login_ratelimit()
+        def test_view(request):
+            return "success"
 
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["rate"] == "5/m"
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["rate"] == "5/m"
 
     @override_settings(RATELIMIT_ENABLE=True)
-    def test_uses_ip_based_key_by_default(self):
+    def test_uses_ip_based_key_by_default(self, mock_ratelimit, rf):
         """Test that login rate limiting uses IP-based key by default."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
-
-            @login_ratelimit()
-            def test_view(request):
-                return "success"
+        @login_ratelimit()
+        def test_view(request):
+            return "success"
 
-            # The key function should be provided
-            call_kwargs = mock_ratelimit.call_args[1]
-            key_func = call_kwargs["key"]
+        # The key function should be provided
+        call_kwargs = mock_ratelimit.call_args[1]
+        key_func = call_kwargs["key"]
 
-            # Test the key function
-            request = RequestFactory().get("/")
-            request.META["REMOTE_ADDR"] = "192.168.1.100"
-            key = key_func("test_group", request)
+        # Test the key function
+        request = rf.get("/")
+        request.META["REMOTE_ADDR"] = "192.168.1.100"
+        key = key_func("test_group", request)
 
-            assert key == "login_ip:192.168.1.100"
+        assert key == "login_ip:192.168.1.100"
 
     @override_settings(RATELIMIT_ENABLE=True)
-    def test_custom_key_overrides_default(self):
+    def test_custom_key_overrides_default(self, mock_ratelimit):
         """Test that custom key function overrides the IP-based key."""
-        with patch("apps.core.ratelimit.ratelimit") as mock_ratelimit:
-            mock_ratelimit.return_value = lambda f: f
+        custom_key = lambda g, r: "custom_key"
 
-            custom_key = lambda g, r: "custom_key"
-
-            @login_ratelimit(key=custom_key)
-            def test_view(request):
-                return "success"
+        @login_ratelimit(key=custom_key)
+        def test_view(request):
+            return "success"
 
-            call_kwargs = mock_ratelimit.call_args[1]
-            assert call_kwargs["key"] is custom_key
+        call_kwargs = mock_ratelimit.call_args[1]
+        assert call_kwargs["key"] is custom_key
 
 
 # =============================================================================
@@ -492,7 +470,7 @@ class TestRateLimitIntegration:
 
         assert settings.RATELIMIT_ENABLE is False
 
-    def test_decorator_chain_with_multiple_decorators(self):
+    def test_decorator_chain_with_multiple_decorators(self, rf):
         """Test that rate limit decorator works with other decorators."""
 
         def other_decorator(func):
@@ -507,42 +485,38 @@ class TestRateLimitIntegration:
         def decorated_view(request):
             return "success"
 
-        request = RequestFactory().get("/")
+        request = rf.get("/")
         result = decorated_view(request)
 
         assert result == "wrapped:success"
 
-    def test_get_client_ip_with_various_proxy_configs(self):
+    def test_get_client_ip_with_various_proxy_configs(self, rf):
         """Test IP extraction with various proxy configurations."""
-        factory = RequestFactory()
-
         # No proxy
-        request1 = factory.get("/")
+        request1 = rf.get("/")
         request1.META["REMOTE_ADDR"] = "direct-client"
         assert get_client_ip(request1) == "direct-client"
 
         # Single proxy
-        request2 = factory.get("/")
+        request2 = rf.get("/")
         request2.META["HTTP_X_FORWARDED_FOR"] = "original-client"
         request2.META["REMOTE_ADDR"] = "proxy"
         assert get_client_ip(request2) == "original-client"
 
         # Multiple proxies
-        request3 = factory.get("/")
+        request3 = rf.get("/")
         request3.META["HTTP_X_FORWARDED_FOR"] = "original, proxy1, proxy2"
         request3.META["REMOTE_ADDR"] = "loadbalancer"
         assert get_client_ip(request3) == "original"
 
-    def test_ratelimit_key_consistency(self, user):
+    def test_ratelimit_key_consistency(self, rf, user):
         """Test that rate limit key is consistent for same user/IP."""
-        factory = RequestFactory()
-
         # Same authenticated user
-        request1 = factory.get("/")
+        request1 = rf.get("/")
         request1.user = user
         request1.META["REMOTE_ADDR"] = "192.168.1.1"
 
-        request2 = factory.get("/api/other/")
+        request2 = rf.get("/api/other/")
         request2.user = user
         request2.META["REMOTE_ADDR"] = "10.0.0.1"  # Different IP
 
@@ -553,11 +527,11 @@ class TestRateLimitIntegration:
         assert key1 == key2 == f"user:{user.id}"
 
         # Same anonymous IP
-        request3 = factory.get("/")
+        request3 = rf.get("/")
         request3.user = AnonymousUser()
         request3.META["REMOTE_ADDR"] = "192.168.1.100"
 
-        request4 = factory.get("/api/other/")
+        request4 = rf.get("/api/other/")
         request4.user = AnonymousUser()
         request4.META["REMOTE_ADDR"] = "192.168.1.100"
 
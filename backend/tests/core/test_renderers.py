@@ -0,0 +1,54 @@
+"""
+Tests for the orjson-backed API renderer.
+"""
+
+import json
+import uuid
+from datetime import UTC, date, datetime, time
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.renderers import ORJSONRenderer
+
+# =============================================================================
+# ORJSONRenderer Tests
+# =============================================================================
+
+
+class TestORJSONRenderer:
+    """Tests for ORJSONRenderer."""
+
+    def test_renders_same_data_as_json_renderer(self):
+        """Test that output decodes to the same value as DRF's JSONRenderer."""
+        data = {
+            "id": uuid.uuid4(),
+            "date": date(2024, 2, 29),
+            "datetime": datetime(2024, 2, 29, 13, 45, 7, 123456, tzinfo=UTC),
+            "time": time(8, 30, 15, 654321),
+            "counts": {1: "one", 2: "two"},
+            "items": [1, "two", None, True],
+            "nested": {"name": "Alice"},
+            "amount": Decimal("1.5"),
+        }
+
+        assert json.loads(ORJSONRenderer().render(data)) == json.loads(
+            JSONRenderer().render(data)
+        )
+
+    def test_renders_datetimes_like_json_renderer(self):
+        """Test that datetimes keep DRF's millisecond precision and "Z" suffix."""
+        data = {"at": datetime(2024, 2, 29, 13, 45, 7, 123456, tzinfo=UTC)}
+
+        assert json.loads(ORJSONRenderer().render(data)) == {"at": "2024-02-29T13:45:07.123Z"}
+
+    def test_renders_lazy_translation_strings(self):
+        """Test that lazy strings fall back to DRF's encoder."""
+        rendered = ORJSONRenderer().render({"action": gettext_lazy("create")})
+
+        assert json.loads(rendered) == {"action": "create"}
+
+    def test_renders_none_as_empty_body(self):
+        """Test that a None payload renders to an empty body."""
+        assert ORJSONRenderer().render(None) == b""
@@ -128,6 +128,24 @@ class TestGroupSerializer:
         serializer = GroupSerializer(grandchild)
         assert serializer.data["full_path"] == "Company > Engineering > Backend"
 
+    def test_rejects_self_as_parent(self):
+        """GroupSerializer rejects making a group its own parent."""
+        group = GroupFactory(name="Loop")
+        serializer = GroupSerializer(group, data={"parent": str(group.id)}, partial=True)
+
+        assert not serializer.is_valid()
+        assert "parent" in serializer.errors
+
+    def test_rejects_descendant_as_parent(self):
+        """GroupSerializer rejects nesting a group under one of its descendants."""
+        parent = GroupFactory(name="Company")
+        child = GroupFactory(name="Engineering", parent=parent)
+        grandchild = GroupFactory(name="Backend", parent=child)
+        serializer = GroupSerializer(parent, data={"parent": str(grandchild.id)}, partial=True)
+
+        assert not serializer.is_valid()
+        assert "parent" in serializer.errors
+
     def test_serializes_children_count(self):
         """GroupSerializer includes children_count."""
         parent = GroupFactory(name="Parent")
@@ -211,7 +229,7 @@ class TestGroupSerializer:
         # Read-only fields should not change
         assert str(updated.id) == str(group.id)
         assert updated.name == "Test"
-        # full_path and children_count are computed, not stored
+        # full_path and children_count are derived, not writable
 
     def test_validates_required_name(self):
         """GroupSerializer validates that name is required."""
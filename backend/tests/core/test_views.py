@@ -325,3 +325,20 @@ class TestRateLimitedErrorView:
         assert response.status_code == 429
         data = json.loads(response.content)
         assert data["retry_after"] == 60  # default
+
+
+# =============================================================================
+# API Docs Tests
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestAPIDocsViews:
+    """Tests for the lazily loaded API documentation views."""
+
+    def test_redoc_page_is_served(self, authenticated_client):
+        """Test that the docs page is built and served on first request."""
+        response = authenticated_client.get(reverse("redoc"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert reverse("schema").encode() in response.content
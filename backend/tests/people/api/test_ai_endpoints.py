@@ -2,7 +2,7 @@
 Tests for AI-related API endpoints.
 """
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
 from django.urls import reverse
@@ -41,6 +41,45 @@ class TestPersonGenerateSummaryAPI:
             assert "summary" in response.data
             mock_gen.assert_called_once()
 
+    def test_generate_summary_person_data(self, authenticated_client, person, owner_person):
+        """Test that the relationship to the owner is split from the others."""
+        import datetime
+
+        from tests.factories import (
+            AnecdoteFactory,
+            EmploymentFactory,
+            RelationshipFactory,
+            RelationshipTypeFactory,
+        )
+
+        colleague = PersonFactory(first_name="Carol", last_name="Jones")
+        RelationshipFactory(
+            person_a=person, person_b=owner_person,
+            relationship_type=RelationshipTypeFactory(name="Friend"),
+        )
+        RelationshipFactory(
+            person_a=person, person_b=colleague,
+            relationship_type=RelationshipTypeFactory(name="Colleague"),
+        )
+        EmploymentFactory(person=person, company="Initech", title="Engineer", is_current=True)
+        AnecdoteFactory(date=datetime.date(2020, 5, 17)).persons.add(person)
+
+        with patch("apps.people.views.person.generate_person_summary") as mock_gen:
+            mock_gen.return_value = "Summary"
+
+            url = reverse("person-generate-summary", kwargs={"pk": person.pk})
+            authenticated_client.post(url)
+
+        person_data = mock_gen.call_args.args[0]
+        assert person_data["profile"]["relationship_to_owner"] == "Friend"
+        assert person_data["relationships"] == [
+            {"type": "Colleague", "person_name": "Carol Jones"},
+        ]
+        assert person_data["employments"] == [
+            {"company": "Initech", "title": "Engineer", "is_current": True},
+        ]
+        assert person_data["anecdotes"][0]["date"] == "2020-05-17"
+
     def test_generate_summary_not_found(self, authenticated_client):
         """Test summary generation for non-existent person."""
         import uuid
@@ -154,6 +193,22 @@ class TestPersonApplyTagsAPI:
         assert response.status_code == status.HTTP_200_OK
         assert "new-tag" in response.data["created_tags"]
 
+    def test_apply_tags_mixed_existing_and_new(self, authenticated_client, person):
+        """Test that existing tags match case-insensitively and the rest are created."""
+        TagFactory(name="VIP")
+
+        url = reverse("person-apply-tags", kwargs={"pk": person.pk})
+        response = authenticated_client.post(
+            url,
+            {"tags": ["vip", "Board Member", "vip"], "create_missing": True},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["applied_tags"] == ["vip", "board-member"]
+        assert response.data["created_tags"] == ["board-member"]
+        assert sorted(response.data["current_tags"]) == ["VIP", "board-member"]
+
 
 # =============================================================================
 # Person Sync LinkedIn Tests
@@ -318,6 +373,36 @@ class TestAIBulkImportAPI:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["summary"]["persons_created"] == 2
 
+    def test_bulk_import_relationship_direction(self, authenticated_client, owner_person):
+        """Test that name matches point person -> owner and inverse matches owner -> person."""
+        from apps.people.models import Relationship
+        from tests.factories import RelationshipTypeFactory
+
+        parent = RelationshipTypeFactory(
+            name="parent", inverse_name="child", auto_create_inverse=False
+        )
+
+        url = reverse("ai-bulk-import")
+        data = {
+            "persons": [
+                {"first_name": "Mom", "relationship_to_owner": "Parent"},
+                {"first_name": "Kid", "relationship_to_owner": "child"},
+                {"first_name": "Stranger", "relationship_to_owner": "nemesis"},
+            ]
+        }
+
+        response = authenticated_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["summary"]["relationships_created"] == 2
+        assert Relationship.objects.filter(
+            person_a__first_name="Mom", person_b=owner_person, relationship_type=parent
+        ).exists()
+        assert Relationship.objects.filter(
+            person_a=owner_person, person_b__first_name="Kid", relationship_type=parent
+        ).exists()
+        assert "nemesis" in response.data["errors"][0]
+
     def test_bulk_import_empty_list(self, authenticated_client):
         """Test bulk import with empty persons list."""
         url = reverse("ai-bulk-import")
@@ -403,6 +488,94 @@ class TestAIApplyUpdatesAPI:
         # Should succeed or return expected response
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST]
 
+    def test_apply_updates_saves_only_changed_fields(self, authenticated_client):
+        """Test that field updates are written without touching other columns."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        person = PersonFactory(first_name="Alice", nickname="", notes="Met at work")
+
+        url = reverse("ai-apply-updates")
+        data = {
+            "updates": [
+                {
+                    "matched_person_id": str(person.pk),
+                    "field_updates": {
+                        "nickname": "Ali",
+                        "notes_to_append": "Moved to Berlin",
+                    },
+                }
+            ]
+        }
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["updated_persons"][0]["fields_updated"] == ["nickname", "notes"]
+        person_updates = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith('UPDATE "people_person"')
+        ]
+        assert len(person_updates) == 1
+        assert '"first_name"' not in person_updates[0]
+        person.refresh_from_db()
+        assert person.nickname == "Ali"
+        assert person.notes == "Met at work\n\nMoved to Berlin"
+
+    def test_apply_updates_links_anecdotes(self, authenticated_client):
+        """Test that anecdotes from several updates are created and linked."""
+        alice = PersonFactory(first_name="Alice")
+        bob = PersonFactory(first_name="Bob")
+
+        url = reverse("ai-apply-updates")
+        data = {
+            "updates": [
+                {
+                    "matched_person_id": str(alice.pk),
+                    "anecdotes": [
+                        {"title": "Hiking", "content": "Went hiking together"},
+                        {"title": "Joke", "content": "Told a great joke", "anecdote_type": "joke"},
+                    ],
+                },
+                {
+                    "matched_person_id": str(bob.pk),
+                    "anecdotes": [{"title": "Dinner", "content": "Had dinner in Paris"}],
+                },
+            ]
+        }
+
+        response = authenticated_client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["summary"]["anecdotes_created"] == 3
+        assert set(alice.anecdotes.values_list("title", flat=True)) == {"Hiking", "Joke"}
+        assert list(bob.anecdotes.values_list("title", flat=True)) == ["Dinner"]
+
+    def test_apply_updates_rolls_back_when_linking_fails(self, authenticated_client):
+        """Test that anecdotes are not left unlinked when the link insert fails."""
+        from django.db import IntegrityError
+
+        from apps.people.models import Anecdote
+
+        alice = PersonFactory(first_name="Alice")
+        url = reverse("ai-apply-updates")
+        data = {
+            "updates": [
+                {
+                    "matched_person_id": str(alice.pk),
+                    "anecdotes": [{"title": "Orphan", "content": "Never linked"}],
+                },
+            ]
+        }
+
+        with patch.object(
+            Anecdote.persons.through.objects, "bulk_create", side_effect=IntegrityError
+        ), pytest.raises(IntegrityError):
+            authenticated_client.post(url, data, format="json")
+
+        assert not Anecdote.objects.filter(title="Orphan").exists()
+
 
 # =============================================================================
 # AI Chat Tests
@@ -444,6 +617,220 @@ class TestAIChatAPI:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    def test_chat_reuses_cached_answer(self, authenticated_client, without_rate_limit):
+        """Test that repeating a question against the same context skips the AI call."""
+        with patch("apps.people.views.ai.chat_with_context") as mock_chat:
+            mock_chat.return_value = "John works at TechCorp."
+
+            url = reverse("ai-chat")
+            first = authenticated_client.post(
+                url, {"question": "Where does John work?"}, format="json"
+            )
+            second = authenticated_client.post(
+                url, {"question": "  where does john   work? "}, format="json"
+            )
+
+            assert first.status_code == status.HTTP_200_OK
+            assert second.status_code == status.HTTP_200_OK
+            assert second.data["answer"] == "John works at TechCorp."
+            mock_chat.assert_called_once()
+
+    def test_chat_caches_answer_encrypted(self, authenticated_client, without_rate_limit):
+        """Test that cached answers are not stored in plaintext."""
+        from datetime import date
+
+        from django.core.cache import cache
+
+        from apps.people.cache import ai_answer_cache_key, get_owner
+        from apps.people.services import build_contacts_context
+
+        with patch("apps.people.views.ai.chat_with_context", return_value="John works at TechCorp."):
+            authenticated_client.post(
+                reverse("ai-chat"), {"question": "Where does John work?"}, format="json"
+            )
+
+        contacts_context = build_contacts_context(get_owner())
+        cache_key = ai_answer_cache_key(
+            "chat", "where does john work?", contacts_context, [], date.today().isoformat()
+        )
+        cached = cache.get(cache_key)
+        assert cached is not None
+        assert b"TechCorp" not in cached
+
+    def test_chat_cache_misses_when_context_changes(self, authenticated_client, without_rate_limit):
+        """Test that a new contact invalidates the cached answer."""
+        with patch("apps.people.views.ai.chat_with_context") as mock_chat:
+            mock_chat.return_value = "Answer"
+
+            url = reverse("ai-chat")
+            authenticated_client.post(url, {"question": "Who do I know?"}, format="json")
+            PersonFactory(first_name="Newcomer")
+            authenticated_client.post(url, {"question": "Who do I know?"}, format="json")
+
+            assert mock_chat.call_count == 2
+
+    def test_chat_reuses_cached_contacts_context(self, authenticated_client, without_rate_limit):
+        """Test that the contacts context is only rebuilt after contacts change."""
+        PersonFactory(first_name="Alice")
+        url = reverse("ai-chat")
+
+        with patch("apps.people.views.ai.chat_with_context", return_value="Answer"), \
+                patch(
+                    "apps.people.views.ai.build_contacts_context", return_value="ctx"
+                ) as mock_build:
+            authenticated_client.post(url, {"question": "First?"}, format="json")
+            authenticated_client.post(url, {"question": "Second?"}, format="json")
+            assert mock_build.call_count == 1
+
+            PersonFactory(first_name="Bob")
+            authenticated_client.post(url, {"question": "Third?"}, format="json")
+            assert mock_build.call_count == 2
+
+    def test_chat_caches_contacts_context_encrypted(self, authenticated_client, without_rate_limit):
+        """Test that the cached contacts context does not hold decrypted notes."""
+        from django.core.cache import cache
+
+        from apps.people.cache import contacts_context_cache_key
+
+        PersonFactory(first_name="Alice", notes="Secret note about Alice")
+
+        with patch("apps.people.views.ai.chat_with_context", return_value="Answer"):
+            authenticated_client.post(reverse("ai-chat"), {"question": "Hi?"}, format="json")
+
+        cached = cache.get(contacts_context_cache_key(None))
+        assert cached is not None
+        assert b"Secret note about Alice" not in cached
+
+    def test_chat_stream_returns_event_stream(self, authenticated_client):
+        """Test that stream=true sends the answer as server-sent events."""
+        with patch("apps.people.views.ai.stream_chat_with_context") as mock_stream:
+            mock_stream.return_value = iter(["Hel", "lo"])
+
+            url = reverse("ai-chat")
+            response = authenticated_client.post(
+                url,
+                {"question": "Hello", "stream": True},
+                format="json",
+            )
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response["Content-Type"] == "text/event-stream"
+            body = b"".join(response.streaming_content).decode()
+            assert 'data: {"delta": "Hel"}' in body
+            assert 'data: {"delta": "lo"}' in body
+            assert body.endswith("event: done\ndata: {}\n\n")
+
+
+# =============================================================================
+# AI Background Job Tests
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestAIAsyncJobsAPI:
+    """Tests for queuing AI calls as background jobs."""
+
+    def test_chat_async_returns_job_id(self, authenticated_client):
+        """Test that async chat requests are queued instead of answered inline."""
+        job = MagicMock(id="job-123", state="PENDING")
+
+        with patch("apps.people.views.ai.ai_chat_task") as mock_task, \
+                patch("apps.people.views.ai.chat_with_context") as mock_chat:
+            mock_task.delay.return_value = job
+
+            url = reverse("ai-chat")
+            response = authenticated_client.post(
+                url,
+                {"question": "Hello", "async": True},
+                format="json",
+            )
+
+            assert response.status_code == status.HTTP_202_ACCEPTED
+            assert response.data["job_id"] == "job-123"
+            mock_task.delay.assert_called_once_with("Hello", ANY, [])
+            mock_chat.assert_not_called()
+
+    def test_parse_contacts_async_returns_job_id(self, authenticated_client):
+        """Test that async contact parsing is queued."""
+        job = MagicMock(id="job-456", state="PENDING")
+
+        with patch("apps.people.views.ai.ai_parse_contacts_task") as mock_task:
+            mock_task.delay.return_value = job
+
+            url = reverse("ai-parse-contacts")
+            response = authenticated_client.post(
+                url,
+                {"text": "John Doe", "async": True},
+                format="json",
+            )
+
+            assert response.status_code == status.HTTP_202_ACCEPTED
+            mock_task.delay.assert_called_once_with("John Doe")
+
+    def test_job_status_pending(self, authenticated_client):
+        """Test polling a job that has not finished yet."""
+        from apps.people.cache import remember_ai_job
+
+        remember_ai_job("job-123")
+        with patch("apps.people.views.ai.AsyncResult") as mock_result:
+            mock_result.return_value = MagicMock(state="PENDING", ready=lambda: False)
+
+            url = reverse("ai-job-status", kwargs={"job_id": "job-123"})
+            response = authenticated_client.get(url)
+
+            assert response.status_code == status.HTTP_202_ACCEPTED
+            assert response.data["state"] == "PENDING"
+
+    def test_job_status_success(self, authenticated_client):
+        """Test polling a finished job returns its decrypted result."""
+        from apps.core.encryption import encrypt_value
+        from apps.people.cache import remember_ai_job
+
+        remember_ai_job("job-123")
+        token = encrypt_value({"status": "success", "result": {"answer": "Hi"}}).decode()
+        with patch("apps.people.views.ai.AsyncResult") as mock_result:
+            mock_result.return_value = MagicMock(
+                state="SUCCESS",
+                ready=lambda: True,
+                failed=lambda: False,
+                result=token,
+            )
+
+            url = reverse("ai-job-status", kwargs={"job_id": "job-123"})
+            response = authenticated_client.get(url)
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data["result"] == {"answer": "Hi"}
+
+    def test_job_status_unknown_job(self, authenticated_client):
+        """Test that ids not queued by the AI endpoints are not looked up."""
+        with patch("apps.people.views.ai.AsyncResult") as mock_result:
+            url = reverse("ai-job-status", kwargs={"job_id": "some-other-task"})
+            response = authenticated_client.get(url)
+
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+            mock_result.assert_not_called()
+
+    def test_queued_job_can_be_polled(self, authenticated_client):
+        """Test that a job queued through an AI endpoint is known to the status view."""
+        job = MagicMock(id="job-789", state="PENDING")
+
+        with patch("apps.people.views.ai.ai_parse_contacts_task") as mock_task, \
+                patch("apps.people.views.ai.AsyncResult") as mock_result:
+            mock_task.delay.return_value = job
+            mock_result.return_value = MagicMock(state="PENDING", ready=lambda: False)
+
+            authenticated_client.post(
+                reverse("ai-parse-contacts"),
+                {"text": "John Doe", "async": True},
+                format="json",
+            )
+            response = authenticated_client.get(
+                reverse("ai-job-status", kwargs={"job_id": "job-789"})
+            )
+
+            assert response.status_code == status.HTTP_202_ACCEPTED
+
 
 # =============================================================================
 # AI Suggest Relationships Tests
@@ -503,6 +890,31 @@ class TestAISuggestRelationshipsAPI:
             assert "total_contacts" in response.data
             mock_suggest.assert_called_once()
 
+    def test_suggest_relationships_counts_co_appearances(self, authenticated_client, owner_person):
+        """Test that shared photos and anecdotes are counted per pair of contacts."""
+        from tests.factories import AnecdoteFactory
+
+        alice = PersonFactory(first_name="Alice", is_owner=False)
+        bob = PersonFactory(first_name="Bob", is_owner=False)
+        for _ in range(2):
+            photo = PhotoFactory()
+            photo.persons.add(alice, bob, owner_person)
+        anecdote = AnecdoteFactory()
+        anecdote.persons.add(alice, bob)
+
+        with patch("apps.people.views.ai.suggest_relationships") as mock_suggest:
+            mock_suggest.return_value = []
+
+            url = reverse("ai-suggest-relationships")
+            response = authenticated_client.get(url)
+
+            assert response.status_code == status.HTTP_200_OK
+            shared = mock_suggest.call_args.kwargs["shared_contexts"]
+            assert len(shared["photo_coappearances"]) == 1
+            assert shared["photo_coappearances"][0][4] == 2
+            assert len(shared["anecdote_comentions"]) == 1
+            assert shared["anecdote_comentions"][0][4] == 1
+
 
 @pytest.mark.django_db
 class TestAIApplyRelationshipSuggestionAPI:
@@ -665,6 +1077,51 @@ class TestAISmartSearchAPI:
             assert "anecdotes" in response.data
             assert "counts" in response.data
 
+    def test_smart_search_reuses_cached_interpretation(self, authenticated_client, without_rate_limit):
+        """Test that repeating a query skips the AI call but re-runs the search."""
+        with patch("apps.people.views.ai.smart_search") as mock_smart_search:
+            mock_smart_search.return_value = {
+                "search_type": "person",
+                "intent": "Find people named John",
+                "person_filters": {"name_contains": "John"},
+                "keywords": [],
+                "limit": 20,
+            }
+
+            url = reverse("ai-smart-search")
+            authenticated_client.post(url, {"query": "Find John"}, format="json")
+            PersonFactory(first_name="John", is_owner=False)
+            response = authenticated_client.post(url, {"query": "find john"}, format="json")
+
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data["counts"]["persons"] == 1
+            mock_smart_search.assert_called_once()
+
+    def test_smart_search_truncates_prefetched_relations(self, authenticated_client, without_rate_limit):
+        """Test that person tags and anecdote persons are capped in the results."""
+        from tests.factories import AnecdoteFactory
+
+        person = PersonFactory(first_name="Tagged", is_owner=False)
+        person.tags.add(*TagFactory.create_batch(6))
+        anecdote = AnecdoteFactory(title="Reunion")
+        anecdote.persons.add(person, *PersonFactory.create_batch(3, is_owner=False))
+
+        with patch("apps.people.views.ai.smart_search") as mock_smart_search:
+            mock_smart_search.return_value = {
+                "search_type": "mixed",
+                "person_filters": {"name_contains": "Tagged"},
+                "anecdote_filters": {"content_contains": "Reunion"},
+                "keywords": [],
+                "limit": 20,
+            }
+
+            url = reverse("ai-smart-search")
+            response = authenticated_client.post(url, {"query": "Tagged reunion"}, format="json")
+
+            assert response.status_code == status.HTTP_200_OK
+            assert len(response.data["persons"][0]["tags"]) == 5
+            assert len(response.data["anecdotes"][0]["persons"]) == 3
+
     def test_smart_search_with_company_filter(self, authenticated_client, without_rate_limit):
         """Test smart search with company filter."""
         from apps.people.models import Employment
@@ -84,6 +84,17 @@ class TestExportPreviewAPI:
         assert "total_items" in response.data
         assert "available_formats" in response.data
 
+    def test_preview_counts_match_models(self, authenticated_client, sample_data):
+        """Test that the batched counts equal each model's own count."""
+        from apps.people.views.export import EXPORT_MODELS
+
+        url = reverse("export-preview")
+        response = authenticated_client.get(url)
+
+        expected = {name: model.objects.count() for name, model in EXPORT_MODELS.items()}
+        assert response.data["counts"] == expected
+        assert response.data["total_items"] == sum(expected.values())
+
     def test_preview_entity_type(self, authenticated_client, sample_data):
         """Test preview for specific entity type."""
         url = reverse("export-preview")
@@ -166,7 +177,7 @@ class TestExportDataAPI:
         assert ".csv" in response["Content-Disposition"]
 
         # Parse CSV content
-        content = response.content.decode("utf-8")
+        content = b"".join(response.streaming_content).decode("utf-8")
         lines = content.strip().split("\n")
 
         # Verify header
@@ -187,7 +198,7 @@ class TestExportDataAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response["Content-Type"] == "text/csv"
 
-        content = response.content.decode("utf-8")
+        content = b"".join(response.streaming_content).decode("utf-8")
         lines = content.strip().split("\n")
 
         # Verify header
@@ -204,7 +215,7 @@ class TestExportDataAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response["Content-Type"] == "text/csv"
 
-        content = response.content.decode("utf-8")
+        content = b"".join(response.streaming_content).decode("utf-8")
         lines = content.strip().split("\n")
 
         # Verify header
@@ -2,6 +2,8 @@
 Tests for Relationship Graph API endpoint.
 """
 
+import json
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
@@ -14,6 +16,11 @@ from tests.factories import (
 )
 
 
+def graph_data(response):
+    """Decode the streamed JSON body of a graph response."""
+    return json.loads(b"".join(response.streaming_content))
+
+
 # =============================================================================
 # Relationship Graph API Tests
 # =============================================================================
@@ -37,13 +44,14 @@ class TestRelationshipGraphAPI:
         url = reverse("relationship-graph")
 
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
-        assert "nodes" in response.data
-        assert "edges" in response.data
-        assert "relationship_types" in response.data
-        assert isinstance(response.data["nodes"], list)
-        assert isinstance(response.data["edges"], list)
+        assert "nodes" in data
+        assert "edges" in data
+        assert "relationship_types" in data
+        assert isinstance(data["nodes"], list)
+        assert isinstance(data["edges"], list)
 
     def test_graph_with_persons_no_relationships(self, authenticated_client):
         """Test graph with persons but no relationships."""
@@ -77,13 +85,14 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data["nodes"]) >= 2
-        assert len(response.data["edges"]) >= 1
+        assert len(data["nodes"]) >= 2
+        assert len(data["edges"]) >= 1
 
         # Check node structure
-        node_ids = [n["id"] for n in response.data["nodes"]]
+        node_ids = [n["id"] for n in data["nodes"]]
         assert str(person_a.id) in node_ids
         assert str(person_b.id) in node_ids
 
@@ -100,12 +109,13 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
 
         # Find Alice in nodes
         alice_node = next(
-            (n for n in response.data["nodes"] if n["first_name"] == "Alice"),
+            (n for n in data["nodes"] if n["first_name"] == "Alice"),
             None,
         )
         assert alice_node is not None
@@ -114,6 +124,8 @@ class TestRelationshipGraphAPI:
         assert "first_name" in alice_node
         assert "last_name" in alice_node
         assert "avatar" in alice_node
+        assert alice_node["label"] == "Alice Smith"
+        assert alice_node["avatar"] is None
 
     def test_graph_edge_structure(self, authenticated_client):
         """Test that graph edges have correct structure."""
@@ -133,11 +145,12 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data["edges"]) >= 1
+        assert len(data["edges"]) >= 1
 
-        edge = response.data["edges"][0]
+        edge = data["edges"][0]
         assert "id" in edge
         assert "source" in edge
         assert "target" in edge
@@ -169,9 +182,10 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url, {"center_id": str(person_b.id)})
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["center_person_id"] == str(person_b.id)
+        assert data["center_person_id"] == str(person_b.id)
 
     def test_graph_depth_filter(self, authenticated_client):
         """Test graph with depth filter."""
@@ -201,6 +215,33 @@ class TestRelationshipGraphAPI:
         )
         assert response.status_code == status.HTTP_200_OK
 
+    def test_graph_depth_limits_nodes(self, authenticated_client):
+        """Test that only persons within the requested depth are returned."""
+        rel_type = RelationshipTypeFactory()
+
+        # Chain A - B - C - D, with the middle link pointing back towards B
+        person_a = PersonFactory()
+        person_b = PersonFactory()
+        person_c = PersonFactory()
+        person_d = PersonFactory()
+
+        RelationshipFactory(person_a=person_a, person_b=person_b, relationship_type=rel_type)
+        RelationshipFactory(person_a=person_c, person_b=person_b, relationship_type=rel_type)
+        RelationshipFactory(person_a=person_c, person_b=person_d, relationship_type=rel_type)
+
+        url = reverse("relationship-graph")
+
+        def node_ids(depth):
+            response = authenticated_client.get(
+                url, {"center_id": str(person_b.id), "depth": depth}
+            )
+            return {node["id"] for node in graph_data(response)["nodes"]}
+
+        assert node_ids(1) == {str(person_a.id), str(person_b.id), str(person_c.id)}
+        assert node_ids(2) == {
+            str(person_a.id), str(person_b.id), str(person_c.id), str(person_d.id)
+        }
+
     def test_graph_category_filter(self, authenticated_client):
         """Test graph with category filter."""
         family_type = RelationshipTypeFactory(name="parent", category="family")
@@ -222,10 +263,11 @@ class TestRelationshipGraphAPI:
 
         # Filter by family category
         response = authenticated_client.get(url, {"category": "family"})
+        data = graph_data(response)
         assert response.status_code == status.HTTP_200_OK
 
         # All edges should be family category
-        for edge in response.data["edges"]:
+        for edge in data["edges"]:
             assert edge["category"] == "family"
 
     def test_graph_relationship_types(self, authenticated_client):
@@ -246,16 +288,39 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data["relationship_types"]) >= 2
+        assert len(data["relationship_types"]) >= 2
 
         # Check structure
-        for rt in response.data["relationship_types"]:
+        for rt in data["relationship_types"]:
             assert "id" in rt or "name" in rt
             assert "category" in rt
             assert "color" in rt
 
+    def test_graph_relationship_types_cached_until_types_change(self, authenticated_client):
+        """Test that the legend is served from cache and refreshed on type writes."""
+        from unittest.mock import patch
+
+        from apps.people.views import RelationshipGraphView
+
+        url = reverse("relationship-graph")
+        with patch.object(
+            RelationshipGraphView, "_build_relationship_types",
+            side_effect=RelationshipGraphView._build_relationship_types,
+        ) as mock_build:
+            authenticated_client.get(url)
+            authenticated_client.get(url)
+            assert mock_build.call_count == 1
+
+            RelationshipTypeFactory(name="Mentor")
+            response = authenticated_client.get(url)
+            data = graph_data(response)
+            assert mock_build.call_count == 2
+
+        assert "Mentor" in [rt["name"] for rt in data["relationship_types"]]
+
     def test_graph_symmetric_relationships(self, authenticated_client):
         """Test that symmetric relationships don't create duplicate edges."""
         sym_type = RelationshipTypeFactory(
@@ -273,13 +338,14 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
 
         # Count edges between A and B
         edges_between_ab = [
             e
-            for e in response.data["edges"]
+            for e in data["edges"]
             if (e["source"] == str(person_a.id) and e["target"] == str(person_b.id))
             or (e["source"] == str(person_b.id) and e["target"] == str(person_a.id))
         ]
@@ -305,11 +371,12 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
 
         # Find the edge
-        edge = response.data["edges"][0]
+        edge = data["edges"][0]
         assert edge["is_symmetric"] is False
 
     def test_graph_depth_limit(self, authenticated_client):
@@ -344,10 +411,11 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url, {"category": "nonexistent"})
+        data = graph_data(response)
 
         # Should return empty edges for non-matching category
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data["edges"]) == 0
+        assert len(data["edges"]) == 0
 
     def test_graph_complex_network(self, authenticated_client):
         """Test graph with a more complex network structure."""
@@ -364,15 +432,16 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
         # Check that all hub and spokes are included
-        node_ids = [n["id"] for n in response.data["nodes"]]
+        node_ids = [n["id"] for n in data["nodes"]]
         assert str(hub.id) in node_ids
         for spoke in spokes:
             assert str(spoke.id) in node_ids
         # Check relationships exist
-        assert len(response.data["edges"]) >= 5
+        assert len(data["edges"]) >= 5
 
     def test_graph_owner_person_highlighted(self, authenticated_client, owner_person):
         """Test that owner person can be identified if present."""
@@ -386,12 +455,13 @@ class TestRelationshipGraphAPI:
 
         url = reverse("relationship-graph")
         response = authenticated_client.get(url)
+        data = graph_data(response)
 
         assert response.status_code == status.HTTP_200_OK
 
         # Owner should be in nodes
         owner_node = next(
-            (n for n in response.data["nodes"] if n["id"] == str(owner_person.id)),
+            (n for n in data["nodes"] if n["id"] == str(owner_person.id)),
             None,
         )
         assert owner_node is not None
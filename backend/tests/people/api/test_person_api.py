@@ -2,6 +2,8 @@
 Tests for Person API endpoints.
 """
 
+from datetime import date
+
 import pytest
 from django.urls import reverse
 from rest_framework import status
@@ -54,6 +56,26 @@ class TestPersonListAPI:
             data = response.data.get("results", response.data)
             assert len(data) >= 3  # At least the 3 we created
 
+    def test_list_persons_skips_unrendered_columns(self, authenticated_client):
+        """Test that the list query does not load notes or the AI summary."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        PersonFactory(notes="Private notes")
+        url = reverse("person-list")
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        person_selects = [
+            q["sql"] for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT") and 'FROM "people_person"' in q["sql"]
+        ]
+        assert person_selects
+        assert all('"people_person"."notes"' not in sql for sql in person_selects)
+        assert all('"people_person"."ai_summary"' not in sql for sql in person_selects)
+
     def test_list_persons_empty(self, authenticated_client):
         """Test listing persons when none exist."""
         url = reverse("person-list")
@@ -63,16 +85,40 @@ class TestPersonListAPI:
         assert response.status_code == status.HTTP_200_OK
 
     def test_list_persons_pagination(self, authenticated_client):
-        """Test pagination of person list."""
-        PersonFactory.create_batch(25)
+        """Test that the person list is paginated with cursors."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        persons = PersonFactory.create_batch(55)
         url = reverse("person-list")
 
-        response = authenticated_client.get(url)
+        with CaptureQueriesContext(connection) as ctx:
+            response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        # If paginated, should have pagination fields
-        if "results" in response.data:
-            assert "count" in response.data
+        assert "count" not in response.data
+        assert response.data["previous"] is None
+        assert len(response.data["results"]) == 50
+        assert all("COUNT(" not in q["sql"] for q in ctx.captured_queries)
+
+        next_page = authenticated_client.get(response.data["next"])
+
+        assert next_page.status_code == status.HTTP_200_OK
+        assert next_page.data["next"] is None
+        seen = [p["id"] for p in response.data["results"] + next_page.data["results"]]
+        assert sorted(seen) == sorted(str(p.id) for p in persons)
+
+    def test_list_persons_ignores_nullable_ordering(self, authenticated_client):
+        """Test that ordering by a nullable column cannot hide persons from the cursor."""
+        with_birthday = PersonFactory.create_batch(2, birthday=date(1990, 1, 1))
+        without_birthday = PersonFactory.create_batch(3, birthday=None)
+        url = reverse("person-list")
+
+        response = authenticated_client.get(url, {"ordering": "birthday"})
+
+        assert response.status_code == status.HTTP_200_OK
+        seen = {p["id"] for p in response.data["results"]}
+        assert seen == {str(p.id) for p in with_birthday + without_birthday}
 
     def test_list_persons_filter_by_group(self, authenticated_client):
         """Test filtering persons by group."""
@@ -312,6 +358,26 @@ class TestPersonRelationshipsAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
+    def test_get_person_relationships_query_count(self, authenticated_client, person):
+        """Test that names are joined in rather than fetched per relationship."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        rt = RelationshipTypeFactory(name="Mentor", inverse_name="Mentee")
+        RelationshipFactory(person_a=person, relationship_type=rt)
+        url = reverse("person-relationships", kwargs={"pk": person.pk})
+
+        with CaptureQueriesContext(connection) as single:
+            authenticated_client.get(url)
+        RelationshipFactory.create_batch(2, person_a=person, relationship_type=rt)
+        with CaptureQueriesContext(connection) as several:
+            response = authenticated_client.get(url)
+
+        assert len(several.captured_queries) == len(single.captured_queries)
+        assert len(response.data) == 3
+        assert {r["person_a_name"] for r in response.data} == {person.full_name}
+        assert {r["relationship_type_inverse_name"] for r in response.data} == {"Mentee"}
+
     def test_get_person_relationships_empty(self, authenticated_client, person):
         """Test getting relationships when none exist."""
         url = reverse("person-relationships", kwargs={"pk": person.pk})
@@ -340,6 +406,25 @@ class TestPersonAnecdotesAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
+    def test_get_person_anecdotes_query_count(self, authenticated_client, person):
+        """Test that tags of the linked persons are prefetched, not queried per person."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        anecdote = AnecdoteFactory()
+        anecdote.persons.add(person, PersonFactory(tags=[TagFactory()]))
+        url = reverse("person-anecdotes", kwargs={"pk": person.pk})
+        authenticated_client.get(url)
+
+        with CaptureQueriesContext(connection) as single:
+            authenticated_client.get(url)
+        anecdote.persons.add(*PersonFactory.create_batch(2, tags=[TagFactory()]))
+        with CaptureQueriesContext(connection) as several:
+            response = authenticated_client.get(url)
+
+        assert len(response.data[0]["persons"]) == 4
+        assert len(several.captured_queries) == len(single.captured_queries)
+
 
 # =============================================================================
 # Person Photos Endpoint Tests
@@ -396,3 +481,15 @@ class TestPersonHistoryAPI:
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
+
+    def test_person_history_entries(self, authenticated_client, person):
+        """Test that history lists changes newest first with action labels."""
+        person.first_name = "Renamed"
+        person.save()
+
+        url = reverse("person-history", kwargs={"pk": person.pk})
+        response = authenticated_client.get(url)
+
+        assert [entry["action"] for entry in response.data] == ["update", "create"]
+        assert response.data[0]["changes"]["first_name"][1] == "Renamed"
+        assert response.data[0]["actor"] is None
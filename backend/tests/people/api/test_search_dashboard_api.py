@@ -11,6 +11,8 @@ from tests.factories import (
     EmploymentFactory,
     PersonFactory,
     PhotoFactory,
+    RelationshipFactory,
+    RelationshipTypeFactory,
     TagFactory,
 )
 
@@ -85,6 +87,83 @@ class TestGlobalSearchAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
+    def test_search_matches_name_prefix(self, authenticated_client, sample_persons):
+        """Test that a partial word matches through the stored search vector."""
+        url = reverse("global-search")
+
+        response = authenticated_client.get(url, {"q": "Smi"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["first_name"] for p in response.data["persons"]] == ["Alice"]
+
+    def test_search_matches_inside_name(self, authenticated_client, sample_persons):
+        """Test that a single word also matches in the middle of a name."""
+        url = reverse("global-search")
+
+        response = authenticated_client.get(url, {"q": "mit"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["first_name"] for p in response.data["persons"]] == ["Alice"]
+
+    def test_search_multi_word_skips_substring_match(self, authenticated_client, sample_persons):
+        """Test that multi-word queries only use full-text matching."""
+        url = reverse("global-search")
+
+        response = authenticated_client.get(url, {"q": "lice mith"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["persons"] == []
+
+    def test_search_query_count_does_not_grow_with_matches(self, authenticated_client):
+        """Test that person tags are prefetched instead of queried per result."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        url = reverse("global-search")
+        PersonFactory(first_name="Tagged", tags=[TagFactory()])
+        authenticated_client.get(url, {"q": "Tagged"})
+
+        with CaptureQueriesContext(connection) as single:
+            authenticated_client.get(url, {"q": "Tagged"})
+        PersonFactory.create_batch(2, first_name="Tagged", tags=[TagFactory()])
+        with CaptureQueriesContext(connection) as several:
+            response = authenticated_client.get(url, {"q": "Tagged"})
+
+        assert len(response.data["persons"]) == 3
+        assert len(several.captured_queries) == len(single.captured_queries)
+
+    def test_search_employments_by_company(self, authenticated_client):
+        """Test that employments are found by company name."""
+        EmploymentFactory(company="Globex Corporation")
+
+        url = reverse("global-search")
+        response = authenticated_client.get(url, {"q": "globex"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["employments"]) == 1
+
+    def test_search_vector_follows_updates(self, authenticated_client):
+        """Test that renaming a person updates what search matches."""
+        person = PersonFactory(first_name="Zebulon")
+        person.first_name = "Quincy"
+        person.save()
+
+        url = reverse("global-search")
+        old = authenticated_client.get(url, {"q": "Zebulon"})
+        new = authenticated_client.get(url, {"q": "Quincy"})
+
+        assert old.data["persons"] == []
+        assert len(new.data["persons"]) == 1
+
+    def test_search_punctuation_only(self, authenticated_client):
+        """Test that a query without searchable words returns no results."""
+        url = reverse("global-search")
+
+        response = authenticated_client.get(url, {"q": "!!"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["persons"] == []
+
     def test_search_tags(self, authenticated_client):
         """Test searching tags by name."""
         TagFactory(name="Important VIP")
@@ -132,6 +211,23 @@ class TestDashboardAPI:
         assert response.status_code == status.HTTP_200_OK
         # Should include some count statistics
 
+    def test_dashboard_count_values(self, authenticated_client, owner_person):
+        """Test that the stats exclude the owner and inactive persons."""
+        PersonFactory.create_batch(2)
+        PersonFactory(is_active=False)
+        AnecdoteFactory.create_batch(3)
+        PhotoFactory()
+
+        url = reverse("dashboard")
+        response = authenticated_client.get(url)
+
+        assert response.data["stats"] == {
+            "total_persons": 2,
+            "total_relationships": 0,
+            "total_anecdotes": 3,
+            "total_photos": 1,
+        }
+
     def test_dashboard_recent_persons(self, authenticated_client):
         """Test dashboard includes recent persons."""
         PersonFactory.create_batch(3)
@@ -141,6 +237,81 @@ class TestDashboardAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
+    def test_dashboard_recent_persons_relationship_to_me(
+        self, authenticated_client, owner_person, relationship_type
+    ):
+        """Test that recent persons carry their relationship to the owner."""
+        friend = PersonFactory(first_name="Friend")
+        RelationshipFactory(
+            person_a=friend, person_b=owner_person, relationship_type=relationship_type
+        )
+        PersonFactory(first_name="Stranger")
+
+        url = reverse("dashboard")
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        by_name = {p["full_name"]: p for p in response.data["recent_persons"]}
+        assert by_name[friend.full_name]["relationship_to_me"] == relationship_type.name
+        assert all(
+            p["relationship_to_me"] is None
+            for name, p in by_name.items() if name != friend.full_name
+        )
+
+    def test_dashboard_relationship_distribution(self, authenticated_client):
+        """Test that relationship types are counted and named, most used first."""
+        colleague = RelationshipTypeFactory(name="Colleague")
+        neighbor = RelationshipTypeFactory(name="Neighbor")
+        RelationshipFactory.create_batch(2, relationship_type=colleague)
+        RelationshipFactory(relationship_type=neighbor)
+
+        url = reverse("dashboard")
+        response = authenticated_client.get(url)
+
+        assert response.data["relationship_distribution"] == [
+            {"name": "Colleague", "count": 2},
+            {"name": "Neighbor", "count": 1},
+        ]
+
+    def test_dashboard_upcoming_birthdays(self, authenticated_client):
+        """Test that only birthdays in the next 30 days are listed, soonest first."""
+        from datetime import date, timedelta
+
+        today = date.today()
+        soon = PersonFactory(first_name="Soon", birthday=(today + timedelta(days=3)).replace(year=1988))
+        PersonFactory(first_name="Later", birthday=(today + timedelta(days=60)).replace(year=1988))
+        today_person = PersonFactory(first_name="Today", birthday=today.replace(year=1984))
+
+        url = reverse("dashboard")
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        birthdays = response.data["upcoming_birthdays"]
+        assert [b["id"] for b in birthdays] == [str(today_person.id), str(soon.id)]
+        assert birthdays[0]["days_until"] == 0
+        assert birthdays[0]["turning_age"] == today.year - 1984
+
+    def test_dashboard_is_cached_until_data_changes(self, authenticated_client):
+        """Test that the payload is served from cache and refreshed on writes."""
+        from unittest.mock import patch
+
+        from apps.people.views import DashboardView
+
+        url = reverse("dashboard")
+        with patch.object(
+            DashboardView, "_build_dashboard", autospec=True,
+            side_effect=DashboardView._build_dashboard,
+        ) as mock_build:
+            authenticated_client.get(url)
+            authenticated_client.get(url)
+            assert mock_build.call_count == 1
+
+            PersonFactory()
+            response = authenticated_client.get(url)
+            assert mock_build.call_count == 2
+
+        assert response.data["stats"]["total_persons"] == 1
+
     def test_dashboard_recent_anecdotes(self, authenticated_client):
         """Test dashboard includes recent anecdotes."""
         AnecdoteFactory.create_batch(3)
@@ -150,6 +321,35 @@ class TestDashboardAPI:
 
         assert response.status_code == status.HTTP_200_OK
 
+    def test_dashboard_recent_anecdotes_persons(self, authenticated_client):
+        """Test recent anecdotes list their linked persons by full name."""
+        anecdote = AnecdoteFactory(content="x" * 200)
+        anecdote.persons.add(
+            PersonFactory(first_name="Zoe", last_name="Adams"),
+            PersonFactory(first_name="Yann", last_name="Brown"),
+        )
+
+        url = reverse("dashboard")
+        response = authenticated_client.get(url)
+
+        recent = response.data["recent_anecdotes"][0]
+        assert recent["persons"] == ["Zoe Adams", "Yann Brown"]
+        assert recent["content"] == "x" * 150 + "..."
+
+    def test_dashboard_recent_anecdotes_caps_persons(self, authenticated_client):
+        """Test recent anecdotes list at most three persons, in name order."""
+        anecdote = AnecdoteFactory()
+        anecdote.persons.add(*[
+            PersonFactory(first_name="P", last_name=last_name)
+            for last_name in ["Evans", "Brown", "Davis", "Adams", "Clark"]
+        ])
+
+        url = reverse("dashboard")
+        response = authenticated_client.get(url)
+
+        recent = response.data["recent_anecdotes"][0]
+        assert recent["persons"] == ["P Adams", "P Brown", "P Clark"]
+
 
 # =============================================================================
 # Me (Owner) Endpoint Tests
@@ -211,6 +411,19 @@ class TestMeAPI:
         # Either 200 OK or 201 Created
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_201_CREATED]
 
+    def test_me_create_owner_when_one_exists(self, authenticated_client, owner_person):
+        """Test that a second owner is rejected."""
+        from apps.people.models import Person
+
+        url = reverse("me")
+        response = authenticated_client.post(
+            url, {"first_name": "Second"}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "already exists" in response.data["detail"]
+        assert Person.objects.filter(is_owner=True).count() == 1
+
     def test_me_update_owner(self, authenticated_client, owner_person):
         """Test updating owner via me endpoint."""
         # Ensure only one owner exists
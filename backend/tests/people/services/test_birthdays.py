@@ -0,0 +1,55 @@
+"""
+Tests for the birthday window helper.
+"""
+
+from datetime import date
+
+import pytest
+
+from apps.people.models import Person
+from apps.people.services.birthdays import filter_upcoming_birthdays
+from tests.factories import PersonFactory
+
+# =============================================================================
+# filter_upcoming_birthdays Tests
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestFilterUpcomingBirthdays:
+    """Tests for filter_upcoming_birthdays."""
+
+    def _names(self, today, days_ahead=30):
+        qs = filter_upcoming_birthdays(Person.objects.all(), days_ahead, today=today)
+        return set(qs.values_list("first_name", flat=True))
+
+    def test_window_within_single_month(self):
+        """Test birthdays inside a window that stays in one month."""
+        PersonFactory(first_name="Inside", birthday=date(1990, 3, 10))
+        PersonFactory(first_name="Before", birthday=date(1990, 3, 1))
+        PersonFactory(first_name="After", birthday=date(1990, 3, 20))
+
+        assert self._names(date(2024, 3, 5), days_ahead=7) == {"Inside"}
+
+    def test_window_spanning_months(self):
+        """Test that intermediate months are fully included."""
+        PersonFactory(first_name="Start", birthday=date(1985, 1, 31))
+        PersonFactory(first_name="Middle", birthday=date(1985, 2, 14))
+        PersonFactory(first_name="End", birthday=date(1985, 3, 1))
+        PersonFactory(first_name="Outside", birthday=date(1985, 3, 5))
+
+        assert self._names(date(2023, 1, 30)) == {"Start", "Middle", "End"}
+
+    def test_window_wrapping_new_year(self):
+        """Test that a window crossing December 31st matches both ends."""
+        PersonFactory(first_name="December", birthday=date(1970, 12, 25))
+        PersonFactory(first_name="January", birthday=date(1970, 1, 10))
+        PersonFactory(first_name="February", birthday=date(1970, 2, 10))
+
+        assert self._names(date(2024, 12, 20)) == {"December", "January"}
+
+    def test_excludes_persons_without_birthday(self):
+        """Test that persons without a birthday are never matched."""
+        PersonFactory(first_name="Unknown", birthday=None)
+
+        assert self._names(date(2024, 6, 1), days_ahead=365) == set()
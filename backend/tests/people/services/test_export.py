@@ -37,6 +37,7 @@ from apps.people.services.export import (
     export_relationships,
     export_relationships_csv,
     export_tags,
+    stream_entity_csv,
 )
 from tests.factories import (
     AnecdoteFactory,
@@ -1090,3 +1091,37 @@ class TestExportEntityCsv:
 
         assert len(rows) >= 1  # At least header
         assert len(rows[0]) > 0  # Header has columns
+
+
+# =============================================================================
+# stream_entity_csv Tests
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestStreamEntityCsv:
+    """Tests for stream_entity_csv function."""
+
+    def test_matches_string_export(self):
+        """Test that the streamed lines join to the same CSV as the string export."""
+        PersonFactory.create_batch(3)
+        RelationshipFactory()
+        AnecdoteFactory()
+
+        for entity_type in ("persons", "relationships", "anecdotes"):
+            streamed = "".join(stream_entity_csv(entity_type))
+            assert streamed == export_entity_csv(entity_type)
+
+    def test_yields_one_line_per_row(self):
+        """Test that each yielded chunk is a single CSV record."""
+        PersonFactory.create_batch(2)
+
+        lines = list(stream_entity_csv("persons"))
+
+        assert len(lines) == 3  # Header + 2 persons
+        assert lines[0].startswith("id,first_name,last_name")
+
+    def test_unsupported_entity_raises_eagerly(self):
+        """Test that an unsupported entity fails before any line is consumed."""
+        with pytest.raises(ValueError, match="CSV export not supported"):
+            stream_entity_csv("photos")
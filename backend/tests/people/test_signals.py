@@ -4,12 +4,14 @@ Tests for relationship signals.
 
 import pytest
 
+from apps.people.cache import get_owner, get_tag_names
 from apps.people.models import Relationship, RelationshipType
 from tests.factories import (
     PersonFactory,
     RelationshipFactory,
     RelationshipTypeFactory,
     SymmetricRelationshipTypeFactory,
+    TagFactory,
 )
 
 
@@ -340,3 +342,67 @@ class TestAutoDeleteInverseRelationship:
 
         # All relationships should be deleted
         assert Relationship.objects.filter(relationship_type=rt).count() == 0
+
+
+# =============================================================================
+# Owner Cache Tests
+# =============================================================================
+
+
+@pytest.mark.django_db
+class TestOwnerCache:
+    """Tests for the cached owner lookup and its signal-based invalidation."""
+
+    def test_returns_none_without_owner(self):
+        """Test that get_owner returns None when no owner exists."""
+        assert get_owner() is None
+
+    def test_owner_is_cached(self, django_assert_num_queries):
+        """Test that repeated lookups are served from the cache."""
+        owner = PersonFactory(is_owner=True)
+
+        assert get_owner() == owner
+        with django_assert_num_queries(0):
+            assert get_owner() == owner
+
+    def test_cache_refreshed_when_owner_changes(self):
+        """Test that saving a person drops the cached owner."""
+        owner = PersonFactory(is_owner=True, first_name="Before")
+        assert get_owner().first_name == "Before"
+
+        owner.first_name = "After"
+        owner.save()
+
+        assert get_owner().first_name == "After"
+
+    def test_cache_refreshed_when_owner_created(self):
+        """Test that a cached "no owner" result is dropped once an owner exists."""
+        assert get_owner() is None
+
+        owner = PersonFactory(is_owner=True)
+
+        assert get_owner() == owner
+
+
+@pytest.mark.django_db
+class TestTagNamesCache:
+    """Tests for the cached tag names and their signal-based invalidation."""
+
+    def test_tag_names_are_cached(self, django_assert_num_queries):
+        """Test that repeated lookups are served from the cache."""
+        TagFactory(name="family")
+
+        assert get_tag_names() == ["family"]
+        with django_assert_num_queries(0):
+            assert get_tag_names() == ["family"]
+
+    def test_cache_refreshed_when_tags_change(self):
+        """Test that creating and deleting tags drops the cached names."""
+        tag = TagFactory(name="family")
+        assert get_tag_names() == ["family"]
+
+        TagFactory(name="work")
+        assert sorted(get_tag_names()) == ["family", "work"]
+
+        tag.delete()
+        assert get_tag_names() == ["work"]
@@ -7,7 +7,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from apps.core.encryption import decrypt_value
 from apps.people.tasks import (
+    ai_chat_task,
+    ai_parse_contacts_task,
     batch_suggest_tags,
     check_upcoming_birthdays,
     cleanup_old_audit_logs,
@@ -532,3 +535,58 @@ class TestBatchSuggestTags:
             # Verify tag was applied to our test person (stored lowercase)
             person.refresh_from_db()
             assert person.tags.filter(name="developer").exists()
+
+
+# =============================================================================
+# Background AI Job Tests
+# =============================================================================
+
+
+class TestAIJobTasks:
+    """Tests for the background AI job tasks."""
+
+    def test_parse_contacts_task_success(self):
+        """Test that the parse result is wrapped in a success payload."""
+        with patch("apps.people.services.parse_contacts_text") as mock_parse:
+            mock_parse.return_value = {"persons": [{"first_name": "John"}]}
+
+            result = decrypt_value(ai_parse_contacts_task("John is my brother").encode())
+
+            assert result == {
+                "status": "success",
+                "result": {"persons": [{"first_name": "John"}]},
+            }
+
+    def test_parse_contacts_task_value_error(self):
+        """Test that configuration errors are reported, not raised."""
+        with patch("apps.people.services.parse_contacts_text") as mock_parse:
+            mock_parse.side_effect = ValueError("OPENAI_API_KEY is not configured")
+
+            result = decrypt_value(ai_parse_contacts_task("John is my brother").encode())
+
+            assert result["status"] == "error"
+            assert "OPENAI_API_KEY" in result["message"]
+
+    @pytest.mark.django_db
+    def test_chat_task_returns_answer(self):
+        """Test that the chat task builds the context and returns the answer."""
+        PersonFactory(first_name="Alice")
+
+        with patch("apps.people.services.chat_with_context") as mock_chat:
+            mock_chat.return_value = "Alice's birthday is tomorrow."
+
+            result = decrypt_value(ai_chat_task("Whose birthday is soon?", "2024-01-01").encode())
+
+            assert result["status"] == "success"
+            assert result["result"]["answer"] == "Alice's birthday is tomorrow."
+            assert "Alice" in mock_chat.call_args.kwargs["contacts_context"]
+
+    def test_task_result_is_encrypted(self):
+        """Test that the value stored in the result backend does not hold the payload."""
+        with patch("apps.people.services.parse_contacts_text") as mock_parse:
+            mock_parse.return_value = {"persons": [{"first_name": "John"}]}
+
+            token = ai_parse_contacts_task("John is my brother")
+
+            assert isinstance(token, str)
+            assert "John" not in token